@@ -5,9 +5,12 @@ from apps.addresses.repository import AddressRepository
 from apps.addresses.schema import AddressCreateSchema, AddressSchema
 from apps.addresses.serializers import from_address_entity_to_schema
 from apps.addresses.service import AddressService
+from apps.addresses.validations.worker import build_validation_worker
+from apps.shared.pagination import PageQuerySchema, PageRequest, PageSchema
+from django.conf import settings
 from apps.users.repository import UserRepository
 from apps.users.service import UserService
-from ninja import Router
+from ninja import Query, Router
 from utils.error_schema import ErrorSchema
 from utils.logger import configure_logger
 
@@ -17,7 +20,9 @@ address_repository = AddressRepository()
 user_repository = UserRepository()
 user_service = UserService(user_repository, logger)
 
-service = AddressService(address_repository, logger, user_service)
+service = AddressService(
+    address_repository, logger, user_service, build_validation_worker(address_repository, logger)
+)
 
 
 @address_router.post(
@@ -61,14 +66,21 @@ def get_address(request, address_id: str):
 @address_router.get(
     "/user/{user_id}",
     response={
-        HTTPStatus.OK: list[AddressSchema],
+        HTTPStatus.OK: PageSchema[AddressSchema],
         HTTPStatus.NOT_FOUND: ErrorSchema,
         HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
     },
 )
-def list_addresses_for(request, user_id: UUID):
-    addresses = service.list_addresses_for(user_id)
-    return [from_address_entity_to_schema(address) for address in addresses]
+def list_addresses_for(request, user_id: UUID, page: PageQuerySchema = Query(...)):
+    if settings.READ_PROJECTIONS_ENABLED:
+        rows = service.list_addresses_for_projection(user_id, PageRequest(page.cursor, page.limit))
+        return {"items": rows.items, "next_cursor": rows.next_cursor}
+
+    addresses = service.list_addresses_for(user_id, PageRequest(page.cursor, page.limit))
+    return PageSchema[AddressSchema](
+        items=[from_address_entity_to_schema(address) for address in addresses.items],
+        next_cursor=addresses.next_cursor,
+    )
 
 
 @address_router.delete(
@@ -11,9 +11,25 @@ from apps.shared.value_objects import (
 )
 
 from uuid import UUID, uuid4
+from apps.addresses.enums import AddressValidationStatus
 
 
 class Address:
+    __slots__ = (
+        "_user_id",
+        "_street",
+        "_street_number",
+        "_complement",
+        "_district",
+        "_city",
+        "_state_code",
+        "_postal_code",
+        "_country",
+        "_is_default",
+        "_id",
+        "_validation_status",
+    )
+
     def __init__(
         self,
         user_id: UUID,
@@ -26,7 +42,8 @@ class Address:
         postal_code: PostalCode,
         country: Country,
         is_default: bool,
-        id: Optional[UUID] = None
+        id: Optional[UUID] = None,
+        validation_status: AddressValidationStatus = AddressValidationStatus.VALID,
     ):
         self._user_id = user_id
         self._street = street
@@ -39,6 +56,7 @@ class Address:
         self._country = country
         self._is_default = is_default
         self._id = id or uuid4()
+        self._validation_status = AddressValidationStatus(validation_status)
 
     @property
     def id(self) -> UUID:
@@ -83,5 +101,9 @@ class Address:
     @property
     def is_default(self) -> bool:
         return self._is_default
+
+    @property
+    def validation_status(self) -> AddressValidationStatus:
+        return self._validation_status
     
         
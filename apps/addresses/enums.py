@@ -0,0 +1,6 @@
+from enum import Enum
+
+class AddressValidationStatus(str, Enum):
+    PENDING = "pending"
+    VALID = "valid"
+    INVALID = "invalid"
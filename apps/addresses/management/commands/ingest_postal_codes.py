@@ -0,0 +1,34 @@
+import csv
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.addresses.validations.dataset import COLUMNS, PostalCodeDataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Ingests a CEP/ZIP CSV dataset (columns: country, postal_code, state, city, district, street) "
+        "into the local postal-code index used by address validation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", help="Path to the CSV dataset")
+        parser.add_argument("--output", default=None, help="Index file (defaults to POSTAL_CODE_DATASET_PATH)")
+        parser.add_argument("--delimiter", default=",")
+
+    def handle(self, *args, **options):
+        output = options["output"] or settings.POSTAL_CODE_DATASET_PATH
+        if not output:
+            raise CommandError("No output path given and POSTAL_CODE_DATASET_PATH is not set")
+
+        try:
+            with open(options["dataset"], newline="", encoding="utf-8") as dataset_file:
+                reader = csv.DictReader(dataset_file, delimiter=options["delimiter"])
+                if missing := [column for column in ("country", "postal_code", "state", "city") if column not in (reader.fieldnames or [])]:
+                    raise CommandError(f"Dataset is missing columns: {', '.join(missing)}. Expected: {', '.join(COLUMNS)}")
+                count = PostalCodeDataset.build(reader, output)
+        except OSError as exc:
+            raise CommandError(f"Can't read dataset: {exc}") from exc
+
+        self.stdout.write(self.style.SUCCESS(f"{count} postal codes written to {output}. Restart workers to pick up the new index."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.addresses.repository import AddressRepository
+from apps.addresses.validations.worker import AddressValidationWorker
+from utils.logger import configure_logger
+
+
+class Command(BaseCommand):
+    help = "Validates every address still pending postal-code validation (e.g. left behind by a restart)."
+
+    def handle(self, *args, **options):
+        repository = AddressRepository()
+        worker = AddressValidationWorker(repository, configure_logger(__name__), max_workers=1)
+        pending_addresses = repository.list_pending_validation()
+        statuses = [worker.validate(address) for address in pending_addresses]
+        validated = sum(status is not None for status in statuses)
+        self.stdout.write(self.style.SUCCESS(f"{validated} of {len(pending_addresses)} pending addresses validated"))
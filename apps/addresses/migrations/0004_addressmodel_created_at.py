@@ -0,0 +1,20 @@
+# Generated by Django 4.2.14 on 2026-10-18 09:29
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("addresses", "0003_alter_addressmodel_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="addressmodel",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
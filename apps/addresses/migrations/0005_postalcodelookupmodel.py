@@ -0,0 +1,37 @@
+# Generated by Django 4.2.14 on 2026-10-18 09:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("addresses", "0004_addressmodel_created_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostalCodeLookupModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("country", models.CharField(max_length=2)),
+                ("postal_code", models.CharField(max_length=10)),
+                ("payload", models.JSONField()),
+                ("fetched_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "postal_code_lookups",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="postalcodelookupmodel",
+            constraint=models.UniqueConstraint(
+                fields=("country", "postal_code"), name="unique_postal_code_lookup"
+            ),
+        ),
+    ]
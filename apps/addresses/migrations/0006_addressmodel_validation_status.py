@@ -0,0 +1,22 @@
+# Generated by Django 4.2.14 on 2026-10-18 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("addresses", "0005_postalcodelookupmodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="addressmodel",
+            name="validation_status",
+            field=models.CharField(
+                choices=[("pending", "PENDING"), ("valid", "VALID"), ("invalid", "INVALID")],
+                default="valid",
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations, models
+
+
+def keep_oldest_default_address(apps, schema_editor):
+    AddressModel = apps.get_model("addresses", "AddressModel")
+    seen_users = set()
+    defaults = AddressModel.objects.filter(is_default=True).order_by("user_id", "created_at", "id")
+    for address_id, user_id in defaults.values_list("id", "user_id"):
+        if user_id in seen_users:
+            AddressModel.objects.filter(id=address_id).update(is_default=False)
+        seen_users.add(user_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("addresses", "0006_addressmodel_validation_status"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="addressmodel",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="addresses_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="addressmodel",
+            index=models.Index(
+                condition=models.Q(("validation_status", "pending")),
+                fields=["created_at"],
+                name="addresses_pending_idx",
+            ),
+        ),
+        migrations.RunPython(keep_oldest_default_address, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="addressmodel",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_default", True)),
+                fields=("user",),
+                name="unique_default_address_per_user",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_usermodel_users_created_idx"),
+        ("addresses", "0007_address_indexes_and_default_constraint"),
+    ]
+
+    # Dropping the FK index also drops other single-column indexes on user_id, including the
+    # partial unique index behind unique_default_address_per_user, so the constraint is re-added.
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="addressmodel",
+            name="unique_default_address_per_user",
+        ),
+        migrations.AlterField(
+            model_name="addressmodel",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="addresses",
+                to="users.usermodel",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="addressmodel",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_default", True)),
+                fields=("user",),
+                name="unique_default_address_per_user",
+            ),
+        ),
+    ]
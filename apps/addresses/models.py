@@ -1,9 +1,13 @@
 from uuid import uuid4
 from django.db import models
+from apps.addresses.enums import AddressValidationStatus
 
 class AddressModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
-    user = models.ForeignKey("users.UserModel", on_delete=models.CASCADE, related_name="addresses")
+    # Lookups by user use addresses_user_created_idx, so the FK's own index would be redundant.
+    user = models.ForeignKey(
+        "users.UserModel", on_delete=models.CASCADE, related_name="addresses", db_index=False
+    )
     street = models.CharField(max_length=150)
     street_number = models.CharField(max_length=20)
     complement = models.CharField(max_length=20)
@@ -13,6 +17,37 @@ class AddressModel(models.Model):
     postal_code = models.CharField(max_length=10)
     country = models.CharField(max_length=2)
     is_default = models.BooleanField(default=False)
+    validation_status = models.CharField(
+        max_length=10,
+        choices=[(status.value, status.name) for status in AddressValidationStatus],
+        default=AddressValidationStatus.VALID.value,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        db_table="addresses"
\ No newline at end of file
+        db_table="addresses"
+        indexes = [
+            models.Index(fields=["user", "created_at", "id"], name="addresses_user_created_idx"),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(validation_status=AddressValidationStatus.PENDING.value),
+                name="addresses_pending_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"], condition=models.Q(is_default=True), name="unique_default_address_per_user"
+            )
+        ]
+
+class PostalCodeLookupModel(models.Model):
+    country = models.CharField(max_length=2)
+    postal_code = models.CharField(max_length=10)
+    payload = models.JSONField()
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "postal_code_lookups"
+        constraints = [
+            models.UniqueConstraint(fields=["country", "postal_code"], name="unique_postal_code_lookup")
+        ]
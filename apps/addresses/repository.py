@@ -1,25 +1,58 @@
 from apps.addresses.repository_interface import AddressRepositoryInterface
 from apps.addresses.models import AddressModel
 from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
 from apps.addresses.serializers import from_address_model_to_entity
 from apps.users.models import UserModel
+from apps.shared.pagination import Page, PageRequest, paginate_queryset
+from apps.shared.database import read_only_method
+from apps.shared.exceptions import ConflictError
+from django.db import IntegrityError, transaction
 import pytest
 
 
+# AddressSchema columns plus created_at, which the pagination cursor needs.
+ADDRESS_PROJECTION = (
+    "id",
+    "user_id",
+    "street",
+    "street_number",
+    "complement",
+    "district",
+    "city",
+    "state_code",
+    "postal_code",
+    "country",
+    "is_default",
+    "validation_status",
+    "created_at",
+)
+
 class AddressRepository(AddressRepositoryInterface):
     def save(self, address: Address) -> Address:
-        address_model = AddressModel.objects.create(
-            user=UserModel.objects.get(id=address.user_id),
-            street=address.street.value,
-            street_number=address.street_number.value,
-            complement=address.complement.value,
-            district=address.district.value,
-            city=address.city.value,
-            state_code=address.state_code.value,
-            postal_code=address.postal_code.value,
-            country=address.country.value,
-            is_default=address.is_default
-        )
+        user_model = UserModel.objects.get(id=address.user_id)
+        try:
+            # Savepoint so a constraint violation doesn't break an outer transaction.
+            with transaction.atomic():
+                address_model = AddressModel.objects.create(
+                    user=user_model,
+                    street=address.street.value,
+                    street_number=address.street_number.value,
+                    complement=address.complement.value,
+                    district=address.district.value,
+                    city=address.city.value,
+                    state_code=address.state_code.value,
+                    postal_code=address.postal_code.value,
+                    country=address.country.value,
+                    is_default=address.is_default,
+                    validation_status=address.validation_status.value,
+                )
+        except IntegrityError as exc:
+            # Error texts differ between databases, so the unique_default_address_per_user
+            # violation is recognised by checking for the default address it collided with.
+            if address.is_default and self.has_default_address_for(address.user_id):
+                raise ConflictError("There can only be one default address per user") from exc
+            raise
 
         return from_address_model_to_entity(address_model)
 
@@ -28,19 +61,46 @@ class AddressRepository(AddressRepositoryInterface):
     def has_default_address_for(self, user_id) -> bool:
         return AddressModel.objects.filter(user__id=user_id, is_default=True).exists()
     
+    @read_only_method
     def get_address_by_id(self, address_id):
         address_model = AddressModel.objects.filter(id=address_id).first()
         if not address_model:
             return None
         return from_address_model_to_entity(address_model)
     
-    def list_addresses_for(self, user_id):
-        addresses = AddressModel.objects.filter(user__id=user_id)
+    @read_only_method
+    def get_addresses_by_ids(self, address_ids):
+        addresses = AddressModel.objects.filter(id__in=set(address_ids))
         return [
             from_address_model_to_entity(address_model)
             for address_model in addresses
         ]
     
+    @read_only_method
+    def list_addresses_for(self, user_id, page_request: PageRequest = None) -> Page[Address]:
+        addresses_data, next_cursor = paginate_queryset(AddressModel.objects.filter(user__id=user_id), page_request)
+        addresses = [
+            from_address_model_to_entity(address_model)
+            for address_model in addresses_data
+        ]
+        return Page(addresses, next_cursor)
+
+    @read_only_method
+    def list_addresses_for_projection(self, user_id, page_request: PageRequest = None) -> Page[dict]:
+        rows, next_cursor = paginate_queryset(
+            AddressModel.objects.filter(user__id=user_id).values(*ADDRESS_PROJECTION), page_request
+        )
+        return Page(rows, next_cursor)
+    
+    def update_validation_status(self, address_id, validation_status: AddressValidationStatus) -> None:
+        AddressModel.objects.filter(id=address_id).update(validation_status=validation_status.value)
+
+    def list_pending_validation(self) -> list[Address]:
+        return [
+            from_address_model_to_entity(address_model)
+            for address_model in AddressModel.objects.filter(validation_status=AddressValidationStatus.PENDING.value)
+        ]
+    
     def delete_address(self, address_id):
         address_model = AddressModel.objects.filter(id=address_id).first()
         if not address_model:
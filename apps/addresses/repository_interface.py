@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
+from apps.shared.pagination import Page, PageRequest
 
 class AddressRepositoryInterface(ABC):
     @abstractmethod
@@ -17,7 +19,23 @@ class AddressRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_addresses_for(self, user_id: UUID) -> list[Address]:
+    def get_addresses_by_ids(self, address_ids: list[UUID]) -> list[Address]:
+        pass
+
+    @abstractmethod
+    def list_addresses_for(self, user_id: UUID, page_request: PageRequest = None) -> Page[Address]:
+        pass
+
+    @abstractmethod
+    def list_addresses_for_projection(self, user_id: UUID, page_request: PageRequest = None) -> Page[dict]:
+        pass
+
+    @abstractmethod
+    def update_validation_status(self, address_id: UUID, validation_status: AddressValidationStatus) -> None:
+        pass
+
+    @abstractmethod
+    def list_pending_validation(self) -> list[Address]:
         pass
 
     @abstractmethod
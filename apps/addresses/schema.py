@@ -13,6 +13,7 @@ class AddressSchema(BaseModel):
     postal_code: str
     country: str
     is_default: bool
+    validation_status: str
 
 
 class AddressCreateSchema(BaseModel):
@@ -15,17 +15,18 @@ from apps.addresses.schema import AddressSchema
 
 def from_address_model_to_entity(address_model: AddressModel) -> Address:
     return Address(
-        address_model.user.id,
-        Street(address_model.street),
-        StreetNumber(address_model.street_number),
-        Complement(address_model.complement),
-        District(address_model.district),
-        City(address_model.city),
-        StateCode(address_model.state_code),
-        PostalCode(address_model.postal_code),
-        Country(address_model.country),
+        address_model.user_id,
+        Street.from_persistence(address_model.street),
+        StreetNumber.from_persistence(address_model.street_number),
+        Complement.from_persistence(address_model.complement),
+        District.from_persistence(address_model.district),
+        City.from_persistence(address_model.city),
+        StateCode.from_persistence(address_model.state_code),
+        PostalCode.from_persistence(address_model.postal_code),
+        Country.from_persistence(address_model.country),
         address_model.is_default,
         address_model.id,
+        address_model.validation_status,
     )
 
 def from_address_entity_to_schema(address: Address) -> AddressSchema:
@@ -41,5 +42,6 @@ def from_address_entity_to_schema(address: Address) -> AddressSchema:
         postal_code=address.postal_code.value,
         country=address.country.value,
         is_default=address.is_default,
+        validation_status=address.validation_status.value,
     )
 
@@ -18,6 +18,9 @@ from apps.users.service import UserService
 from utils.logger import configure_logger
 from apps.addresses.validations.validators import validate_postal_code
 from apps.shared.exceptions import UnprocessableEntityError, NotFoundError, ConflictError
+from apps.shared.pagination import Page, PageRequest
+from apps.addresses.enums import AddressValidationStatus
+from apps.addresses.validations.worker import AddressValidationWorker
 
 logger = configure_logger(__name__)
 
@@ -28,10 +31,12 @@ class AddressService:
         repository: AddressRepositoryInterface,
         logger: Logger,
         user_service: UserService = None,
+        validation_worker: AddressValidationWorker = None,
     ):
         self.repository = repository
         self.logger = logger
         self.user_service = user_service or UserService(UserRepository(), logger)
+        self.validation_worker = validation_worker
 
     def create_address(
         self,
@@ -55,20 +60,22 @@ class AddressService:
         postal_code = PostalCode(postal_code_str)
         country = Country(country_str)
 
-        is_valid_address_data = validate_postal_code(
-            street.value,
-            street_number.value,
-            complement.value,
-            district.value,
-            city.value,
-            state_code.value,
-            postal_code.value,
-            country.value,
-        )
+        # In deferred mode the address is saved as pending and the worker validates it after commit.
+        if not self.validation_worker:
+            is_valid_address_data = validate_postal_code(
+                street.value,
+                street_number.value,
+                complement.value,
+                district.value,
+                city.value,
+                state_code.value,
+                postal_code.value,
+                country.value,
+            )
 
-        if not is_valid_address_data:
-            self.logger.warning("Unprocessable address. The address data does not match the postal code.")
-            raise UnprocessableEntityError("Unprocessable address. The address data does not match the postal code.")
+            if not is_valid_address_data:
+                self.logger.warning("Unprocessable address. The address data does not match the postal code.")
+                raise UnprocessableEntityError("Unprocessable address. The address data does not match the postal code.")
         
         try:
             user = self.user_service.get_user_by_id(user_id)
@@ -76,10 +83,6 @@ class AddressService:
             self.logger.warning("Each address must have a user associated.")
             raise ConflictError("Each address must have a user associated.")
 
-        if is_default and self.repository.has_default_address_for(user_id):
-            self.logger.warning("There can only be one default address per user")
-            raise ConflictError("There can only be one default address per user")
-
         address = Address(
             user_id=user.id,
             street=street,
@@ -91,9 +94,17 @@ class AddressService:
             postal_code=postal_code,
             country=country,
             is_default=is_default,
+            validation_status=AddressValidationStatus.PENDING if self.validation_worker else AddressValidationStatus.VALID,
         )
 
-        saved_address = self.repository.save(address)
+        # One default address per user is enforced by the unique_default_address_per_user constraint.
+        try:
+            saved_address = self.repository.save(address)
+        except ConflictError as exc:
+            self.logger.warning(str(exc))
+            raise
+        if self.validation_worker:
+            self.validation_worker.submit(saved_address)
         self.logger.info(f"Address created successfully: {saved_address}")
         return saved_address
     
@@ -104,15 +115,30 @@ class AddressService:
         self.logger.info("Address retrieved successfully")
         return address
     
-    def list_addresses_for(self, user_id: UUID) -> list[Address]:
+    def get_addresses_by_ids(self, address_ids: list[UUID]) -> list[Address]:
+        addresses = self.repository.get_addresses_by_ids(address_ids)
+        found_ids = {address.id for address in addresses}
+        if missing_ids := [str(address_id) for address_id in address_ids if address_id not in found_ids]:
+            self.logger.warning(f"Address not found. Can't find addresses with ids {', '.join(missing_ids)}")
+            raise NotFoundError(f"Address not found. Can't find addresses with ids {', '.join(missing_ids)}")
+        return addresses
+    
+    def _get_addresses_owner(self, user_id: UUID):
         try:
-            user = self.user_service.get_user_by_id(user_id)
+            return self.user_service.get_user_by_id(user_id)
         except NotFoundError:
             self.logger.warning("No address associated for this user.")
             raise NotFoundError("No address associated for this user.")
 
+    def list_addresses_for(self, user_id: UUID, page_request: PageRequest = None) -> Page[Address]:
+        user = self._get_addresses_owner(user_id)
+        self.logger.info("Address list retrieved successfully")
+        return self.repository.list_addresses_for(user.id, page_request)
+
+    def list_addresses_for_projection(self, user_id: UUID, page_request: PageRequest = None) -> Page[dict]:
+        user = self._get_addresses_owner(user_id)
         self.logger.info("Address list retrieved successfully")
-        return self.repository.list_addresses_for(user.id)
+        return self.repository.list_addresses_for_projection(user.id, page_request)
     
     def delete_address(self, address_id: UUID):
         address = self.repository.get_address_by_id(address_id)
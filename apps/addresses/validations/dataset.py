@@ -0,0 +1,77 @@
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+COLUMNS = ("country", "postal_code", "state", "city", "district", "street")
+
+
+def normalize_postal_code(postal_code: str) -> str:
+    return postal_code.replace("-", "").replace(" ", "").upper()
+
+
+class PostalCodeDataset:
+    """Read-only postal-code index stored as a SQLite file (clustered on country + postal code).
+
+    Each thread keeps its own read-only connection; lookups are a single primary-key probe.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._local = threading.local()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        if not (connection := getattr(self._local, "connection", None)):
+            connection = sqlite3.connect(f"file:{self._path}?mode=ro", uri=True, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
+        return connection
+
+    def lookup(self, country: str, postal_code: str) -> Optional[dict]:
+        row = self._connection().execute(
+            "SELECT state, city, district, street FROM postal_codes WHERE country = ? AND postal_code = ?",
+            (country.upper(), normalize_postal_code(postal_code)),
+        ).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def build(rows: Iterable[dict], path: str) -> int:
+        """Writes `rows` to a new index at `path`, replacing any previous file atomically."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.execute(
+                "CREATE TABLE postal_codes ("
+                "country TEXT NOT NULL, postal_code TEXT NOT NULL, state TEXT NOT NULL, city TEXT NOT NULL, "
+                "district TEXT NOT NULL, street TEXT NOT NULL, PRIMARY KEY (country, postal_code)"
+                ") WITHOUT ROWID"
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO postal_codes VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        row["country"].strip().upper(),
+                        normalize_postal_code(row["postal_code"]),
+                        row["state"].strip().upper(),
+                        row["city"].strip(),
+                        (row.get("district") or "").strip(),
+                        (row.get("street") or "").strip(),
+                    )
+                    for row in rows
+                ),
+            )
+            connection.commit()
+            count = connection.execute("SELECT COUNT(*) FROM postal_codes").fetchone()[0]
+        finally:
+            connection.close()
+
+        os.replace(tmp_path, path)
+        return count
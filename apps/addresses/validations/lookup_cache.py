@@ -0,0 +1,53 @@
+from datetime import timedelta
+from typing import Optional
+
+from django.utils import timezone
+
+from apps.addresses.models import PostalCodeLookupModel
+from apps.shared.cache import LocalMemoryCache
+
+
+class PostalCodeLookupCache:
+    """Postal-code API payloads keyed by country + postal code.
+
+    An in-process LRU sits in front of an optional `postal_code_lookups` table, so lookups
+    survive restarts and are shared between workers.
+    """
+
+    def __init__(self, memory: LocalMemoryCache, ttl: float, persistent: bool = False):
+        self._memory = memory
+        self._ttl = ttl
+        self._persistent = persistent
+
+    @staticmethod
+    def _key(country: str, postal_code: str) -> str:
+        return f"{country}:{postal_code}"
+
+    def get(self, country: str, postal_code: str) -> Optional[dict]:
+        key = self._key(country, postal_code)
+        if (payload := self._memory.get(key)) is not None:
+            return payload
+        if not self._persistent:
+            return None
+
+        lookup = PostalCodeLookupModel.objects.filter(
+            country=country,
+            postal_code=postal_code,
+            fetched_at__gte=timezone.now() - timedelta(seconds=self._ttl),
+        ).first()
+        if not lookup:
+            return None
+        self._memory.set(key, lookup.payload)
+        return lookup.payload
+
+    def set(self, country: str, postal_code: str, payload: dict):
+        self._memory.set(self._key(country, postal_code), payload)
+        if self._persistent:
+            PostalCodeLookupModel.objects.update_or_create(
+                country=country,
+                postal_code=postal_code,
+                defaults={"payload": payload, "fetched_at": timezone.now()},
+            )
+
+    def clear(self):
+        self._memory.clear()
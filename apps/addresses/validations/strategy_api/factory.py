@@ -1,10 +1,29 @@
+import os
+
+from django.conf import settings
+
+from apps.addresses.validations.dataset import PostalCodeDataset
 from apps.addresses.validations.strategy_api.validator_br import BrazilValidationStrategy
+from apps.addresses.validations.strategy_api.validator_dataset import DatasetValidationStrategy
 from apps.addresses.validations.strategy_api.validator_us import UsValidationStrategy
 
+
+_datasets: dict[str, PostalCodeDataset] = {}
+
+
+def get_postal_code_dataset(path: str):
+    if not path or not os.path.exists(path):
+        return None
+    if path not in _datasets:
+        _datasets[path] = PostalCodeDataset(path)
+    return _datasets[path]
+
+
 def get_api_country_strategy(country_code: str):
     strategy = {
         "BR": BrazilValidationStrategy(),
         "US": UsValidationStrategy()
     }
-    return strategy.get(country_code)
-
+    if (validator := strategy.get(country_code)) and (dataset := get_postal_code_dataset(settings.POSTAL_CODE_DATASET_PATH)):
+        return DatasetValidationStrategy(dataset, validator)
+    return validator
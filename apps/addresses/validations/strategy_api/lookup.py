@@ -0,0 +1,90 @@
+from typing import Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from apps.addresses.validations.circuit_breaker import CircuitBreaker
+from apps.addresses.validations.lookup_cache import PostalCodeLookupCache
+from apps.shared.cache import LocalMemoryCache
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+class PostalCodeUnavailableError(Exception):
+    """The postal code API could not be reached, so nothing was checked."""
+
+
+def build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class PostalCodeLookup:
+    def __init__(
+        self,
+        country: str,
+        session: requests.Session,
+        cache: PostalCodeLookupCache,
+        breaker: CircuitBreaker,
+        timeout: float,
+    ):
+        self.country = country
+        self.session = session
+        self.cache = cache
+        self.breaker = breaker
+        self.timeout = timeout
+
+    def fetch(self, postal_code: str, url: str) -> Optional[dict]:
+        """Returns the API payload, {} when the postal code does not exist, or None when the API is unavailable."""
+        if (payload := self.cache.get(self.country, postal_code)) is not None:
+            return payload
+
+        if not self.breaker.allow_request():
+            logger.warning(f"Postal code API for {self.country} is unavailable (circuit open). Skipping lookup")
+            return None
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code >= 500 or response.status_code == 429:
+                raise requests.HTTPError(f"status {response.status_code}")
+            payload = response.json() if response.status_code == 200 else {}
+        except (requests.RequestException, ValueError) as exc:
+            self.breaker.record_failure()
+            logger.warning(f"Postal code lookup failed for {self.country} {postal_code}: {exc}")
+            return None
+
+        self.breaker.record_success()
+        self.cache.set(self.country, postal_code, payload)
+        return payload
+
+
+session = build_session(settings.POSTAL_CODE_HTTP_POOL_SIZE)
+
+postal_code_cache = PostalCodeLookupCache(
+    LocalMemoryCache(max_size=settings.POSTAL_CODE_CACHE_MAX_SIZE, ttl=settings.POSTAL_CODE_CACHE_TTL),
+    ttl=settings.POSTAL_CODE_CACHE_TTL,
+    persistent=settings.POSTAL_CODE_CACHE_PERSISTENT,
+)
+
+lookups = {
+    country: PostalCodeLookup(
+        country,
+        session,
+        postal_code_cache,
+        CircuitBreaker(
+            settings.POSTAL_CODE_BREAKER_FAILURE_THRESHOLD,
+            settings.POSTAL_CODE_BREAKER_RESET_TIMEOUT,
+        ),
+        settings.POSTAL_CODE_HTTP_TIMEOUT,
+    )
+    for country in ("BR", "US")
+}
+
+
+def get_postal_code_lookup(country: str) -> PostalCodeLookup:
+    return lookups[country]
@@ -1,5 +1,6 @@
 from apps.addresses.validations.strategy_api.interface import PostalCodeValidatorInterface
-import requests
+from apps.addresses.validations.strategy_api.lookup import PostalCodeUnavailableError, get_postal_code_lookup
+from django.conf import settings
 
 class BrazilValidationStrategy(PostalCodeValidatorInterface):
     country_validator = "BR"
@@ -7,7 +8,7 @@ class BrazilValidationStrategy(PostalCodeValidatorInterface):
     def create_url(self, postal_code:str, selected_country:str):
         if selected_country != self.country_validator:
             return False
-        return f"https://brasilapi.com.br/api/cep/v1/{postal_code}"
+        return f"{settings.POSTAL_CODE_BR_API_URL}/{postal_code}"
     
     def validate(
         self,
@@ -20,12 +21,12 @@ class BrazilValidationStrategy(PostalCodeValidatorInterface):
         postal_code,
         country,
     ):
-        data = None
-        url = f"https://brasilapi.com.br/api/cep/v1/{postal_code}"
-        response = requests.get(url)
-        if response.status_code != 200:
+        url = self.create_url(postal_code, self.country_validator)
+        data = get_postal_code_lookup(self.country_validator).fetch(postal_code, url)
+        if data is None:
+            raise PostalCodeUnavailableError(f"Postal code API for {self.country_validator} is unavailable")
+        if not data:
             return False
-        data = response.json()
         return (
             data["cep"] == postal_code
             and data["state"] == state_code
@@ -0,0 +1,43 @@
+from apps.addresses.validations.dataset import PostalCodeDataset
+from apps.addresses.validations.strategy_api.interface import PostalCodeValidatorInterface
+
+
+class DatasetValidationStrategy(PostalCodeValidatorInterface):
+    """Validates against the local postal-code dataset; falls back to the HTTP strategy on misses."""
+
+    def __init__(self, dataset: PostalCodeDataset, fallback: PostalCodeValidatorInterface):
+        self.dataset = dataset
+        self.fallback = fallback
+
+    def create_url(self, postal_code: str, selected_country: str):
+        return self.fallback.create_url(postal_code, selected_country)
+
+    def validate(
+        self,
+        street,
+        street_number,
+        complement,
+        district,
+        city,
+        state_code,
+        postal_code,
+        country,
+    ):
+        if not (data := self.dataset.lookup(country, postal_code)):
+            return self.fallback.validate(
+                street,
+                street_number,
+                complement,
+                district,
+                city,
+                state_code,
+                postal_code,
+                country,
+            )
+        # City-wide postal codes carry no street/district, so only compare what the dataset knows.
+        return (
+            data["state"] == state_code.upper()
+            and data["city"].lower() == city.lower()
+            and (not data["street"] or data["street"].lower() == street.lower())
+            and (not data["district"] or data["district"].lower() == district.lower())
+        )
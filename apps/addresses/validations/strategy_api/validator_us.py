@@ -1,5 +1,6 @@
 from apps.addresses.validations.strategy_api.interface import PostalCodeValidatorInterface
-import requests
+from apps.addresses.validations.strategy_api.lookup import PostalCodeUnavailableError, get_postal_code_lookup
+from django.conf import settings
 
 class UsValidationStrategy(PostalCodeValidatorInterface):
     country_validator = "US"
@@ -7,7 +8,7 @@ class UsValidationStrategy(PostalCodeValidatorInterface):
     def create_url(self, postal_code: str, selected_country: str):
         if selected_country != self.country_validator:
             return False
-        return f"https://api.zippopotam.us/us/{postal_code}"    
+        return f"{settings.POSTAL_CODE_US_API_URL}/{postal_code}"    
     
     def validate(
         self,
@@ -20,12 +21,12 @@ class UsValidationStrategy(PostalCodeValidatorInterface):
         postal_code,
         country,
     ):
-        data = None
-        url = f"https://api.zippopotam.us/us/{postal_code}"
-        response = requests.get(url)
-        if response.status_code != 200:
+        url = self.create_url(postal_code, self.country_validator)
+        data = get_postal_code_lookup(self.country_validator).fetch(postal_code, url)
+        if data is None:
+            raise PostalCodeUnavailableError(f"Postal code API for {self.country_validator} is unavailable")
+        if not data:
             return False
-        data = response.json()
         return (
             data["post code"] == postal_code
             and data["country abbreviation"] == country
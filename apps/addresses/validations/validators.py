@@ -1,5 +1,6 @@
 from apps.addresses.validations.strategy_api.factory import get_api_country_strategy
 from apps.addresses.validations.strategy_api.interface import PostalCodeValidatorInterface
+from apps.addresses.validations.strategy_api.lookup import PostalCodeUnavailableError
 
 
 def validate_postal_code(
@@ -11,18 +12,29 @@ def validate_postal_code(
     state_code: str,
     postal_code: str,
     country: str,
+    fail_open: bool = True,
 ):
+    """Whether the address matches its postal code.
+
+    When the postal code API is unavailable it returns True (fail_open, so address creation is not
+    blocked by an outage) or raises PostalCodeUnavailableError for callers that can retry later.
+    """
     validator: PostalCodeValidatorInterface = get_api_country_strategy(country)
     if not validator:
         print("validator aquisition error")
         return True # do not stop api if country has no strategy
-    return validator.validate(
-        street,
-        street_number,
-        complement,
-        district,
-        city,
-        state_code,
-        postal_code,
-        country,
-    )
\ No newline at end of file
+    try:
+        return validator.validate(
+            street,
+            street_number,
+            complement,
+            district,
+            city,
+            state_code,
+            postal_code,
+            country,
+        )
+    except PostalCodeUnavailableError:
+        if fail_open:
+            return True
+        raise
\ No newline at end of file
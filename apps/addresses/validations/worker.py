@@ -0,0 +1,76 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
+from apps.addresses.repository_interface import AddressRepositoryInterface
+from apps.addresses.validations.strategy_api.lookup import PostalCodeUnavailableError
+from apps.addresses.validations.validators import validate_postal_code
+
+
+class AddressValidationWorker:
+    """Validates addresses saved as pending on a background thread pool.
+
+    Jobs are submitted once the creating transaction commits, so the worker always sees the row.
+    Rows left pending by a restart are picked up again by `manage.py validate_pending_addresses`.
+    """
+
+    def __init__(self, repository: AddressRepositoryInterface, logger: logging.Logger, max_workers: int = 4):
+        self.repository = repository
+        self.logger = logger
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="address-validation")
+        self._futures: set[Future] = set()
+
+    def submit(self, address: Address):
+        transaction.on_commit(lambda: self._track(self._executor.submit(self._run, address)))
+
+    def _track(self, future: Future):
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+    def _run(self, address: Address) -> Optional[AddressValidationStatus]:
+        close_old_connections()
+        try:
+            return self.validate(address)
+        finally:
+            connection.close()
+
+    def validate(self, address: Address) -> Optional[AddressValidationStatus]:
+        try:
+            is_valid_address_data = validate_postal_code(
+                address.street.value,
+                address.street_number.value,
+                address.complement.value,
+                address.district.value,
+                address.city.value,
+                address.state_code.value,
+                address.postal_code.value,
+                address.country.value,
+                fail_open=False,
+            )
+        except PostalCodeUnavailableError:
+            self.logger.warning(f"Postal code API unavailable while validating address {address.id}. It stays pending")
+            return None
+        except Exception:
+            self.logger.exception(f"Address validation failed for address {address.id}. It stays pending")
+            return None
+
+        status = AddressValidationStatus.VALID if is_valid_address_data else AddressValidationStatus.INVALID
+        self.repository.update_validation_status(address.id, status)
+        self.logger.info(f"Address {address.id} marked as {status.value}")
+        return status
+
+    def wait(self):
+        """Blocks until every submitted validation has finished (used by tests and shutdown)."""
+        for future in list(self._futures):
+            future.result()
+
+
+def build_validation_worker(repository: AddressRepositoryInterface, logger: logging.Logger) -> Optional[AddressValidationWorker]:
+    if settings.ADDRESS_VALIDATION_MODE != "deferred":
+        return None
+    return AddressValidationWorker(repository, logger, settings.ADDRESS_VALIDATION_WORKERS)
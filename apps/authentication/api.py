@@ -3,7 +3,7 @@ from ninja import Router
 from apps.authentication.schema import LoginSchemaInput, UserOutputSchema
 from apps.authentication.service import AuthenticationService
 
-from utils.jwt import JWTAuth, decode_jwt_token
+from utils.jwt import JWTAuth
 
 authentication_router = Router(auth=JWTAuth())
 
@@ -19,5 +19,4 @@ def auth_login(request, input_schema: LoginSchemaInput):
 @authentication_router.get("/me", response=UserOutputSchema)
 def auth_me(request):
     """Retorna o usuário autenticado"""
-    token = decode_jwt_token(request.headers.get("Authorization"))
-    return service.get_me(token["user_id"])
+    return service.get_me(request.auth["user_id"])
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.http import HttpRequest
+
+from apps.shared.rate_limit import SlidingWindowRateLimiter
+
+login_ip_limiter = SlidingWindowRateLimiter(
+    "login-ip",
+    settings.LOGIN_RATE_LIMIT_PER_IP,
+    settings.LOGIN_RATE_LIMIT_WINDOW,
+    settings.LOGIN_RATE_LIMIT_CACHE_ALIAS,
+)
+login_email_limiter = SlidingWindowRateLimiter(
+    "login-email",
+    settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+    settings.LOGIN_RATE_LIMIT_WINDOW,
+    settings.LOGIN_RATE_LIMIT_CACHE_ALIAS,
+)
+
+
+def get_client_ip(request: HttpRequest) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR and (forwarded_for := request.META.get("HTTP_X_FORWARDED_FOR")):
+        return forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def is_login_allowed(request: HttpRequest, email: str) -> bool:
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return True
+    # Both limiters count the attempt, so a rejected IP still spends the e-mail's budget.
+    ip_allowed = login_ip_limiter.hit(get_client_ip(request))
+    email_allowed = login_email_limiter.hit(email.strip().lower())
+    return ip_allowed and email_allowed
+
+
+def login_rate_limit_stats() -> dict:
+    return {
+        "ip": login_ip_limiter.stats.as_dict(),
+        "email": login_email_limiter.stats.as_dict(),
+    }
@@ -1,11 +1,13 @@
 import uuid
 from http import HTTPStatus
 
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import get_user_model
 from django.http import JsonResponse
 from ninja.errors import HttpError
 
+from apps.authentication.rate_limit import is_login_allowed
 from apps.authentication.schema import LoginSchemaInput
+from apps.shared.value_objects.password import password_hashing
 # from apps.users.models import CustomUser
 
 from utils.jwt import generate_jwt_token
@@ -14,18 +16,25 @@ CustomUser = get_user_model()
 
 class AuthenticationService:
     def auth_login(self, request, input_schema: LoginSchemaInput) -> JsonResponse:
+        # Checked before any query or hashing, so rejected attempts are cheap.
+        if not is_login_allowed(request, input_schema.email):
+            raise HttpError(
+                HTTPStatus.TOO_MANY_REQUESTS, "Muitas tentativas de login, aguarde e tente novamente"
+            )
+
         if not (user := CustomUser.objects.filter(email=input_schema.email).first()):
             raise HttpError(HTTPStatus.NOT_FOUND, "Usuário não cadastrado no sistema")
 
-        user = authenticate(
-            request, email=input_schema.email, password=input_schema.password
-        )
-
-        if not user:
+        if not (user.is_active and password_hashing.verify(input_schema.password, user.password)):
             raise HttpError(
                 HTTPStatus.UNAUTHORIZED, "Senha incorreta, verifique e tente novamente"
             )
 
+        # Hashes made with an older algorithm or cost are upgraded while the raw password is at hand.
+        if password_hashing.needs_rehash(user.password):
+            user.password = password_hashing.hash(input_schema.password)
+            user.save(update_fields=["password"])
+
         token = generate_jwt_token(user=user)
 
         return JsonResponse(
@@ -2,19 +2,20 @@ from http import HTTPStatus
 from typing import List
 from uuid import UUID
 
-from apps.carts.repository import CartRepository
+from apps.carts.buffered_repository import cart_repository
 from apps.carts.schema import (
     AddToCartSchema,
+    CartExpandSchema,
     CartSchema,
     SubtractCartItemQuantitySchema,
 )
 from apps.carts.serializers import cart_entity_to_schema
 from apps.carts.service import CartService
-from apps.products.repository import ProductRepository
+from apps.products.cached_repository import build_product_repository
 from apps.products.service import ProductService
 from apps.users.repository import UserRepository
 from apps.users.service import UserService
-from ninja import Router
+from ninja import Query, Router
 from utils.error_schema import ErrorSchema
 from utils.logger import configure_logger
 
@@ -25,11 +26,28 @@ logger = configure_logger(__name__)
 user_repository = UserRepository()
 user_service = UserService(user_repository, logger)
 
-product_repository = ProductRepository()
+product_repository = build_product_repository()
 product_service = ProductService(product_repository, logger)
 
-repository = CartRepository()
-service = CartService(repository, product_service, user_service, logger)
+service = CartService(cart_repository, product_service, user_service, logger)
+
+
+def render_cart(cart, params: CartExpandSchema) -> CartSchema:
+    products = service.get_cart_products(cart) if params.expand == "product" else None
+    return cart_entity_to_schema(cart, products)
+
+
+@cart_router.get(
+    "/{user_id}",
+    response={
+        HTTPStatus.OK: CartSchema,
+        HTTPStatus.NOT_FOUND: ErrorSchema,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
+    },
+)
+def get_cart(request, user_id: UUID, params: CartExpandSchema = Query(...)):
+    cart = service.get_cart_by_user(user_id)
+    return render_cart(cart, params)
 
 
 @cart_router.post(
@@ -40,9 +58,9 @@ service = CartService(repository, product_service, user_service, logger)
         HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
     },
 )
-def add_to_cart(request, user_id: UUID, payload: AddToCartSchema):
+def add_to_cart(request, user_id: UUID, payload: AddToCartSchema, params: CartExpandSchema = Query(...)):
     cart = service.add_to_cart(user_id, payload.product_id, payload.quantity)
-    return cart_entity_to_schema(cart)
+    return render_cart(cart, params)
 
 
 @cart_router.post(
@@ -54,17 +72,17 @@ def add_to_cart(request, user_id: UUID, payload: AddToCartSchema):
     },
 )
 def subtract_quantity_from_cart_item(
-    request, user_id: UUID, payload: SubtractCartItemQuantitySchema
+    request, user_id: UUID, payload: SubtractCartItemQuantitySchema, params: CartExpandSchema = Query(...)
 ):
     cart = service.subtract_quantity_from_cart_item(
         user_id, payload.product_id, payload.quantity
     )
-    return cart_entity_to_schema(cart)
+    return render_cart(cart, params)
 
 @cart_router.get("/{user_id}/remove/{product_id}", response = {HTTPStatus.OK: CartSchema})
-def remove_cart_item(request, user_id: UUID, product_id: UUID):
+def remove_cart_item(request, user_id: UUID, product_id: UUID, params: CartExpandSchema = Query(...)):
     cart = service.remove_cart_item(user_id, product_id)
-    return cart_entity_to_schema(cart)
+    return render_cart(cart, params)
 
 
 @cart_router.get("{user_id}/clear", response={ HTTPStatus.OK: CartSchema, HTTPStatus.NOT_FOUND: ErrorSchema, HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema})
@@ -0,0 +1,185 @@
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from logging import Logger
+from typing import Optional
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from apps.carts.entity import Cart
+from apps.carts.repository import CartRepository
+from apps.carts.repository_interface import CartRepositoryInterface
+from apps.shared.cache import CacheBackend, DjangoCache
+from apps.shared.exceptions import ServiceUnavailableError
+from utils.logger import configure_logger
+
+
+class BufferedCartRepository(CartRepositoryInterface):
+    """Keeps working carts in a Django cache and writes them behind to the database.
+
+    Crash-safety semantics:
+    - A mutation is acknowledged once the cart and its dirty flag are in the cache. The database
+      catches up on the next flush: every `flush_interval` seconds, at checkout and on a clean shutdown.
+    - If a worker dies before flushing, the cart and its dirty flag survive in a shared cache
+      (file, Redis) and the next read of that cart, from any worker, schedules the flush again.
+    - Changes not flushed yet are lost if the cache loses the entry (locmem cache with a process
+      restart, Redis eviction or restart without persistence). The database then still holds the
+      cart as of its last flush.
+
+    Concurrent mutations of one cart are serialised by `lock_cart`, a lock taken with `cache.add`
+    (atomic on Redis, memcached and the database cache). It expires after `lock_ttl` seconds so a
+    worker dying while holding it cannot block the cart for longer than that.
+    """
+
+    def __init__(
+        self,
+        repository: CartRepositoryInterface,
+        cache: CacheBackend,
+        logger: Logger,
+        flush_interval: float = 0,
+        lock_ttl: float = 10,
+        lock_timeout: float = 5,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.logger = logger
+        self.flush_interval = flush_interval
+        self.lock_ttl = lock_ttl
+        self.lock_timeout = lock_timeout
+        self._pending: set[UUID] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"cart:{user_id}"
+
+    @staticmethod
+    def _dirty_key(user_id: UUID) -> str:
+        return f"cart-dirty:{user_id}"
+
+    @staticmethod
+    def _lock_key(user_id: UUID) -> str:
+        return f"cart-lock:{user_id}"
+
+    @property
+    def pending(self) -> set[UUID]:
+        with self._lock:
+            return set(self._pending)
+
+    def _buffer(self, cart: Cart) -> Cart:
+        self.cache.set_many({self._key(cart.user_id): cart, self._dirty_key(cart.user_id): True})
+        self._schedule(cart.user_id)
+        return cart
+
+    def _schedule(self, user_id: UUID):
+        with self._lock:
+            self._pending.add(user_id)
+            if self.flush_interval > 0 and self._flusher is None:
+                self._flusher = threading.Thread(target=self._run, name="cart-write-behind", daemon=True)
+                self._flusher.start()
+
+    @contextmanager
+    def lock_cart(self, user_id: UUID):
+        key, token = self._lock_key(user_id), uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+        while not self.cache.add(key, token, ttl=self.lock_ttl):
+            if time.monotonic() >= deadline:
+                self.logger.warning(f"Timed out waiting for the cart lock of user {user_id}")
+                raise ServiceUnavailableError("The cart is being changed by another request. Try again")
+            time.sleep(0.01)
+        try:
+            yield
+        finally:
+            # Only release our own lock: if it expired, another request may hold it by now.
+            if self.cache.get(key) == token:
+                self.cache.delete_many([key])
+
+    def save(self, cart: Cart) -> Cart:
+        return self._buffer(cart)
+
+    def update(self, cart: Cart) -> Cart:
+        return self._buffer(cart)
+
+    def get_cart_by_user(self, user_id: UUID) -> Cart:
+        entries = self.cache.get_many([self._key(user_id), self._dirty_key(user_id)])
+        if (cart := entries.get(self._key(user_id))) is not None:
+            if entries.get(self._dirty_key(user_id)) and user_id not in self._pending:
+                # Left dirty by a worker that stopped before flushing it.
+                self._schedule(user_id)
+            return cart
+
+        if cart := self.repository.get_cart_by_user(user_id):
+            self.cache.set(self._key(user_id), cart)
+        return cart
+
+    def flush(self, user_id: Optional[UUID] = None) -> int:
+        """Writes one user's buffered cart, or every pending one, to the database. Returns how many were written."""
+        with self._lock:
+            user_ids = [user_id] if user_id is not None else list(self._pending)
+            self._pending.difference_update(user_ids)
+        return sum(self._flush_cart(user_id) for user_id in user_ids)
+
+    def _flush_cart(self, user_id: UUID) -> bool:
+        if not self.cache.get(self._dirty_key(user_id)):
+            return False
+        # The flag is cleared before the cart is read, so a mutation landing mid-flush marks it dirty again.
+        self.cache.delete_many([self._dirty_key(user_id)])
+        if (cart := self.cache.get(self._key(user_id))) is None:
+            self.logger.warning(f"Buffered cart of user {user_id} left the cache before it was flushed")
+            return False
+
+        try:
+            if self.repository.update(cart) is None:
+                self.repository.save(cart)
+        except Exception:
+            self.logger.exception(f"Failed to flush the cart of user {user_id}. It stays buffered")
+            self.cache.set(self._dirty_key(user_id), True)
+            with self._lock:
+                self._pending.add(user_id)
+            return False
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            if not self._pending:
+                continue
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                self.logger.exception("Cart write-behind flush failed")
+            finally:
+                connection.close()
+
+    def close(self):
+        """Stops the background flusher and writes every pending cart (run at interpreter exit)."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+
+def build_cart_repository() -> CartRepositoryInterface:
+    if settings.CART_STORE == "database":
+        return CartRepository()
+    if settings.CART_STORE == "cache":
+        repository = BufferedCartRepository(
+            CartRepository(),
+            DjangoCache(alias=settings.CART_BUFFER_CACHE_ALIAS, ttl=settings.CART_BUFFER_TTL),
+            configure_logger(__name__),
+            settings.CART_BUFFER_FLUSH_INTERVAL,
+            settings.CART_BUFFER_LOCK_TTL,
+            settings.CART_BUFFER_LOCK_TIMEOUT,
+        )
+        atexit.register(repository.close)
+        return repository
+    raise ValueError(f"Unknown cart store: {settings.CART_STORE}")
+
+
+# The cart and order routers share this instance, so checkout flushes what the cart routes buffered.
+cart_repository = build_cart_repository()
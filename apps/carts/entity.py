@@ -1,21 +1,35 @@
 from typing import Optional
 from uuid import UUID, uuid4
 from apps.products.product_entity import Product
+from apps.shared.value_objects import Price
 from apps.shared.exceptions import NotFoundError, ConflictError
 
 class CartItem:
-    def __init__(self, product: Product, quantity: int, id: Optional[UUID]=None):
-        self._product = product
+    """A cart line: the product id, the quantity and the product price when the line was last added to."""
+
+    __slots__ = ("_product_id", "_quantity", "_price", "_id")
+
+    def __init__(self, product_id: UUID, quantity: int, price: Price, id: Optional[UUID]=None):
+        self._product_id = product_id
         self._quantity = quantity
+        self._price = price
         self._id = id or uuid4()
-        
+
+    @classmethod
+    def for_product(cls, product: Product, quantity: int) -> "CartItem":
+        return cls(product.id, quantity, product.price)
+
     @property
-    def product(self) -> Product:
-        return self._product
+    def product_id(self) -> UUID:
+        return self._product_id
     
     @property
     def quantity(self) -> int:
         return self._quantity
+
+    @property
+    def price(self) -> Price:
+        return self._price
     
     @property
     def id(self):
@@ -24,6 +38,8 @@ class CartItem:
 
 
 class Cart:
+    __slots__ = ("_user_id", "_items", "_id")
+
     def __init__(self, user_id: UUID, items: Optional[list[CartItem]]=None, id: Optional[UUID]=None):
         self._user_id = user_id
         self._items = items or []
@@ -43,14 +59,15 @@ class Cart:
 
     def add_item(self, cart_item: CartItem):
         for item in self._items:
-            if item.product.id == cart_item.product.id:
-                item.quantity += cart_item.quantity
+            if item.product_id == cart_item.product_id:
+                item._quantity += cart_item.quantity
+                item._price = cart_item.price
                 return
         self._items.append(cart_item)
 
     def subtract_item_quantity(self, product_id: UUID, quantity: int):
         for item in self.items:
-            if item.product.id == product_id:
+            if item.product_id == product_id:
                 if item._quantity - quantity < 0:
                     raise ConflictError("Quantity cannot be negative")
                 item._quantity -= quantity
@@ -61,7 +78,7 @@ class Cart:
     
     def remove_cart_item(self, product_id: UUID):
         for item in self._items:
-            if item.product.id == product_id:
+            if item.product_id == product_id:
                 self._items.remove(item)
                 return
         raise NotFoundError(f"Product {product_id} not found in cart")
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations, models
+
+
+def merge_duplicate_cart_items(apps, schema_editor):
+    CartItemModel = apps.get_model("carts", "CartItemModel")
+    kept = {}
+    for item in CartItemModel.objects.order_by("cart_id", "product_id", "id"):
+        key = (item.cart_id, item.product_id)
+        if key not in kept:
+            kept[key] = item
+            continue
+        kept[key].quantity += item.quantity
+        kept[key].save(update_fields=["quantity"])
+        item.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_cart_items, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="cartitemmodel",
+            constraint=models.UniqueConstraint(
+                fields=("cart", "product"), name="unique_cart_product"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations, models
+
+
+def snapshot_product_prices(apps, schema_editor):
+    CartItemModel = apps.get_model("carts", "CartItemModel")
+    ProductModel = apps.get_model("products", "ProductModel")
+    CartItemModel.objects.update(
+        unit_price=models.Subquery(
+            ProductModel.objects.filter(id=models.OuterRef("product_id")).values("price")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carts", "0002_cartitemmodel_unique_cart_product"),
+        ("products", "0002_alter_productmodel_table"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cartitemmodel",
+            name="unit_price",
+            field=models.DecimalField(decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.RunPython(snapshot_product_prices, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="cartitemmodel",
+            name="unit_price",
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+    ]
@@ -13,6 +13,11 @@ class CartItemModel(models.Model):
     cart = models.ForeignKey(CartModel, on_delete=models.CASCADE, related_name="items")
     product = models.ForeignKey("products.ProductModel", on_delete=models.CASCADE, related_name="cart_items")
     quantity = models.PositiveIntegerField()
+    # Product price when the line was last added to, so reading a cart does not load its products
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
 
     class Meta:
         db_table="cart_items"
+        constraints = [
+            models.UniqueConstraint(fields=["cart", "product"], name="unique_cart_product")
+        ]
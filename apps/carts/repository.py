@@ -1,53 +1,80 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+
 from apps.carts.repository_interface import CartRepositoryInterface
 from apps.carts.entity import Cart, CartItem
 from apps.carts.models import CartModel, CartItemModel
-from apps.users.models import UserModel
-from apps.products.models import ProductModel
+from apps.carts.serializers import cart_item_model_to_entity, cart_item_to_model
 
-from apps.products.serializers import product_model_to_entity
 
 class CartRepository(CartRepositoryInterface):
     def save(self, cart: Cart) -> Cart:
-        user = UserModel.objects.get(id=cart.user_id)
-        cart_data = CartModel.objects.create(id=cart.id, user=user)
-        items = []
+        # A cart holds one line per product, so repeated products are merged into the first line.
+        items: dict = {}
+        for item in cart.items:
+            if stored := items.get(item.product_id):
+                items[item.product_id] = CartItem(stored.product_id, stored.quantity + item.quantity, item.price, stored.id)
+            else:
+                items[item.product_id] = item
 
-        for cart_item in cart.items:
-            product_model = ProductModel.objects.get(id=cart_item.product.id)
-            cart_item_model = CartItemModel.objects.create(cart=cart_data, product=product_model, quantity=cart_item.quantity)
-            items.append(cart_item_model)
+        with transaction.atomic():
+            CartModel.objects.create(id=cart.id, user_id=cart.user_id)
+            CartItemModel.objects.bulk_create(cart_item_to_model(cart, item) for item in items.values())
+        return Cart(cart.user_id, list(items.values()), cart.id)
+
+    @contextmanager
+    def lock_cart(self, user_id):
+        # The cart read inside the block happens after the lock, so it sees the previous writer's lines.
+        with transaction.atomic():
+            CartModel.objects.select_for_update().filter(user_id=user_id).exists()
+            yield
 
-        return Cart(
-            user_id=user.id,
-            items=[ CartItem(product_model_to_entity(item.product), item.quantity, item.id) for item in items ],
-            id=cart_data.id
-        )
-    
     def update(self, cart: Cart) -> Cart:
-        cart_data = CartModel.objects.filter(id=cart.id).first()
-        if not cart_data:
-            return None
-        
-        CartItemModel.objects.filter(cart__id=cart.id).delete()
-        items = []
-        for cart_item in cart.items:
-            product_model = ProductModel.objects.get(id=cart_item.product.id)
-            cart_item_model = CartItemModel.objects.create(cart=cart_data, product=product_model, quantity=cart_item.quantity)
-            items.append(cart_item_model)
+        """Writes only the lines that changed since the cart was read: new or changed lines are
+        upserted on (cart, product) and lines no longer in the cart are deleted.
+        """
+        with transaction.atomic():
+            # Locking the cart row keeps concurrent updates of the same cart from racing on the delta.
+            if not CartModel.objects.select_for_update().filter(id=cart.id).exists():
+                return None
+
+            stored = {
+                product_id: (item_id, quantity, unit_price)
+                for product_id, item_id, quantity, unit_price in CartItemModel.objects.filter(cart_id=cart.id).values_list(
+                    "product_id", "id", "quantity", "unit_price"
+                )
+            }
+            changed = [
+                cart_item_to_model(cart, item)
+                for item in cart.items
+                if stored.get(item.product_id, (None, None, None))[1:] != (item.quantity, item.price.value)
+            ]
+            removed = stored.keys() - {item.product_id for item in cart.items}
+
+            if changed:
+                CartItemModel.objects.bulk_create(
+                    changed, update_conflicts=True, unique_fields=["cart", "product"], update_fields=["quantity", "unit_price"]
+                )
+            if removed:
+                CartItemModel.objects.filter(cart_id=cart.id, product_id__in=removed).delete()
 
+        # Lines that were already stored keep their row id even if the entity carries a new one.
         return Cart(
-            user_id=cart_data.user.id,
-            items=[ CartItem(product_model_to_entity(item.product), item.quantity, item.id) for item in items ],
-            id=cart_data.id
+            cart.user_id,
+            [
+                CartItem(item.product_id, item.quantity, item.price, stored[item.product_id][0] if item.product_id in stored else item.id)
+                for item in cart.items
+            ],
+            cart.id,
         )
-    
+
     def get_cart_by_user(self, user_id) -> Cart:
-        cart_data = CartModel.objects.filter(user__id=user_id).first()
+        cart_data = CartModel.objects.prefetch_related("items").filter(user__id=user_id).first()
         if not cart_data:
             return None
-        items = cart_data.items.all()
         return Cart(
             user_id,
-            [ CartItem(product_model_to_entity(item.product), item.quantity, item.id) for item in items ],
+            [ cart_item_model_to_entity(item) for item in cart_data.items.all() ],
             cart_data.id
-        )
\ No newline at end of file
+        )
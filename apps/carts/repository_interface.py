@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from uuid import UUID
 from apps.carts.entity import Cart
 
@@ -13,4 +14,12 @@ class CartRepositoryInterface(ABC):
 
     @abstractmethod
     def get_cart_by_user(self, user_id: UUID) -> Cart:
-        pass
\ No newline at end of file
+        pass
+
+    def lock_cart(self, user_id: UUID) -> AbstractContextManager:
+        """Serialises read-modify-write cycles on one user's cart (read, change, update)."""
+        return nullcontext()
+
+    def flush(self, user_id: UUID = None) -> int:
+        """Persists buffered cart changes. Repositories that write through have nothing to flush."""
+        return 0
\ No newline at end of file
@@ -1,7 +1,7 @@
 from uuid import UUID
 from pydantic import BaseModel, conint
 from apps.products.schema import ProductSchema
-from typing import List
+from typing import List, Literal, Optional
 
 class AddToCartSchema(BaseModel):
     product_id: UUID
@@ -12,8 +12,14 @@ class SubtractCartItemQuantitySchema(AddToCartSchema):
 
 class CartItemSchema(BaseModel):
     id: UUID
-    product: ProductSchema
+    product_id: UUID
     quantity: int
+    price: str
+    product: Optional[ProductSchema] = None
+
+
+class CartExpandSchema(BaseModel):
+    expand: Optional[Literal["product"]] = None
 
 
 class CartSchema(BaseModel):
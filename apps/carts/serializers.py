@@ -1,18 +1,35 @@
-from apps.carts.entity import Cart
+from typing import Optional
+from uuid import UUID
+
+from apps.carts.entity import Cart, CartItem
+from apps.carts.models import CartItemModel
 from apps.carts.schema import CartSchema, CartItemSchema
+from apps.products.product_entity import Product
 from apps.products.serializers import product_to_schema
+from apps.shared.value_objects import Price
 
 
-def cart_entity_to_schema(cart: Cart) -> CartSchema:
+def cart_entity_to_schema(cart: Cart, products: Optional[dict[UUID, Product]] = None) -> CartSchema:
+    """Renders the compact cart; with `products` (from a bulk lookup) each line also embeds its product."""
     return CartSchema(
         id=cart.id,
         user_id=cart.user_id,
         items=[
             CartItemSchema(
                 id=item.id,
-                product=product_to_schema(item.product),
-                quantity=item.quantity
+                product_id=item.product_id,
+                quantity=item.quantity,
+                price=str(item.price.value),
+                product=product_to_schema(products[item.product_id]) if products and item.product_id in products else None,
             )
             for item in cart.items
         ]
     )
+
+def cart_item_model_to_entity(item: CartItemModel) -> CartItem:
+    return CartItem(item.product_id, item.quantity, Price.from_persistence(item.unit_price), item.id)
+
+def cart_item_to_model(cart: Cart, item: CartItem) -> CartItemModel:
+    return CartItemModel(
+        id=item.id, cart_id=cart.id, product_id=item.product_id, quantity=item.quantity, unit_price=item.price.value
+    )
@@ -4,6 +4,7 @@ from apps.products.service import ProductService
 from apps.users.service import UserService
 from apps.carts.entity import Cart
 from apps.carts.entity import CartItem
+from apps.products.product_entity import Product
 from apps.shared.exceptions import NotFoundError
 from logging import Logger
 
@@ -22,39 +23,52 @@ class CartService:
     
     def add_to_cart(self, user_id: UUID, product_id: UUID, quantity: int) -> Cart:
         user = self.user_service.get_user_by_id(user_id)
-        cart = self.repository.get_cart_by_user(user.id)
-        if not cart:
-            cart = self.create_cart(user_id)        
         product = self.product_service.get_product_by_id(product_id)
-        cart_item = CartItem(product, quantity)
-        cart.add_item(cart_item)
-        self.repository.update(cart)
+        # Concurrent changes to the same cart would otherwise overwrite each other's lines.
+        with self.repository.lock_cart(user.id):
+            cart = self.repository.get_cart_by_user(user.id)
+            if not cart:
+                cart = self.create_cart(user_id)
+            cart_item = CartItem.for_product(product, quantity)
+            cart.add_item(cart_item)
+            self.repository.update(cart)
         return cart
     
     def subtract_quantity_from_cart_item(self, user_id: UUID, product_id: UUID, quantity: int) -> Cart:
-        cart = self.repository.get_cart_by_user(user_id)
-        if not cart:
-            raise NotFoundError(f"Cart not found for user id {user_id}")
-        cart.subtract_item_quantity(product_id, quantity)
-        self.repository.update(cart)
+        with self.repository.lock_cart(user_id):
+            cart = self.repository.get_cart_by_user(user_id)
+            if not cart:
+                raise NotFoundError(f"Cart not found for user id {user_id}")
+            cart.subtract_item_quantity(product_id, quantity)
+            self.repository.update(cart)
         return cart
     
     def remove_cart_item(self, user_id: UUID, product_id: UUID) -> Cart:
-        cart = self.repository.get_cart_by_user(user_id)
-        if not cart:
-             raise NotFoundError(f"Cart not found for user id {user_id}")
-        cart.remove_cart_item(product_id)
-        self.repository.update(cart)
+        with self.repository.lock_cart(user_id):
+            cart = self.repository.get_cart_by_user(user_id)
+            if not cart:
+                raise NotFoundError(f"Cart not found for user id {user_id}")
+            cart.remove_cart_item(product_id)
+            self.repository.update(cart)
         return cart
     
     def clear_cart(self, user_id: UUID):
-        cart = self.repository.get_cart_by_user(user_id)
-        if not cart:
-            raise NotFoundError(f"Cart not found for user id {user_id}")
-        cart.clear_cart()
-        self.repository.update(cart)
+        with self.repository.lock_cart(user_id):
+            cart = self.repository.get_cart_by_user(user_id)
+            if not cart:
+                raise NotFoundError(f"Cart not found for user id {user_id}")
+            cart.clear_cart()
+            self.repository.update(cart)
         return cart
     
+    def get_cart_products(self, cart: Cart) -> dict[UUID, Product]:
+        """Bulk lookup of the products in a cart, for responses that expand the cart lines."""
+        products = self.product_service.get_products_by_ids([item.product_id for item in cart.items])
+        return {product.id: product for product in products}
+
+    def flush_cart(self, user_id: UUID):
+        self.repository.flush(user_id)
+
     def get_cart_by_user(self, user_id: UUID):
         try:
             user = self.user_service.get_user_by_id(user_id)
@@ -2,7 +2,7 @@ import traceback
 from http import HTTPStatus
 from uuid import UUID
 
-from apps.categories.repository import CategoryRepository
+from apps.categories.cached_repository import build_category_repository
 from apps.categories.schema import (
     CategoryCreateSchema,
     CategorySchema,
@@ -10,13 +10,15 @@ from apps.categories.schema import (
 )
 from apps.categories.serializers import category_to_schema
 from apps.categories.service import CategoryService
-from ninja import Router
+from apps.shared.pagination import PageQuerySchema, PageRequest, PageSchema
+from django.conf import settings
+from ninja import Query, Router
 from ninja.errors import HttpError
 from utils.error_schema import ErrorSchema
 from utils.logger import configure_logger
 
 categories_router = Router()
-repository = CategoryRepository()
+repository = build_category_repository()
 logger = configure_logger(__name__)
 service = CategoryService(repository, logger)
 
@@ -27,10 +29,17 @@ def create_category(request, payload: CategoryCreateSchema):
     return HTTPStatus.CREATED, category_to_schema(category)
 
 
-@categories_router.get("", response={HTTPStatus.OK: list[CategorySchema]})
-def list_categories(request):
-    categories = service.list_categories()
-    return [category_to_schema(category) for category in categories]
+@categories_router.get("", response={HTTPStatus.OK: PageSchema[CategorySchema]})
+def list_categories(request, page: PageQuerySchema = Query(...)):
+    if settings.READ_PROJECTIONS_ENABLED:
+        rows = service.list_categories_projection(PageRequest(page.cursor, page.limit))
+        return {"items": rows.items, "next_cursor": rows.next_cursor}
+
+    categories = service.list_categories(PageRequest(page.cursor, page.limit))
+    return PageSchema[CategorySchema](
+        items=[category_to_schema(category) for category in categories.items],
+        next_cursor=categories.next_cursor,
+    )
 
 
 @categories_router.get(
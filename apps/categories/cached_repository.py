@@ -0,0 +1,150 @@
+import copy
+import functools
+import threading
+import time
+from typing import Callable, Optional
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.categories.entity import Category
+from apps.categories.repository import CategoryRepository
+from apps.categories.repository_interface import CategoryRepositoryInterface
+from apps.categories.serializers import category_to_row
+from apps.shared.cache import is_shared_cache
+from apps.shared.pagination import Page, PageRequest, paginate_sequence
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+class CategoryCatalogue:
+    """In-process snapshot of the whole categories table.
+
+    The snapshot is tagged with a version stamp kept in a shared Django cache. Every write
+    replaces the stamp, so each worker rebuilds its snapshot on its next read. Snapshots older
+    than `ttl` seconds are rebuilt too, so writes made outside the repository (admin, migrations)
+    eventually show up.
+    """
+
+    VERSION_KEY = "categories:catalogue:version"
+
+    def __init__(self, loader: Callable[[], list[Category]], cache_alias: str = "default", ttl: float = 300):
+        self._loader = loader
+        self._cache_alias = cache_alias
+        self._ttl = ttl
+        self._categories: dict[UUID, Category] = {}
+        self._version: Optional[str] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def _current_version(self) -> str:
+        return caches[self._cache_alias].get_or_set(self.VERSION_KEY, lambda: uuid4().hex, timeout=None)
+
+    def snapshot(self) -> dict[UUID, Category]:
+        # The stamp is read before loading: a write that lands mid-load leaves us one version behind.
+        version = self._current_version()
+        if self._is_stale(version):
+            with self._lock:
+                if self._is_stale(version):
+                    self._categories = {category.id: category for category in self._loader()}
+                    self._version = version
+                    self._loaded_at = time.monotonic()
+        return self._categories
+
+    def _is_stale(self, version: str) -> bool:
+        return version != self._version or time.monotonic() - self._loaded_at >= self._ttl
+
+    def bump(self):
+        caches[self._cache_alias].set(self.VERSION_KEY, uuid4().hex, timeout=None)
+
+
+class CachedCategoryRepository(CategoryRepositoryInterface):
+    """Serves category reads from a CategoryCatalogue; writes bump its version.
+
+    Reads inside transaction.atomic() go to the database, as a snapshot built there could
+    hold rows that are later rolled back.
+    """
+
+    def __init__(self, repository: CategoryRepositoryInterface, catalogue: CategoryCatalogue):
+        self.repository = repository
+        self.catalogue = catalogue
+
+    @staticmethod
+    def _in_transaction() -> bool:
+        return transaction.get_connection().in_atomic_block
+
+    def _invalidate(self):
+        self.catalogue.bump()
+        transaction.on_commit(self.catalogue.bump)
+
+    def save(self, category: Category) -> Category:
+        saved_category = self.repository.save(category)
+        self._invalidate()
+        return saved_category
+
+    def list_categories(self, page_request: PageRequest = None) -> Page[Category]:
+        if self._in_transaction():
+            return self.repository.list_categories(page_request)
+        categories, next_cursor = paginate_sequence(self.catalogue.snapshot().values(), page_request)
+        return Page([copy.copy(category) for category in categories], next_cursor)
+
+    def list_categories_projection(self, page_request: PageRequest = None) -> Page[dict]:
+        if self._in_transaction():
+            return self.repository.list_categories_projection(page_request)
+        categories, next_cursor = paginate_sequence(self.catalogue.snapshot().values(), page_request)
+        return Page([category_to_row(category) for category in categories], next_cursor)
+
+    def get_category_by_id(self, category_id: UUID):
+        if self._in_transaction():
+            return self.repository.get_category_by_id(category_id)
+        if category := self.catalogue.snapshot().get(category_id):
+            return copy.copy(category)
+        return None
+
+    def get_categories_by_ids(self, category_ids: list[UUID]) -> list[Category]:
+        if self._in_transaction():
+            return self.repository.get_categories_by_ids(category_ids)
+        snapshot = self.catalogue.snapshot()
+        return [copy.copy(snapshot[category_id]) for category_id in set(category_ids) if category_id in snapshot]
+
+    def list_all_categories(self) -> list[Category]:
+        if self._in_transaction():
+            return self.repository.list_all_categories()
+        return [copy.copy(category) for category in self.catalogue.snapshot().values()]
+
+    def update_category(self, category: Category) -> Category:
+        updated_category = self.repository.update_category(category)
+        self._invalidate()
+        return updated_category
+
+    def delete_category(self, category_id: UUID) -> None:
+        self.repository.delete_category(category_id)
+        self._invalidate()
+
+
+category_catalogue = CategoryCatalogue(
+    CategoryRepository().list_all_categories, settings.CATEGORY_CATALOGUE_CACHE_ALIAS, settings.CATEGORY_CATALOGUE_TTL
+)
+
+
+@functools.cache
+def _warn_catalogue_disabled(alias: str):
+    logger.warning(f"Category catalogue disabled: cache alias '{alias}' is not shared across workers")
+
+
+def build_category_repository() -> CategoryRepositoryInterface:
+    if not settings.CATEGORY_CATALOGUE_ENABLED:
+        return CategoryRepository()
+    # With a per-process cache the version stamp never reaches the other workers, which would
+    # keep serving their snapshot after a write.
+    if not is_shared_cache(settings.CATEGORY_CATALOGUE_CACHE_ALIAS):
+        _warn_catalogue_disabled(settings.CATEGORY_CATALOGUE_CACHE_ALIAS)
+        return CategoryRepository()
+    return CachedCategoryRepository(CategoryRepository(), category_catalogue)
@@ -5,6 +5,8 @@ from typing import Optional
 
 
 class Category:
+    __slots__ = ("_name", "_description", "_id", "_created_at", "_updated_at")
+
     def __init__(
         self,
         name: Name,
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="categorymodel",
+            index=models.Index(
+                fields=["created_at", "id"], name="categories_created_idx"
+            ),
+        ),
+    ]
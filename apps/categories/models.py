@@ -9,4 +9,7 @@ class CategoryModel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        db_table = "categories"
\ No newline at end of file
+        db_table = "categories"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="categories_created_idx"),
+        ]
\ No newline at end of file
@@ -1,8 +1,14 @@
 from uuid import UUID
+from django.db import transaction
 from apps.categories.entity import Category
 from apps.categories.repository_interface import CategoryRepositoryInterface
 from apps.categories.models import CategoryModel
+from apps.products.cached_repository import invalidate_products_of_category
 from apps.shared.value_objects import Name, Description
+from apps.shared.pagination import Page, PageRequest, paginate_queryset
+from apps.shared.database import read_only_method
+
+CATEGORY_PROJECTION = ("id", "name", "description", "created_at", "updated_at")
 
 class CategoryRepository(CategoryRepositoryInterface):
     def save(self, category: Category) -> Category:
@@ -14,36 +20,70 @@ class CategoryRepository(CategoryRepositoryInterface):
             updated_at=category.updated_at
         )
         return Category(
-            name=Name(category_data.name),
-            description=Description(category_data.description),
+            name=Name.from_persistence(category_data.name),
+            description=Description.from_persistence(category_data.description),
             id=category_data.id,
             created_at=category_data.created_at,
             updated_at=category_data.updated_at,
         )
     
-    def list_categories(self) -> list[Category]:
-        categories_data = CategoryModel.objects.all()
-        return [
+    @read_only_method
+    def list_categories(self, page_request: PageRequest = None) -> Page[Category]:
+        categories_data, next_cursor = paginate_queryset(CategoryModel.objects.all(), page_request)
+        categories = [
             Category(
-            name=Name(category_data.name),
-            description=Description(category_data.description),
+            name=Name.from_persistence(category_data.name),
+            description=Description.from_persistence(category_data.description),
             id=category_data.id,
             created_at=category_data.created_at,
             updated_at=category_data.updated_at,
             )
             for category_data in categories_data
         ]
+        return Page(categories, next_cursor)
+
+    @read_only_method
+    def list_categories_projection(self, page_request: PageRequest = None) -> Page[dict]:
+        rows, next_cursor = paginate_queryset(CategoryModel.objects.values(*CATEGORY_PROJECTION), page_request)
+        return Page(rows, next_cursor)
     
+    @read_only_method
     def get_category_by_id(self, category_id:UUID):
         if not (category_data:=CategoryModel.objects.filter(id=category_id).first()):
             return None
         return Category(
-            name=Name(category_data.name),
-            description=Description(category_data.description),
+            name=Name.from_persistence(category_data.name),
+            description=Description.from_persistence(category_data.description),
+            id=category_data.id,
+            created_at=category_data.created_at,
+            updated_at=category_data.updated_at,
+            )
+    
+    @read_only_method
+    def get_categories_by_ids(self, category_ids: list[UUID]) -> list[Category]:
+        return [
+            Category(
+            name=Name.from_persistence(category_data.name),
+            description=Description.from_persistence(category_data.description),
             id=category_data.id,
             created_at=category_data.created_at,
             updated_at=category_data.updated_at,
             )
+            for category_data in CategoryModel.objects.filter(id__in=set(category_ids))
+        ]
+
+    # Not read_only: it fills the category catalogue, which must not be rebuilt from a lagging replica.
+    def list_all_categories(self) -> list[Category]:
+        return [
+            Category(
+            name=Name.from_persistence(category_data.name),
+            description=Description.from_persistence(category_data.description),
+            id=category_data.id,
+            created_at=category_data.created_at,
+            updated_at=category_data.updated_at,
+            )
+            for category_data in CategoryModel.objects.all()
+        ]
     
     def update_category(self, category: Category) -> Category:
         if not (category_data:=CategoryModel.objects.filter(id=category.id).first()):
@@ -51,9 +91,10 @@ class CategoryRepository(CategoryRepositoryInterface):
         category_data.name = category.name.value
         category_data.description = category.description.value
         category_data.save()
+        invalidate_products_of_category(category_data.id)
         return Category(
-            name=Name(category_data.name),
-            description=Description(category_data.description),
+            name=Name.from_persistence(category_data.name),
+            description=Description.from_persistence(category_data.description),
             id=category_data.id,
             created_at=category_data.created_at,
             updated_at=category_data.updated_at,
@@ -62,4 +103,8 @@ class CategoryRepository(CategoryRepositoryInterface):
     def delete_category(self, category_id:UUID):
         if not (category:=CategoryModel.objects.filter(id=category_id).first()):
             return None
-        category.delete()
\ No newline at end of file
+        with transaction.atomic():
+            product_ids = list(category.productmodel_set.values_list("id", flat=True))
+            category.delete()
+            # Evicted after the delete so the on_commit eviction runs once the category is gone.
+            invalidate_products_of_category(category_id, product_ids)
\ No newline at end of file
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from apps.categories.entity import Category
 from apps.categories.schema import CategoryUpdateSchema
+from apps.shared.pagination import Page, PageRequest
 
 class CategoryRepositoryInterface(ABC):
     @abstractmethod
@@ -10,13 +11,25 @@ class CategoryRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_categories(self) -> list[Category]:
+    def list_categories(self, page_request: PageRequest = None) -> Page[Category]:
+        pass
+
+    @abstractmethod
+    def list_categories_projection(self, page_request: PageRequest = None) -> Page[dict]:
         pass
 
     @abstractmethod
     def get_category_by_id(self, category_id:UUID) -> Category:
         pass
 
+    @abstractmethod
+    def get_categories_by_ids(self, category_ids: list[UUID]) -> list[Category]:
+        pass
+
+    @abstractmethod
+    def list_all_categories(self) -> list[Category]:
+        pass
+
     @abstractmethod
     def update_category(self, category: Category) ->  Category:
         pass
@@ -14,6 +14,17 @@ def category_to_schema(category: Category) -> CategorySchema:
     )
 
 
+def category_to_row(category: Category) -> dict:
+    """Same keys as the .values() rows of CategoryRepository.list_categories_projection."""
+    return {
+        "id": category.id,
+        "name": category.name.value,
+        "description": category.description.value,
+        "created_at": category.created_at,
+        "updated_at": category.updated_at,
+    }
+
+
 def category_to_nested_schema(category: Category) -> CategoryNestedSchema:
     return CategoryNestedSchema(
             id=category.id,
@@ -22,4 +33,4 @@ def category_to_nested_schema(category: Category) -> CategoryNestedSchema:
         )
 
 def category_model_to_entity(category_model: CategoryModel) -> Category:
-    return Category(Name(category_model.name), Description(category_model.description), category_model.id)
+    return Category(Name.from_persistence(category_model.name), Description.from_persistence(category_model.description), category_model.id)
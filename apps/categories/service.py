@@ -5,6 +5,7 @@ import logging
 from apps.shared.value_objects import Name, Description
 from apps.shared.exceptions import NotFoundError
 from apps.categories.schema import CategoryUpdateSchema
+from apps.shared.pagination import Page, PageRequest
 
 class CategoryService:
     def __init__(self, repository: CategoryRepositoryInterface, logger: logging.Logger):
@@ -19,14 +20,24 @@ class CategoryService:
         self.logger.info(f"Category successfully created: Name {saved_category.name.value} - ID {saved_category.id}")
         return saved_category
     
-    def list_categories(self) -> list[Category]:
-        return self.repository.list_categories()
+    def list_categories(self, page_request: PageRequest = None) -> Page[Category]:
+        return self.repository.list_categories(page_request)
+
+    def list_categories_projection(self, page_request: PageRequest = None) -> Page[dict]:
+        return self.repository.list_categories_projection(page_request)
     
     def get_category_by_id(self, category_id: UUID):
         if not (category:=self.repository.get_category_by_id(category_id)):
             raise NotFoundError(f"Category not found - ID {category_id}")
         return category
     
+    def get_categories_by_ids(self, category_ids: list[UUID]) -> list[Category]:
+        categories = {category.id: category for category in self.repository.get_categories_by_ids(category_ids)}
+        if missing_ids := [str(category_id) for category_id in category_ids if category_id not in categories]:
+            self.logger.warning(f"Categories not found - IDs {', '.join(missing_ids)}")
+            raise NotFoundError(f"Categories not found - IDs {', '.join(missing_ids)}")
+        return [categories[category_id] for category_id in category_ids]
+    
     def update_category(self, category_id:UUID, payload:CategoryUpdateSchema) -> Category:
         if not (category:=self.repository.get_category_by_id(category_id)):
             self.logger.warning(f"Category not found - ID {category_id}")
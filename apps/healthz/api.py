@@ -1,7 +1,15 @@
 from ninja import Router
 
+from apps.authentication.rate_limit import login_rate_limit_stats
+
 healthz_router = Router()
 
 @healthz_router.get("")
 def check_sys_health(request):
-    return "System is up and running..."
\ No newline at end of file
+    return "System is up and running..."
+
+
+@healthz_router.get("/metrics")
+def metrics(request):
+    """Contadores deste processo"""
+    return {"login_rate_limit": login_rate_limit_stats()}
@@ -7,24 +7,25 @@ from apps.orders.service import OrderService
 from apps.orders.enums import OrderStatus
 from apps.orders.repository import OrderRepository
 from apps.products.service import ProductService
-from apps.products.repository import ProductRepository
+from apps.products.cached_repository import build_product_repository
 from apps.categories.service import CategoryService
-from apps.categories.repository import CategoryRepository
+from apps.categories.cached_repository import build_category_repository
 from apps.addresses.service import AddressService
 from apps.addresses.repository import AddressRepository
 from apps.carts.service import CartService
-from apps.carts.repository import CartRepository
+from apps.carts.buffered_repository import cart_repository
 from apps.users.service import UserService
 from apps.users.repository import UserRepository
+from apps.shared.pagination import PageQuerySchema, PageRequest, PageSchema
 from apps.orders.schemas import OrderSchema, OrderCreateSchema, OrderStatusChangeSchema, OrderItemQuantityChangeSchema
 
 
 logger = configure_logger(__name__)
 user_service = UserService(UserRepository(), logger)
-product_service = ProductService(ProductRepository(), logger)
-category_service = CategoryService(CategoryRepository(), logger)
+product_service = ProductService(build_product_repository(), logger)
+category_service = CategoryService(build_category_repository(), logger)
 address_service = AddressService(AddressRepository(), logger)
-cart_service = CartService(CartRepository(), product_service, user_service, logger)
+cart_service = CartService(cart_repository, product_service, user_service, logger)
 
 service = OrderService(OrderRepository(), user_service, product_service, cart_service, address_service)
 
@@ -37,6 +38,7 @@ orders_router = Router()
     response={
         HTTPStatus.CREATED: OrderSchema,
         HTTPStatus.NOT_FOUND: ErrorSchema,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorSchema,
         HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
     },
 )
@@ -58,12 +60,13 @@ def get_order_by_id(request, order_id: UUID) -> OrderSchema:
 @orders_router.get(
     "",
     response={
-        HTTPStatus.OK: list[OrderSchema],
+        HTTPStatus.OK: PageSchema[OrderSchema],
         HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
     }
 )
-def list_orders_by_user(request, user_id: UUID = Query(...)):
-    return service.list_orders_by_user_id(user_id)
+def list_orders_by_user(request, user_id: UUID = Query(...), page: PageQuerySchema = Query(...)):
+    orders = service.list_orders_by_user_id(user_id, PageRequest(page.cursor, page.limit))
+    return PageSchema[OrderSchema](items=orders.items, next_cursor=orders.next_cursor)
 
 
 @orders_router.patch(
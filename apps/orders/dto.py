@@ -1,9 +1,11 @@
+from uuid import UUID
 from apps.orders.entity import Order, OrderItem
 from apps.orders.schemas import OrderSchema, OrderItemSchema
 from apps.users.schema import UserNestedSchema
 from apps.products.schema import ProductNestedSchema
 from apps.users.entity import User
 from apps.addresses.entity import Address
+from apps.addresses.schema import AddressSchema
 from apps.products.product_entity import Product
 from apps.users.serializers import user_to_nested_schema
 from apps.products.serializers import product_to_nested_schema
@@ -12,8 +14,32 @@ from apps.addresses.serializers import from_address_entity_to_schema
 class OrderDTO:
     @staticmethod
     def build(order: Order, user: User, address: Address, products: list[Product]) -> OrderSchema:
-        products_map = {product.id: product for product in products}
+        products_map = {product.id: product_to_nested_schema(product) for product in products}
+        return OrderDTO._assemble(
+            order, user_to_nested_schema(user), from_address_entity_to_schema(address), products_map
+        )
 
+    @staticmethod
+    def build_many(orders: list[Order], user: User, addresses: list[Address], products: list[Product]) -> list[OrderSchema]:
+        user_schema = user_to_nested_schema(user)
+        addresses_map = {address.id: from_address_entity_to_schema(address) for address in addresses}
+        products_map = {product.id: product_to_nested_schema(product) for product in products}
+
+        orders_schema = []
+        for order in orders:
+            address_schema = addresses_map.get(order.address_id)
+            if not address_schema:
+                raise ValueError(f"Endereço não encontrado para o ID {order.address_id}")
+            orders_schema.append(OrderDTO._assemble(order, user_schema, address_schema, products_map))
+        return orders_schema
+
+    @staticmethod
+    def _assemble(
+        order: Order,
+        user_schema: UserNestedSchema,
+        address_schema: AddressSchema,
+        products_map: dict[UUID, ProductNestedSchema],
+    ) -> OrderSchema:
         items = []
         for order_item in order.items:
             product = products_map.get(order_item.product_id)
@@ -23,7 +49,7 @@ class OrderDTO:
             items.append(
                 OrderItemSchema(
                     id=order_item.id,
-                    product=product_to_nested_schema(product),
+                    product=product,
                     quantity=order_item.quantity,
                     price=str(order_item.price.value),
                 )
@@ -31,9 +57,9 @@ class OrderDTO:
 
         return OrderSchema(
             id=order.id,
-            user=user_to_nested_schema(user),
-            address=from_address_entity_to_schema(address),
+            user=user_schema,
+            address=address_schema,
             items=items,
             status=order.status,
             total_amount=str(order.total_amount.value)
-        )
\ No newline at end of file
+        )
@@ -7,6 +7,8 @@ from apps.shared.exceptions import ConflictError, NotFoundError
 
 
 class OrderItem:
+    __slots__ = ("_product_id", "_quantity", "_price", "_id")
+
     def __init__(
         self, product_id: UUID, quantity: int, price: Price, id: Optional[UUID] = None
     ):
@@ -41,6 +43,8 @@ class OrderItem:
 
 
 class Order:
+    __slots__ = ("_user_id", "_address_id", "_items", "_id", "_status", "_total_amount")
+
     def __init__(
         self,
         user_id: UUID,
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ordermodel",
+            index=models.Index(
+                fields=["user_id", "created_at", "id"], name="orders_user_created_idx"
+            ),
+        ),
+    ]
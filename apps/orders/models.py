@@ -9,6 +9,11 @@ class OrderModel(models.Model):
     total_amount = models.DecimalField(max_digits=12, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user_id", "created_at", "id"], name="orders_user_created_idx"),
+        ]
+
 class OrderItemModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     order = models.ForeignKey(OrderModel, related_name="items", on_delete=models.CASCADE)
@@ -5,6 +5,8 @@ from apps.orders.models import OrderModel, OrderItemModel
 from apps.shared.value_objects import Price
 from apps.products.product_entity import Product
 from apps.orders.enums import OrderStatus
+from apps.shared.pagination import Page, PageRequest, paginate_queryset
+from apps.shared.database import read_only_method
 
 
 class OrderRepository(OrderRepositoryInterface):
@@ -17,19 +19,12 @@ class OrderRepository(OrderRepositoryInterface):
             total_amount=order.total_amount.value,
         )
 
-        items_model = [
-            OrderItemModel.objects.create(
-                id=item.id,
-                order=order_data,
-                product_id=item.product_id,
-                quantity=item.quantity,
-                price=item.price.value,
-            )
-            for item in order.items
-        ]
+        items_model = OrderItemModel.objects.bulk_create(
+            [self._to_item_model(order_data.id, item) for item in order.items]
+        )
 
         items = [
-            OrderItem(item.product_id, item.quantity, Price(item.price), item.id)
+            OrderItem(item.product_id, item.quantity, Price.from_persistence(item.price), item.id)
             for item in items_model
         ]
 
@@ -48,7 +43,7 @@ class OrderRepository(OrderRepositoryInterface):
         items_data = order_data.items.all()
 
         items = [
-            OrderItem(item.product_id, item.quantity, Price(item.price), item.id)
+            OrderItem(item.product_id, item.quantity, Price.from_persistence(item.price), item.id)
             for item in items_data
         ]
 
@@ -60,14 +55,17 @@ class OrderRepository(OrderRepositoryInterface):
             order_data.id,
         )
     
-    def list_orders_by_user_id(self, user_id: UUID):
-        orders_data = OrderModel.objects.filter(user_id=user_id)
-        return [
+    @read_only_method
+    def list_orders_by_user_id(self, user_id: UUID, page_request: PageRequest = None) -> Page[Order]:
+        orders_data, next_cursor = paginate_queryset(
+            OrderModel.objects.filter(user_id=user_id).prefetch_related("items"), page_request
+        )
+        orders = [
             Order(
                 order_data.user_id,
                 order_data.address_id,
                 [
-                    OrderItem(item.product_id, item.quantity, Price(item.price), item.id)
+                    OrderItem(item.product_id, item.quantity, Price.from_persistence(item.price), item.id)
                     for item in order_data.items.all()
                 ],
                 OrderStatus(order_data.status),
@@ -75,6 +73,7 @@ class OrderRepository(OrderRepositoryInterface):
             )
             for order_data in orders_data
         ]
+        return Page(orders, next_cursor)
     
     def set_status(self, order_id: UUID, new_status: OrderStatus) -> None:
         if not (order_data:=OrderModel.objects.filter(id=order_id).first()):
@@ -84,7 +83,7 @@ class OrderRepository(OrderRepositoryInterface):
 
         items_data = order_data.items.all()
         items = [
-            OrderItem(item.product_id, item.quantity, Price(item.price), item.id)
+            OrderItem(item.product_id, item.quantity, Price.from_persistence(item.price), item.id)
             for item in items_data
         ]
 
@@ -101,37 +100,58 @@ class OrderRepository(OrderRepositoryInterface):
    
 
     def update_order(self, order: Order) -> Order:
-        order_model = OrderModel.objects.filter(id=order.id).first()
-        if not order_model:
+        updated_rows = OrderModel.objects.filter(id=order.id).update(
+            status=order.status.value,
+            address_id=order.address_id,
+            total_amount=order.total_amount.value,
+        )
+        if not updated_rows:
             return None
 
-        order_model.status = order.status.value
-        order_model.address_id = order.address_id
-        order_model.total_amount = order.total_amount.value
-        order_model.save()
-
-        order_model.items.all().delete()
+        persisted_items = {
+            item.id: item
+            for item in OrderItemModel.objects.filter(order_id=order.id).only("id", "quantity", "price")
+        }
+        current_items = {item.id: item for item in order.items}
 
-        items_model = [
-            OrderItemModel.objects.create(
-                id=item.id,
-                order=order_model,
-                product_id=item.product_id,
-                quantity=item.quantity,
-                price=item.price.value,
-            )
-            for item in order.items
+        new_items = [
+            self._to_item_model(order.id, item)
+            for item_id, item in current_items.items()
+            if item_id not in persisted_items
         ]
+        changed_items = [
+            self._to_item_model(order.id, item)
+            for item_id, item in current_items.items()
+            if item_id in persisted_items
+            and (persisted_items[item_id].quantity, persisted_items[item_id].price) != (item.quantity, item.price.value)
+        ]
+        removed_item_ids = persisted_items.keys() - current_items.keys()
+
+        if new_items:
+            OrderItemModel.objects.bulk_create(new_items)
+        if changed_items:
+            OrderItemModel.objects.bulk_update(changed_items, ["quantity", "price"])
+        if removed_item_ids:
+            OrderItemModel.objects.filter(id__in=removed_item_ids).delete()
 
         items = [
-            OrderItem(item.product_id, item.quantity, Price(item.price), item.id)
-            for item in items_model
+            OrderItem(item.product_id, item.quantity, item.price, item.id)
+            for item in order.items
         ]
 
         return Order(
-            order_model.user_id,
-            order_model.address_id,
+            order.user_id,
+            order.address_id,
             items,
-            OrderStatus(order_model.status),
-            order_model.id,
+            order.status,
+            order.id,
+        )
+
+    def _to_item_model(self, order_id: UUID, item: OrderItem) -> OrderItemModel:
+        return OrderItemModel(
+            id=item.id,
+            order_id=order_id,
+            product_id=item.product_id,
+            quantity=item.quantity,
+            price=item.price.value,
         )
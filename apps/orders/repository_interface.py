@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 from apps.orders.entity import Order
 from apps.orders.enums import OrderStatus
+from apps.shared.pagination import Page, PageRequest
 
 
 class OrderRepositoryInterface(ABC):
@@ -14,7 +15,7 @@ class OrderRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_orders_by_user_id(self, user_id: UUID) -> list[Order]:
+    def list_orders_by_user_id(self, user_id: UUID, page_request: PageRequest = None) -> Page[Order]:
         pass
 
     @abstractmethod
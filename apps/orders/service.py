@@ -1,16 +1,20 @@
 from uuid import UUID
 
+from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
 from apps.addresses.service import AddressService
 from apps.carts.service import CartService
 from apps.orders.entity import Order, OrderItem
 from apps.orders.enums import OrderStatus
 from apps.orders.repository_interface import OrderRepositoryInterface
+from apps.users.entity import User
 from apps.users.service import UserService
 from apps.products.service import ProductService
 from django.db import transaction
 from apps.orders.dto import OrderDTO
 from apps.orders.schemas import OrderSchema
-from apps.shared.exceptions import NotFoundError
+from apps.shared.exceptions import NotFoundError, UnprocessableEntityError
+from apps.shared.pagination import Page, PageRequest
 from utils.logger import configure_logger
 
 logger = configure_logger(__name__)
@@ -33,60 +37,51 @@ class OrderService:
         self.logger = logger
 
     def create_order(self, user_id: UUID, address_id: UUID) -> OrderSchema:
+        self.cart_service.flush_cart(user_id)
         cart = self.cart_service.get_cart_by_user(user_id)
         address = self.address_service.get_address_by_id(address_id)
+        if address.validation_status == AddressValidationStatus.INVALID:
+            raise UnprocessableEntityError("Unprocessable address. The address data does not match the postal code.")
         user = self.user_service.get_user_by_id(user_id)
         with transaction.atomic():
-            order_items = []
+            reservations = {}
             for item in cart.items:
-                self.product_service.reserve_stock(item.product.id, item.quantity)
-                order_items.append(
-                    OrderItem(item.product.id, item.quantity, item.product.price)
-                )
+                reservations[item.product_id] = reservations.get(item.product_id, 0) + item.quantity
+            self.product_service.reserve_stock_many(reservations)
 
-            order = Order(user_id, address.id, order_items, OrderStatus.PENDING)
-            saved_order = self.repository.save(order)
-            
-            products = [
-                self.product_service.get_product_by_id(item.product_id)
-                for item in saved_order.items
+            # Cart lines only keep a price snapshot; orders are charged the current product price.
+            products = {product.id: product for product in self.product_service.get_products_by_ids(list(reservations))}
+            order_items = [
+                OrderItem(item.product_id, item.quantity, products[item.product_id].price) for item in cart.items
             ]
 
+            order = Order(user_id, address.id, order_items, OrderStatus.PENDING)
+            saved_order = self.repository.save(order)
 
-            return OrderDTO.build(saved_order, user, address, products)
+            return self._build_order_schema(saved_order, user, address)
         
     def get_order_by_id(self, order_id: UUID):
         order = self._get_order_or_raise(order_id)
-        user = self.user_service.get_user_by_id(order.user_id)
-        address = self.address_service.get_address_by_id(order.address_id)
-        products = [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-
-        return OrderDTO.build(order, user, address, products)
+        return self._build_order_schema(order)
 
     
-    def list_orders_by_user_id(self, user_id: UUID):
+    def list_orders_by_user_id(self, user_id: UUID, page_request: PageRequest = None) -> Page[OrderSchema]:
         user = self.user_service.get_user_by_id(user_id)
-        orders = self.repository.list_orders_by_user_id(user.id)
-
-        return [
-            OrderDTO.build(
-                order,
-                user,
-                self.address_service.get_address_by_id(order.address_id),
-                [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-            )
-            for order in orders
-        ]
+        orders_page = self.repository.list_orders_by_user_id(user.id, page_request)
+        orders = orders_page.items
+
+        addresses = self.address_service.get_addresses_by_ids(list({order.address_id for order in orders}))
+        products = self.product_service.get_products_by_ids(
+            list({item.product_id for order in orders for item in order.items})
+        )
+
+        return Page(OrderDTO.build_many(orders, user, addresses, products), orders_page.next_cursor)
     
     def set_status(self, order_id: UUID, new_status: OrderStatus):
         order = self._get_order_or_raise(order_id)
         order.set_status(new_status)
         self.repository.set_status(order.id, new_status)
-        user = self.user_service.get_user_by_id(order.user_id)
-        address = self.address_service.get_address_by_id(order.address_id)
-        products = [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-
-        return OrderDTO.build(order, user, address, products)
+        return self._build_order_schema(order)
     
     def remove_item_from_order(self, order_id: UUID, item_id: UUID):
         order = self._get_order_or_raise(order_id)
@@ -101,11 +96,7 @@ class OrderService:
             self.repository.delete_order_item(item_id)
             # 6. Atualizar pedido no banco se necessário (ex: total)
             self.repository.update_order(order)
-            
-            user = self.user_service.get_user_by_id(order.user_id)
-            address = self.address_service.get_address_by_id(order.address_id)
-            products = [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-            return OrderDTO.build(order, user, address, products)
+            return self._build_order_schema(order)
         
     def increase_order_item_quantity(self, order_id: UUID, item_id: UUID, quantity: int):
         order = self._get_order_or_raise(order_id)
@@ -115,11 +106,7 @@ class OrderService:
             self.product_service.reserve_stock(item.product_id, quantity)
             order.increase_item_quantity(item.id, quantity)
             updated_order = self.repository.update_order(order)
-
-            user = self.user_service.get_user_by_id(order.user_id)
-            address = self.address_service.get_address_by_id(order.address_id)
-            products = [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-            return OrderDTO.build(updated_order, user, address, products)
+            return self._build_order_schema(updated_order)
     
     
     def decrease_order_item_quantity(self, order_id: UUID, item_id: UUID, quantity: int):
@@ -130,11 +117,7 @@ class OrderService:
             self.product_service.release_stock(item.product_id, quantity)
             order.decrease_item_quantity(item.id, quantity)
             self.repository.update_order(order)
-
-            user = self.user_service.get_user_by_id(order.user_id)
-            address = self.address_service.get_address_by_id(order.address_id)
-            products = [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-            return OrderDTO.build(order, user, address, products)
+            return self._build_order_schema(order)
 
     
     def cancel_order(self, order_id: UUID):
@@ -145,11 +128,7 @@ class OrderService:
             for item in order.items:
                 self.product_service.release_stock(item.product_id, item.quantity)
             self.repository.update_order(order)
-
-            user = self.user_service.get_user_by_id(order.user_id)
-            address = self.address_service.get_address_by_id(order.address_id)
-            products = [ self.product_service.get_product_by_id(item.product_id) for item in order.items ]
-            return OrderDTO.build(order, user, address, products)
+            return self._build_order_schema(order)
 
 
     
@@ -158,5 +137,11 @@ class OrderService:
             raise NotFoundError("Order not found")
         return order 
 
+    def _build_order_schema(self, order: Order, user: User = None, address: Address = None) -> OrderSchema:
+        user = user or self.user_service.get_user_by_id(order.user_id)
+        address = address or self.address_service.get_address_by_id(order.address_id)
+        products = self.product_service.get_products_by_ids([item.product_id for item in order.items])
+        return OrderDTO.build(order, user, address, products)
+
 
     
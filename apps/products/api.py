@@ -1,23 +1,28 @@
 from http import HTTPStatus
-from typing import List
 from uuid import UUID
 
-from apps.products.repository import ProductRepository
+from apps.products.cached_repository import build_product_repository
 from apps.products.schema import (
     ProductActivationSchema,
     ProductCreateSchema,
+    ProductFacetsQuerySchema,
+    ProductFacetsSchema,
     ProductSchema,
+    ProductSearchQuerySchema,
+    ProductSearchSchema,
     ProductUpdateSchema,
 )
-from apps.products.serializers import product_to_schema
+from apps.products.serializers import product_facets_to_response, product_row_to_response, product_to_schema
 from apps.products.service import ProductService
+from apps.shared.pagination import PageQuerySchema, PageRequest, PageSchema
+from django.conf import settings
 from ninja import Query, Router
 from utils.error_schema import ErrorSchema
 from utils.logger import configure_logger
 
 products_router = Router()
 
-repository = ProductRepository()
+repository = build_product_repository()
 logger = configure_logger(__name__)
 service = ProductService(repository, logger)
 
@@ -40,6 +45,34 @@ def create_product(request, payload: ProductCreateSchema):
     return HTTPStatus.CREATED, product_to_schema(created_product)
 
 
+@products_router.get(
+    "/search",
+    response={
+        HTTPStatus.OK: ProductSearchSchema,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorSchema,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
+    },
+)
+def search_products(request, query: ProductSearchQuerySchema = Query(...)):
+    rows = service.search_products(
+        query.q, query.limit, query.category_id, query.min_price, query.max_price, query.is_active
+    )
+    return {"items": [product_row_to_response(row) for row in rows]}
+
+
+@products_router.get(
+    "/facets",
+    response={
+        HTTPStatus.OK: ProductFacetsSchema,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorSchema,
+        HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
+    },
+)
+def get_product_facets(request, query: ProductFacetsQuerySchema = Query(...)):
+    facets = service.get_product_facets(query.category_id, query.min_price, query.max_price, query.is_active)
+    return product_facets_to_response(facets)
+
+
 @products_router.get(
     "/{product_id}",
     response={
@@ -56,13 +89,20 @@ def get_product_by_id(request, product_id: UUID):
 @products_router.get(
     "",
     response={
-        HTTPStatus.OK: List[ProductSchema],
+        HTTPStatus.OK: PageSchema[ProductSchema],
         HTTPStatus.INTERNAL_SERVER_ERROR: ErrorSchema,
     },
 )
-def list_products_by_category(request, category_id: UUID = Query(...)):
-    products = service.list_products_by_category(category_id)
-    return [product_to_schema(product) for product in products]
+def list_products_by_category(request, category_id: UUID = Query(...), page: PageQuerySchema = Query(...)):
+    if settings.READ_PROJECTIONS_ENABLED:
+        rows = service.list_products_by_category_projection(category_id, PageRequest(page.cursor, page.limit))
+        return {"items": [product_row_to_response(row) for row in rows.items], "next_cursor": rows.next_cursor}
+
+    products = service.list_products_by_category(category_id, PageRequest(page.cursor, page.limit))
+    return PageSchema[ProductSchema](
+        items=[product_to_schema(product) for product in products.items],
+        next_cursor=products.next_cursor,
+    )
 
 
 @products_router.patch(
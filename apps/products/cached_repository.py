@@ -0,0 +1,158 @@
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.products.product_entity import Product
+from apps.products.models import ProductModel
+from apps.products.repository import ProductRepository
+from apps.products.repository_interface import ProductRepositoryInterface
+from apps.shared.cache import CacheBackend, CacheStats, build_cache_backend
+from apps.shared.database import read_from_primary
+from apps.shared.pagination import Page, PageRequest
+
+
+def invalidate_cached_products(cache: Optional[CacheBackend], product_ids: Iterable[UUID]):
+    if cache is None:
+        return
+    keys = [CachedProductRepository._key(product_id) for product_id in product_ids]
+    cache.delete_many(keys)
+    # A concurrent reader may repopulate the key with the pre-commit row before we commit.
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class CachedProductRepository(ProductRepositoryInterface):
+    """Read-through cache around a ProductRepository, invalidated on every write.
+
+    Reads issued inside a transaction.atomic() block (checkout, stock reservation) always go
+    to the database so they see the rows locked and written by that transaction. Misses are
+    loaded from the primary, as a lagging replica could re-cache a row that was just invalidated.
+    """
+
+    def __init__(self, repository: ProductRepositoryInterface, cache: CacheBackend):
+        self.repository = repository
+        self.cache = cache
+        self.stats = CacheStats()
+
+    @staticmethod
+    def _key(product_id: UUID) -> str:
+        return f"product:{product_id}"
+
+    @staticmethod
+    def _in_transaction() -> bool:
+        return transaction.get_connection().in_atomic_block
+
+    def _invalidate(self, product_ids: list[UUID]):
+        invalidate_cached_products(self.cache, product_ids)
+
+    def save(self, product: Product) -> Product:
+        saved_product = self.repository.save(product)
+        self._invalidate([saved_product.id])
+        return saved_product
+
+    def get_product_by_id(self, product_id: UUID):
+        if self._in_transaction():
+            return self.repository.get_product_by_id(product_id)
+
+        if (product := self.cache.get(self._key(product_id))) is not None:
+            self.stats.record_hits()
+            return product
+
+        self.stats.record_misses()
+        with read_from_primary():
+            product = self.repository.get_product_by_id(product_id)
+        if product:
+            self.cache.set(self._key(product_id), product)
+        return product
+
+    def get_products_by_ids(self, product_ids: list[UUID]) -> list[Product]:
+        if self._in_transaction():
+            return self.repository.get_products_by_ids(product_ids)
+
+        product_ids = set(product_ids)
+        cached = self.cache.get_many([self._key(product_id) for product_id in product_ids])
+        products = list(cached.values())
+        self.stats.record_hits(len(products))
+
+        if missing_ids := [product_id for product_id in product_ids if self._key(product_id) not in cached]:
+            self.stats.record_misses(len(missing_ids))
+            with read_from_primary():
+                loaded = self.repository.get_products_by_ids(missing_ids)
+            self.cache.set_many({self._key(product.id): product for product in loaded})
+            products.extend(loaded)
+        return products
+
+    def list_products_by_category(self, category_id: UUID, page_request: PageRequest = None) -> Page[Product]:
+        return self.repository.list_products_by_category(category_id, page_request)
+
+    def list_products_by_category_projection(self, category_id: UUID, page_request: PageRequest = None) -> Page[dict]:
+        return self.repository.list_products_by_category_projection(category_id, page_request)
+
+    def search_products(
+        self,
+        text: str,
+        limit: int,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> list[dict]:
+        return self.repository.search_products(text, limit, category_id, min_price, max_price, is_active)
+
+    def get_product_facets(
+        self,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> dict:
+        return self.repository.get_product_facets(category_id, min_price, max_price, is_active)
+
+    def update_product(self, product: Product):
+        updated_product = self.repository.update_product(product)
+        self._invalidate([product.id])
+        return updated_product
+
+    def delete_product(self, product: Product) -> None:
+        self.repository.delete_product(product)
+        self._invalidate([product.id])
+
+    def get_product_for_update(self, product_id: UUID):
+        return self.repository.get_product_for_update(product_id)
+
+    def reserve_stock_many(self, reservations: dict[UUID, int]) -> list[UUID]:
+        failed_product_ids = self.repository.reserve_stock_many(reservations)
+        self._invalidate(list(reservations))
+        return failed_product_ids
+
+
+product_cache = build_cache_backend(
+    settings.PRODUCT_CACHE_BACKEND,
+    ttl=settings.PRODUCT_CACHE_TTL,
+    max_size=settings.PRODUCT_CACHE_MAX_SIZE,
+    alias=settings.PRODUCT_CACHE_ALIAS,
+)
+
+
+def build_product_repository() -> ProductRepositoryInterface:
+    """Every router shares the same cache instance, so a write in one app invalidates reads in all."""
+    if product_cache is None:
+        return ProductRepository()
+    return CachedProductRepository(ProductRepository(), product_cache)
+
+
+def invalidate_products_of_category(category_id: UUID, product_ids: Optional[Iterable[UUID]] = None):
+    """Cached products embed their categories, so renaming or deleting one must evict them.
+
+    Deleting a category drops its product links, so that caller passes the `product_ids` read before the delete.
+    """
+    if product_ids is None:
+        product_ids = ProductModel.objects.filter(categories__id=category_id).values_list("id", flat=True)
+    invalidate_cached_products(product_cache, product_ids)
+
+
+def invalidate_products_of_owner(owner_id: UUID):
+    """Deleting a user cascades to their products outside ProductRepository."""
+    invalidate_cached_products(product_cache, ProductModel.objects.filter(owner_id=owner_id).values_list("id", flat=True))
@@ -0,0 +1,119 @@
+from bisect import bisect_right
+from collections import Counter
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Case, Count, F, Q, QuerySet, Value, When
+
+from apps.products.models import ProductFacetCountModel, ProductModel
+
+# (category_id or None for the catalogue-wide row, price bucket, is_active)
+FacetKey = tuple[Optional[UUID], int, bool]
+
+
+def price_bucket(price: Decimal, boundaries: list[Decimal] = None) -> int:
+    """Index of the bucket holding `price`: bucket i covers [boundaries[i-1], boundaries[i])."""
+    return bisect_right(settings.PRODUCT_FACET_PRICE_BOUNDARIES if boundaries is None else boundaries, price)
+
+
+def price_ranges(boundaries: list[Decimal] = None) -> list[tuple[Decimal, Optional[Decimal]]]:
+    boundaries = settings.PRODUCT_FACET_PRICE_BOUNDARIES if boundaries is None else boundaries
+    return list(zip([Decimal(0), *boundaries], [*boundaries, None]))
+
+
+def facet_keys(price: Decimal, is_active: bool, category_ids: Iterable[UUID]) -> list[FacetKey]:
+    bucket = price_bucket(price)
+    return [(None, bucket, is_active), *((category_id, bucket, is_active) for category_id in category_ids)]
+
+
+def facet_keys_for(products: QuerySet) -> list[FacetKey]:
+    """Facet keys of every product in the queryset, read with two queries."""
+    keys = []
+    buckets = {}
+    for product_id, price, is_active in products.values_list("id", "price", "is_active"):
+        buckets[product_id] = (price_bucket(price), is_active)
+        keys.append((None, *buckets[product_id]))
+    through = ProductModel.categories.through.objects.filter(productmodel_id__in=list(buckets))
+    for product_id, category_id in through.values_list("productmodel_id", "categorymodel_id"):
+        keys.append((category_id, *buckets[product_id]))
+    return keys
+
+
+def _key_filter(key: FacetKey) -> Q:
+    category_id, bucket, is_active = key
+    return Q(category_id=category_id, price_bucket=bucket, is_active=is_active)
+
+
+def apply_facet_changes(removed: list[FacetKey] = (), added: list[FacetKey] = ()) -> None:
+    """Moves product counts from the `removed` keys to the `added` ones with two queries.
+
+    Call it in the transaction that writes the products, so the counts commit (or roll back)
+    with them.
+    """
+    deltas = Counter(added)
+    deltas.subtract(removed)
+    if not (deltas := {key: delta for key, delta in deltas.items() if delta}):
+        return
+
+    ProductFacetCountModel.objects.bulk_create(
+        [
+            ProductFacetCountModel(category_id=category_id, price_bucket=bucket, is_active=is_active)
+            for category_id, bucket, is_active in deltas
+        ],
+        ignore_conflicts=True,
+    )
+    # A relative update, so concurrent writers to the same row never lose each other's changes.
+    ProductFacetCountModel.objects.filter(reduce(or_, map(_key_filter, deltas))).update(
+        product_count=F("product_count")
+        + Case(*(When(_key_filter(key), then=Value(delta)) for key, delta in deltas.items()), default=Value(0))
+    )
+
+
+def _price_bucket_expression(price_field: str, boundaries: list[Decimal]) -> Case:
+    return Case(
+        *(When(**{f"{price_field}__lt": boundary}, then=Value(index)) for index, boundary in enumerate(boundaries)),
+        default=Value(len(boundaries)),
+    )
+
+
+def rebuild_product_facets(
+    product_model=ProductModel, facet_model=ProductFacetCountModel, boundaries: list[Decimal] = None
+) -> int:
+    """Recomputes the whole summary table from the products table; returns the number of rows.
+
+    The models are parameters so the migration that creates the table can pass its historical ones.
+    """
+    boundaries = settings.PRODUCT_FACET_PRICE_BOUNDARIES if boundaries is None else boundaries
+    catalogue = product_model.objects.values("is_active", bucket=_price_bucket_expression("price", boundaries))
+    by_category = product_model.categories.through.objects.values(
+        "categorymodel_id",
+        is_active=F("productmodel__is_active"),
+        bucket=_price_bucket_expression("productmodel__price", boundaries),
+    )
+    with transaction.atomic():
+        # Writers wait for the lock, so their deltas land on the rebuilt rows instead of being lost.
+        connection = connections[facet_model.objects.db]
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {facet_model._meta.db_table} IN SHARE ROW EXCLUSIVE MODE")
+
+        rows = [
+            facet_model(category_id=None, price_bucket=row["bucket"], is_active=row["is_active"], product_count=row["count"])
+            for row in catalogue.annotate(count=Count("id")).order_by()
+        ] + [
+            facet_model(
+                category_id=row["categorymodel_id"],
+                price_bucket=row["bucket"],
+                is_active=row["is_active"],
+                product_count=row["count"],
+            )
+            for row in by_category.annotate(count=Count("id")).order_by()
+        ]
+        facet_model.objects.all().delete()
+        facet_model.objects.bulk_create(rows)
+    return len(rows)
@@ -0,0 +1,138 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from apps.categories.models import CategoryModel
+from apps.products.facets import rebuild_product_facets
+from apps.products.models import ProductModel
+from apps.products.repository import ProductRepository
+from apps.shared.database import read_from_primary
+from apps.users.models import UserModel
+
+WORDS = (
+    "notebook gamer office mochila caderno caneta cadeira mesa monitor teclado mouse fone headset "
+    "camiseta camisa calca tenis sapato bolsa relogio oculos panela frigideira faca garfo copo caneca "
+    "livro romance ficcao historia ciencia revista agenda planner lapis borracha estojo tablet celular "
+    "carregador cabo adaptador bateria lanterna barraca mochileiro bicicleta capacete luva bola chuteira "
+    "raquete skate patins brinquedo boneca carrinho quebra cabeca jogo tabuleiro cartas perfume creme "
+    "shampoo sabonete escova toalha lencol travesseiro cobertor tapete cortina luminaria abajur vaso "
+    "planta semente adubo regador martelo furadeira parafuso chave alicate serra trena nivel escada"
+).split()
+ADJECTIVES = "pro max mini ultra leve premium basico compacto portatil resistente azul preto branco vermelho verde".split()
+OWNER_EMAIL = "product-search-benchmark@example.com"
+
+
+def percentile(timings: list[float], fraction: float) -> float:
+    return sorted(timings)[min(len(timings) - 1, int(len(timings) * fraction))] * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds synthetic products into a separate test database and reports /products/search "
+        "latency percentiles against a naive icontains scan. The test database is dropped "
+        "unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=1_000_000)
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--baseline-queries", type=int, default=20)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--keep", action="store_true", help="Keep the test database and its products")
+
+    def handle(self, *args, **options):
+        # The seed bypasses ProductRepository, so it never touches the configured database:
+        # it goes to the same "test_" database the test runner creates (reused with --keep).
+        database_name = connection.settings_dict["NAME"]
+        test_database_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keep"])
+        self.stdout.write(f"Using test database {test_database_name}")
+        try:
+            # Reads stay on the test database instead of going to the configured replica.
+            with read_from_primary():
+                self._benchmark(options)
+        finally:
+            connection.creation.destroy_test_db(database_name, verbosity=0, keepdb=options["keep"])
+
+    def _benchmark(self, options):
+        rng = random.Random(options["seed"])
+        categories = self._seed(options["products"], options["batch_size"], rng)
+        if options["keep"]:
+            # Keeps the facet counts of the kept database in sync with the seeded products.
+            rebuild_product_facets()
+        queries = [self._random_query(rng, categories) for _ in range(options["queries"])]
+        repository = ProductRepository()
+        self._report("search", [self._time(repository.search_products, *query) for query in queries])
+        self._report(
+            "icontains baseline",
+            [self._time(self._icontains, *query) for query in queries[: options["baseline_queries"]]],
+        )
+
+    def _seed(self, count: int, batch_size: int, rng: random.Random):
+        UserModel.objects.filter(email=OWNER_EMAIL).delete()
+        CategoryModel.objects.filter(name__startswith="benchmark-").delete()
+        owner = UserModel.objects.create(name="Benchmark", email=OWNER_EMAIL, password="!", username=None)
+        categories = CategoryModel.objects.bulk_create(
+            CategoryModel(name=f"benchmark-{index}", description="") for index in range(20)
+        )
+        through = ProductModel.categories.through
+
+        start = time.perf_counter()
+        for offset in range(0, count, batch_size):
+            products = ProductModel.objects.bulk_create(
+                ProductModel(
+                    title=" ".join(rng.sample(WORDS, 2) + [rng.choice(ADJECTIVES)]).capitalize(),
+                    description=" ".join(rng.choices(WORDS + ADJECTIVES, k=12)),
+                    price=Decimal(rng.randint(100, 500_000)) / 100,
+                    stock=rng.randint(0, 100),
+                    owner=owner,
+                    is_active=rng.random() > 0.1,
+                )
+                for _ in range(min(batch_size, count - offset))
+            )
+            through.objects.bulk_create(
+                through(productmodel_id=product.id, categorymodel_id=rng.choice(categories).id) for product in products
+            )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE products")
+        self.stdout.write(f"Seeded {count} products in {time.perf_counter() - start:.1f}s")
+        return categories
+
+    @staticmethod
+    def _random_query(rng: random.Random, categories: list):
+        words = rng.sample(WORDS, rng.choice((1, 1, 2)))
+        text = " ".join(word[: rng.randint(3, len(word))] for word in words)
+        category_id = rng.choice(categories).id if rng.random() < 0.3 else None
+        min_price = Decimal(rng.randint(0, 1000)) if rng.random() < 0.3 else None
+        max_price = min_price + 2000 if min_price is not None else None
+        return text, 20, category_id, min_price, max_price, True
+
+    @staticmethod
+    def _icontains(text, limit, category_id, min_price, max_price, is_active):
+        queryset = ProductModel.objects.filter(is_active=is_active)
+        for term in text.split():
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        if category_id:
+            queryset = queryset.filter(categories__id=category_id)
+        if min_price is not None:
+            queryset = queryset.filter(price__gte=min_price, price__lte=max_price)
+        return list(queryset.order_by("id").values("id", "title")[:limit])
+
+    @staticmethod
+    def _time(function, *args) -> float:
+        start = time.perf_counter()
+        function(*args)
+        return time.perf_counter() - start
+
+    def _report(self, name: str, timings: list[float]):
+        self.stdout.write(
+            f"{name}: {len(timings)} queries, p50 {percentile(timings, 0.5):.1f} ms, "
+            f"p95 {percentile(timings, 0.95):.1f} ms, p99 {percentile(timings, 0.99):.1f} ms, "
+            f"mean {statistics.mean(timings) * 1000:.1f} ms"
+        )
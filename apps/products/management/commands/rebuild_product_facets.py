@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.products.facets import rebuild_product_facets
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the product facet counts from the products table. Run it after changing "
+        "PRODUCT_FACET_PRICE_BOUNDARIES or after writing products outside ProductRepository."
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_product_facets()
+        self.stdout.write(self.style.SUCCESS(f"{rows} product facet rows rebuilt"))
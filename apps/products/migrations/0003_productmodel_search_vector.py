@@ -0,0 +1,40 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations
+
+# The search vector is a stored generated column, so PostgreSQL keeps it in sync with title and
+# description on every write; it is not a model field and the ORM never reads or writes it.
+CREATE_SEARCH_VECTOR = """
+ALTER TABLE products ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+) STORED;
+CREATE INDEX products_search_vector_idx ON products USING gin (search_vector);
+"""
+
+DROP_SEARCH_VECTOR = """
+DROP INDEX IF EXISTS products_search_vector_idx;
+ALTER TABLE products DROP COLUMN IF EXISTS search_vector;
+"""
+
+
+def create_search_vector(apps, schema_editor):
+    # Other databases (SQLite test runs) search through the in-process index in apps.products.search.
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SEARCH_VECTOR)
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH_VECTOR)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0002_alter_productmodel_table"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.14 on 2026-10-18 10:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_product_facets(apps, schema_editor):
+    from apps.products.facets import rebuild_product_facets
+
+    rebuild_product_facets(apps.get_model("products", "ProductModel"), apps.get_model("products", "ProductFacetCountModel"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0002_categorymodel_categories_created_idx"),
+        ("products", "0003_productmodel_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductFacetCountModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("price_bucket", models.PositiveSmallIntegerField()),
+                ("is_active", models.BooleanField()),
+                ("product_count", models.IntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="categories.categorymodel",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "product_facet_counts",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="productfacetcountmodel",
+            constraint=models.UniqueConstraint(
+                fields=("category", "price_bucket", "is_active"), name="unique_product_facet_category"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productfacetcountmodel",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("category__isnull", True)),
+                fields=("price_bucket", "is_active"),
+                name="unique_product_facet_catalogue",
+            ),
+        ),
+        migrations.RunPython(populate_product_facets, migrations.RunPython.noop),
+    ]
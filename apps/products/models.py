@@ -15,3 +15,30 @@ class ProductModel(models.Model):
 
     class Meta:
         db_table = "products"
+
+
+class ProductFacetCountModel(models.Model):
+    """Precomputed product counts per (category, price bucket, is_active), kept by ProductRepository.
+
+    Rows without a category count every product once, so price facets do not double count
+    products listed in several categories.
+    """
+
+    category = models.ForeignKey("categories.CategoryModel", on_delete=models.CASCADE, null=True, related_name="+")
+    price_bucket = models.PositiveSmallIntegerField()
+    is_active = models.BooleanField()
+    product_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "product_facet_counts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "price_bucket", "is_active"], name="unique_product_facet_category"
+            ),
+            # NULLs are distinct in unique constraints, so the catalogue-wide rows need their own.
+            models.UniqueConstraint(
+                fields=["price_bucket", "is_active"],
+                condition=models.Q(category__isnull=True),
+                name="unique_product_facet_catalogue",
+            ),
+        ]
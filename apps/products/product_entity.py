@@ -7,6 +7,20 @@ from apps.categories.entity import Category
 from apps.shared.exceptions import OutOfStockError
 
 class Product:
+    __slots__ = (
+        "_id",
+        "_title",
+        "_description",
+        "_price",
+        "_stock",
+        "_owner_id",
+        "_categories",
+        "_is_active",
+        "_created_at",
+        "_updated_at",
+        "_changed_fields",
+    )
+
     def __init__(
         self,
         title: Title,
@@ -30,6 +44,7 @@ class Product:
         self._is_active = is_active if is_active is not None else True
         self._created_at = created_at
         self._updated_at = updated_at
+        self._changed_fields: set[str] = set()
 
     @property
     def id(self):
@@ -70,31 +85,46 @@ class Product:
     @property
     def updated_at(self):
         return self._updated_at
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        return frozenset(self._changed_fields)
+
+    def clear_changes(self):
+        self._changed_fields.clear()
     
 
     def change_title(self, new_title: str):
         self._title = Title(new_title)
+        self._changed_fields.add("title")
     
     def change_description(self, new_description: str):
         self._description = Description(new_description)
+        self._changed_fields.add("description")
     
     def change_price(self, new_price: str):
         self._price = Price(new_price)
+        self._changed_fields.add("price")
     
     def reserve_stock(self, reserved_quantity: int):
         remaining_quantity = self._stock.value - reserved_quantity        
         if remaining_quantity < 0:
             raise OutOfStockError("Out of stock product")
         self._stock = Stock(remaining_quantity)
+        self._changed_fields.add("stock")
     
     def release_stock(self, released_quantity: int):
         self._stock = Stock(self._stock.value + released_quantity)
+        self._changed_fields.add("stock")
     
     def change_categories(self, new_categories: list[Category]):
         self._categories = new_categories
+        self._changed_fields.add("categories")
     
     def activate(self):
         self._is_active = True
+        self._changed_fields.add("is_active")
     
     def deactivate(self):
         self._is_active = False
+        self._changed_fields.add("is_active")
@@ -1,62 +1,235 @@
+from collections import defaultdict
+from contextlib import nullcontext
+from decimal import Decimal
+from typing import Optional
 from uuid import UUID
+from django.db import connections, transaction
+from django.db.models import BooleanField, F, FloatField, Q, Sum
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
 from apps.products.repository_interface import ProductRepositoryInterface
 from apps.products.product_entity import Product
-from apps.products.models import ProductModel
+from apps.products.facets import apply_facet_changes, facet_keys, facet_keys_for, price_bucket, price_ranges
+from apps.products.models import ProductFacetCountModel, ProductModel
 from apps.users.models import UserModel
 from apps.products.serializers import product_model_to_entity
+from apps.products.search import prefix_tsquery, product_search_filters, search_index, search_terms
+from apps.shared.pagination import Page, PageRequest, paginate_queryset
+from apps.shared.database import read_only_method
+
+# Columns ProductSchema needs; categories are attached separately.
+PRODUCT_PROJECTION = ("id", "title", "description", "price", "stock", "owner_id", "is_active", "created_at", "updated_at")
+
+
+def attach_categories(rows: list[dict]) -> list[dict]:
+    """Adds each projected product's categories with a single through-table query."""
+    categories = defaultdict(list)
+    product_categories = (
+        ProductModel.categories.through.objects.filter(productmodel_id__in=[row["id"] for row in rows])
+        .order_by("categorymodel_id")
+        .values_list("productmodel_id", "categorymodel_id", "categorymodel__name", "categorymodel__description")
+    )
+    for product_id, category_id, name, description in product_categories:
+        categories[product_id].append({"id": category_id, "name": name, "description": description})
+
+    for row in rows:
+        row["categories"] = categories[row["id"]]
+    return rows
 
 class ProductRepository(ProductRepositoryInterface):
     def save(self, product: Product) -> Product:
-        saved_product = ProductModel.objects.create(
-            id=product.id,
-            title=product.title.value,
-            description=product.description.value,
-            price=product.price.value,
-            stock=product.stock.value,
-            owner=UserModel.objects.get(id=product.owner_id),
-            is_active=product.is_active
-        )
+        category_ids = [category.id for category in product.categories]
+        with transaction.atomic():
+            saved_product = ProductModel.objects.create(
+                id=product.id,
+                title=product.title.value,
+                description=product.description.value,
+                price=product.price.value,
+                stock=product.stock.value,
+                owner=UserModel.objects.get(id=product.owner_id),
+                is_active=product.is_active
+            )
 
-        if len(product.categories) > 0:
-            saved_product.categories.set([category.id for category in product.categories])
+            if len(product.categories) > 0:
+                saved_product.categories.set(category_ids)
+            apply_facet_changes(added=facet_keys(saved_product.price, saved_product.is_active, category_ids))
 
         return product_model_to_entity(saved_product)
     
+    @read_only_method
     def get_product_by_id(self, product_id: UUID):
         if not (product_data:=ProductModel.objects.filter(id=product_id).first()):
             return None
         return product_model_to_entity(product_data)
-    
-    def list_products_by_category(self, category_id: UUID):
-        products_data = ProductModel.objects.filter(categories__id=category_id).prefetch_related("categories").distinct()
+
+    @read_only_method
+    def get_products_by_ids(self, product_ids: list[UUID]) -> list[Product]:
+        products_data = ProductModel.objects.filter(id__in=set(product_ids)).prefetch_related("categories")
         return [
             product_model_to_entity(product_data)
             for product_data in products_data
         ]
     
+    @read_only_method
+    def list_products_by_category(self, category_id: UUID, page_request: PageRequest = None) -> Page[Product]:
+        products_data, next_cursor = paginate_queryset(
+            ProductModel.objects.filter(categories__id=category_id).prefetch_related("categories").distinct(),
+            page_request,
+        )
+        products = [
+            product_model_to_entity(product_data)
+            for product_data in products_data
+        ]
+        return Page(products, next_cursor)
+
+    @read_only_method
+    def list_products_by_category_projection(self, category_id: UUID, page_request: PageRequest = None) -> Page[dict]:
+        rows, next_cursor = paginate_queryset(
+            ProductModel.objects.filter(categories__id=category_id).distinct().values(*PRODUCT_PROJECTION),
+            page_request,
+        )
+        return Page(attach_categories(rows), next_cursor)
+
+    @read_only_method
+    def search_products(
+        self,
+        text: str,
+        limit: int,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> list[dict]:
+        if not (terms := search_terms(text)):
+            return []
+        queryset = ProductModel.objects.filter(product_search_filters(category_id, min_price, max_price, is_active))
+
+        if connections[queryset.db].vendor != "postgresql":
+            scores = search_index.search(terms, queryset.db)
+            rows = list(queryset.filter(id__in=list(scores)).values(*PRODUCT_PROJECTION))
+            rows = sorted(rows, key=lambda row: (-scores[row["id"]], row["id"]))[:limit]
+            return attach_categories(rows)
+
+        # search_vector is a stored generated column with a GIN index (see migration 0003).
+        tsquery = prefix_tsquery(terms)
+        rows = list(
+            queryset.alias(
+                matches=RawSQL("products.search_vector @@ to_tsquery('simple', %s)", (tsquery,), output_field=BooleanField())
+            )
+            .filter(matches=True)
+            .annotate(
+                rank=RawSQL("ts_rank(products.search_vector, to_tsquery('simple', %s))", (tsquery,), output_field=FloatField())
+            )
+            .order_by("-rank", "id")
+            .values(*PRODUCT_PROJECTION)[:limit]
+        )
+        return attach_categories(rows)
+    
+    @read_only_method
+    def get_product_facets(
+        self,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> dict:
+        # Category counts honour the price filter and price counts honour the category filter,
+        # so each facet shows what picking one of its values would return.
+        buckets = range(
+            price_bucket(min_price) if min_price is not None else 0,
+            price_bucket(max_price) if max_price is not None else len(price_ranges()),
+        )
+        rows = (
+            ProductFacetCountModel.objects.filter(Q(is_active=is_active) if is_active is not None else Q())
+            .filter(product_count__gt=0)
+            .values("category_id", "category__name", "price_bucket")
+            .annotate(count=Sum("product_count"))
+            .order_by()
+        )
+
+        categories = {}
+        bucket_counts = [0] * len(price_ranges())
+        for row in rows:
+            if row["category_id"] is not None and row["price_bucket"] in buckets:
+                category = categories.setdefault(row["category_id"], {"id": row["category_id"], "name": row["category__name"], "count": 0})
+                category["count"] += row["count"]
+            if row["category_id"] == category_id:
+                bucket_counts[row["price_bucket"]] += row["count"]
+
+        return {
+            "categories": sorted(categories.values(), key=lambda category: (-category["count"], category["name"])),
+            "price_ranges": [
+                {"min_price": low, "max_price": high, "count": count}
+                for (low, high), count in zip(price_ranges(), bucket_counts)
+            ],
+        }
+
     def update_product(self, product: Product):
-        product_data = ProductModel.objects.prefetch_related("categories").filter(id=product.id).first()
-        if not product_data:
+        # Stock-only writes (checkout) leave the facet counts alone and skip the savepoint.
+        updates_facets = bool(product.changed_fields & {"price", "is_active", "categories"})
+        with transaction.atomic() if updates_facets else nullcontext():
+            return self._update_product(product, updates_facets)
+
+    def _update_product(self, product: Product, updates_facets: bool):
+        products = ProductModel.objects.prefetch_related("categories")
+        # The facet delta starts from the stored row, so concurrent updates must not both read it.
+        if updates_facets:
+            products = products.select_for_update()
+        if not (product_data := products.filter(id=product.id).first()):
             return None
 
-        product_data.title = product.title.value
-        product_data.description = product.description.value
-        product_data.price = product.price.value
-        product_data.stock = product.stock.value
-        product_data.is_active = product.is_active
-        product_data.categories.set([category.id for category in product.categories])
+        columns = {
+            "title": product.title.value,
+            "description": product.description.value,
+            "price": product.price.value,
+            "stock": product.stock.value,
+            "is_active": product.is_active,
+        }
+        changed_columns = [field for field in columns if field in product.changed_fields]
+        stored_category_ids = [category.id for category in product_data.categories.all()]
+        stored_keys = facet_keys(product_data.price, product_data.is_active, stored_category_ids)
+        for field in changed_columns:
+            setattr(product_data, field, columns[field])
+
+        if "categories" in product.changed_fields:
+            product_data.categories.set([category.id for category in product.categories])
 
-        product_data.save()
+        if product.changed_fields:
+            product_data.save(update_fields=[*changed_columns, "updated_at"])
+
+        if updates_facets:
+            # Categories come from the locked row unless this update replaces them.
+            category_ids = (
+                [category.id for category in product.categories]
+                if "categories" in product.changed_fields
+                else stored_category_ids
+            )
+            apply_facet_changes(removed=stored_keys, added=facet_keys(product_data.price, product_data.is_active, category_ids))
+        product.clear_changes()
 
         return product_model_to_entity(product_data)
 
     
     def delete_product(self, product: Product) -> None:
-        if not (product_data := ProductModel.objects.filter(id=product.id).first()):
-            return None        
-        product_data.delete()
+        with transaction.atomic():
+            if not (stored_keys := facet_keys_for(ProductModel.objects.select_for_update().filter(id=product.id))):
+                return None
+            ProductModel.objects.filter(id=product.id).delete()
+            apply_facet_changes(removed=stored_keys)
 
     def get_product_for_update(self, product_id: UUID):
         if not (product_data:=ProductModel.objects.select_for_update().filter(id=product_id).first()):
             return None
-        return product_model_to_entity(product_data)
\ No newline at end of file
+        return product_model_to_entity(product_data)
+
+    def reserve_stock_many(self, reservations: dict[UUID, int]) -> list[UUID]:
+        # Sorted ids keep row-lock acquisition order stable across concurrent checkouts (no deadlocks).
+        failed_product_ids = []
+        for product_id in sorted(reservations):
+            quantity = reservations[product_id]
+            reserved = ProductModel.objects.filter(id=product_id, stock__gte=quantity).update(
+                stock=F("stock") - quantity, updated_at=timezone.now()
+            )
+            if not reserved:
+                failed_product_ids.append(product_id)
+        return failed_product_ids
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 from apps.products.product_entity import Product
+from apps.shared.pagination import Page, PageRequest
 
 class ProductRepositoryInterface(ABC):
     @abstractmethod
@@ -12,7 +15,39 @@ class ProductRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_products_by_category(self):
+    def get_products_by_ids(self, product_ids: list[UUID]) -> list[Product]:
+        pass
+
+    @abstractmethod
+    def list_products_by_category(self, category_id: UUID, page_request: PageRequest = None) -> Page[Product]:
+        pass
+
+    @abstractmethod
+    def list_products_by_category_projection(self, category_id: UUID, page_request: PageRequest = None) -> Page[dict]:
+        pass
+
+    @abstractmethod
+    def search_products(
+        self,
+        text: str,
+        limit: int,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> list[dict]:
+        """Products matching every word of `text` (as a prefix), best ranked first, as projected rows."""
+        pass
+
+    @abstractmethod
+    def get_product_facets(
+        self,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> dict:
+        """Product counts per category and per price bucket, read from the precomputed summary table."""
         pass
 
     @abstractmethod
@@ -25,4 +60,8 @@ class ProductRepositoryInterface(ABC):
 
     @abstractmethod
     def get_product_for_update(self, product_id: UUID) -> Product:
+        pass
+
+    @abstractmethod
+    def reserve_stock_many(self, reservations: dict[UUID, int]) -> list[UUID]:
         pass
\ No newline at end of file
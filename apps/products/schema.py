@@ -1,7 +1,9 @@
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 from typing import Optional
-from pydantic import BaseModel
+from django.conf import settings
+from pydantic import BaseModel, Field
 
 from apps.categories.schema import CategoryNestedSchema
 
@@ -48,4 +50,41 @@ class ProductUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 class ProductActivationSchema(BaseModel):
-    status: bool
\ No newline at end of file
+    status: bool
+
+
+class ProductSearchQuerySchema(BaseModel):
+    q: str = Field(..., min_length=1, max_length=128)
+    category_id: Optional[UUID] = None
+    min_price: Optional[Decimal] = Field(None, ge=0)
+    max_price: Optional[Decimal] = Field(None, ge=0)
+    is_active: Optional[bool] = True
+    limit: int = Field(settings.PAGINATION_DEFAULT_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE)
+
+
+class ProductSearchSchema(BaseModel):
+    items: list[ProductSchema]
+
+
+class ProductFacetsQuerySchema(BaseModel):
+    category_id: Optional[UUID] = None
+    min_price: Optional[Decimal] = Field(None, ge=0)
+    max_price: Optional[Decimal] = Field(None, gt=0)
+    is_active: Optional[bool] = True
+
+
+class CategoryFacetSchema(BaseModel):
+    id: UUID
+    name: str
+    count: int
+
+
+class PriceRangeFacetSchema(BaseModel):
+    min_price: str
+    max_price: Optional[str]
+    count: int
+
+
+class ProductFacetsSchema(BaseModel):
+    categories: list[CategoryFacetSchema]
+    price_ranges: list[PriceRangeFacetSchema]
@@ -0,0 +1,93 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from django.db.models import Count, Max, Q
+
+from apps.products.models import ProductModel
+
+# Same weights PostgreSQL's ts_rank gives to the A (title) and B (description) labels.
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+_TOKEN = re.compile(r"\w+")
+
+
+def search_terms(text: str) -> list[str]:
+    return list(dict.fromkeys(_TOKEN.findall(text.lower())))
+
+
+def prefix_tsquery(terms: list[str]) -> str:
+    """Every term must match, each one as a prefix: "note ga" -> "note:* & ga:*"."""
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def product_search_filters(
+    category_id: Optional[UUID] = None,
+    min_price: Optional[Decimal] = None,
+    max_price: Optional[Decimal] = None,
+    is_active: Optional[bool] = None,
+) -> Q:
+    filters = Q()
+    if category_id is not None:
+        filters &= Q(categories__id=category_id)
+    if min_price is not None:
+        filters &= Q(price__gte=min_price)
+    if max_price is not None:
+        filters &= Q(price__lte=max_price)
+    if is_active is not None:
+        filters &= Q(is_active=is_active)
+    return filters
+
+
+class ProductSearchIndex:
+    """In-process inverted index over product titles and descriptions.
+
+    Fallback for databases without full-text search (SQLite test runs). It is rebuilt when the
+    products table changes, detected through its row count and latest updated_at.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._postings: dict[str, dict[UUID, float]] = {}
+        self._tokens: list[str] = []
+
+    def _refresh(self, using: str):
+        version = ProductModel.objects.using(using).aggregate(count=Count("id"), updated_at=Max("updated_at"))
+        with self._lock:
+            if version == self._version:
+                return
+            postings = defaultdict(lambda: defaultdict(float))
+            rows = ProductModel.objects.using(using).values_list("id", "title", "description").iterator()
+            for product_id, title, description in rows:
+                for token in _TOKEN.findall(title.lower()):
+                    postings[token][product_id] += TITLE_WEIGHT
+                for token in _TOKEN.findall(description.lower()):
+                    postings[token][product_id] += DESCRIPTION_WEIGHT
+            self._postings = {token: dict(products) for token, products in postings.items()}
+            self._tokens = sorted(self._postings)
+            self._version = version
+
+    def search(self, terms: list[str], using: str = "default") -> dict[UUID, float]:
+        """Scores of the products where every term prefixes a title or description word."""
+        self._refresh(using)
+        scores: Optional[dict[UUID, float]] = None
+        for term in terms:
+            matches = defaultdict(float)
+            position = bisect_left(self._tokens, term)
+            while position < len(self._tokens) and self._tokens[position].startswith(term):
+                for product_id, weight in self._postings[self._tokens[position]].items():
+                    matches[product_id] += weight
+                position += 1
+            scores = matches if scores is None else {
+                product_id: scores[product_id] + weight for product_id, weight in matches.items() if product_id in scores
+            }
+        return scores or {}
+
+
+search_index = ProductSearchIndex()
@@ -30,15 +30,38 @@ def product_to_nested_schema(product: Product) -> ProductNestedSchema:
             categories=[ category_to_nested_schema(category) for category in product.categories ]
     )
 
+def product_row_to_response(row: dict) -> dict:
+    return {**row, "price": str(row["price"])}
+
+def product_facets_to_response(facets: dict) -> dict:
+    return {
+        "categories": facets["categories"],
+        "price_ranges": [
+            {
+                "min_price": f"{price_range['min_price']:.2f}",
+                "max_price": f"{price_range['max_price']:.2f}" if price_range["max_price"] is not None else None,
+                "count": price_range["count"],
+            }
+            for price_range in facets["price_ranges"]
+        ],
+    }
+
+def _category_models_of(product_model: ProductModel):
+    # Categories are listed by id, the same order attach_categories gives the read projections.
+    # Reading the prefetch cache directly skips building a related manager and a queryset per product.
+    if (prefetched := getattr(product_model, "_prefetched_objects_cache", {}).get("categories")) is not None:
+        return sorted(prefetched, key=lambda category: category.id)
+    return product_model.categories.order_by("id")
+
 def product_model_to_entity(product_model: ProductModel) -> Product:
     return Product(
             id=product_model.id,
-            title=Title(product_model.title),
-            description=Description(product_model.description),
-            price=Price(product_model.price),
-            stock=Stock(product_model.stock),
-            owner_id=product_model.owner.id,
-            categories=[ category_model_to_entity(c) for c in product_model.categories.all() ],
+            title=Title.from_persistence(product_model.title),
+            description=Description.from_persistence(product_model.description),
+            price=Price.from_persistence(product_model.price),
+            stock=Stock.from_persistence(product_model.stock),
+            owner_id=product_model.owner_id,
+            categories=[ category_model_to_entity(c) for c in _category_models_of(product_model) ],
             is_active=product_model.is_active,
             created_at=product_model.created_at,
             updated_at=product_model.updated_at
@@ -1,13 +1,19 @@
 import logging
+from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 
+from django.conf import settings
+from django.db import transaction
+
 from apps.products.product_entity import Product
 from apps.products.repository_interface import ProductRepositoryInterface
 from apps.products.schema import ProductActivationSchema, ProductUpdateSchema
-from apps.shared.exceptions import NotFoundError
+from apps.shared.exceptions import NotFoundError, OutOfStockError, UnprocessableEntityError
+from apps.shared.pagination import Page, PageRequest
 from apps.shared.value_objects import Description, Price, Stock, Title
 from apps.categories.service import CategoryService
-from apps.categories.repository import CategoryRepository
+from apps.categories.cached_repository import build_category_repository
 from apps.users.service import UserService
 from apps.users.repository import UserRepository
 from utils.logger import configure_logger
@@ -18,7 +24,7 @@ class ProductService:
     def __init__(self, repository:ProductRepositoryInterface, logger: logging.Logger, category_service: CategoryService = None, user_service: UserService = None):
         self.repository = repository
         self.logger = logger
-        self.category_service = category_service or CategoryService(CategoryRepository(), logger)
+        self.category_service = category_service or CategoryService(build_category_repository(), logger)
         self.user_service = user_service or UserService(UserRepository(), logger)
 
     def create_product(
@@ -36,7 +42,7 @@ class ProductService:
         price = Price(price)
         stock = Stock(stock)
         owner_id = user.id
-        categories = [self.category_service.get_category_by_id(uuid) for uuid in categories_ids]
+        categories = self.category_service.get_categories_by_ids(categories_ids)
         
         product = Product(
             title,
@@ -56,10 +62,51 @@ class ProductService:
             self.logger.warning(f"Product with id {product_id} not found")
             raise NotFoundError(f"Product with id {product_id} not found")
         return product
+
+    def get_products_by_ids(self, product_ids: list[UUID]) -> list[Product]:
+        products = self.repository.get_products_by_ids(product_ids)
+        found_ids = {product.id for product in products}
+        if missing_ids := [str(product_id) for product_id in product_ids if product_id not in found_ids]:
+            self.logger.warning(f"Products with ids {', '.join(missing_ids)} not found")
+            raise NotFoundError(f"Products with ids {', '.join(missing_ids)} not found")
+        return products
     
-    def list_products_by_category(self, category_id: UUID) -> list[Product]:
-        return self.repository.list_products_by_category(category_id)
+    def list_products_by_category(self, category_id: UUID, page_request: PageRequest = None) -> Page[Product]:
+        return self.repository.list_products_by_category(category_id, page_request)
+
+    def list_products_by_category_projection(self, category_id: UUID, page_request: PageRequest = None) -> Page[dict]:
+        return self.repository.list_products_by_category_projection(category_id, page_request)
     
+    def search_products(
+        self,
+        text: str,
+        limit: int,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> list[dict]:
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise UnprocessableEntityError("min_price cannot be greater than max_price")
+        return self.repository.search_products(text, limit, category_id, min_price, max_price, is_active)
+
+    def get_product_facets(
+        self,
+        category_id: Optional[UUID] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        is_active: Optional[bool] = None,
+    ) -> dict:
+        # Counts are stored per price bucket, so a price filter can only start or end on a bucket boundary.
+        boundaries = settings.PRODUCT_FACET_PRICE_BOUNDARIES
+        if min_price is not None and min_price != 0 and min_price not in boundaries:
+            raise UnprocessableEntityError(f"min_price must be 0 or one of {', '.join(map(str, boundaries))}")
+        if max_price is not None and max_price not in boundaries:
+            raise UnprocessableEntityError(f"max_price must be one of {', '.join(map(str, boundaries))}")
+        if min_price is not None and max_price is not None and min_price >= max_price:
+            raise UnprocessableEntityError("min_price must be lower than max_price")
+        return self.repository.get_product_facets(category_id, min_price, max_price, is_active)
+
     def update_product(self, product_id: UUID, payload: ProductUpdateSchema) -> Product:        
         if not (product := self.repository.get_product_by_id(product_id)):
             self.logger.warning(f"Can't update Product with id {product_id}. Product not found")
@@ -69,7 +116,7 @@ class ProductService:
 
         if "categories" in payload_data:
             category_ids = payload_data.pop("categories")
-            categories = [self.category_service.get_category_by_id(cid) for cid in category_ids]
+            categories = self.category_service.get_categories_by_ids(category_ids)
             product.change_categories(categories)
 
         operations = {
@@ -116,6 +163,19 @@ class ProductService:
         product.reserve_stock(reserved_quantity)
         self.repository.update_product(product)
         return product
+
+    def reserve_stock_many(self, reservations: dict[UUID, int]) -> None:
+        with transaction.atomic():
+            if failed_product_ids := self.repository.reserve_stock_many(reservations):
+                # The conditional update also fails for products deleted since they were added to the cart.
+                existing_ids = {product.id for product in self.repository.get_products_by_ids(failed_product_ids)}
+                if missing_ids := [product_id for product_id in failed_product_ids if product_id not in existing_ids]:
+                    missing = ", ".join(str(product_id) for product_id in missing_ids)
+                    self.logger.warning(f"Stock reservation aborted. Products not found: {missing}")
+                    raise NotFoundError(f"Products not found: {missing}")
+                failed_ids = ", ".join(str(product_id) for product_id in failed_product_ids)
+                self.logger.warning(f"Stock reservation aborted. Out of stock products: {failed_ids}")
+                raise OutOfStockError(f"Out of stock products: {failed_ids}")
     
     
     def release_stock(self, product_id: UUID, released_quantity: int):
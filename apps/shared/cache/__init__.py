@@ -0,0 +1,11 @@
+from .backends import CacheBackend, LocalMemoryCache, DjangoCache, build_cache_backend, is_shared_cache
+from .stats import CacheStats
+
+__all__ = [
+    "CacheBackend",
+    "LocalMemoryCache",
+    "DjangoCache",
+    "build_cache_backend",
+    "is_shared_cache",
+    "CacheStats",
+]
@@ -0,0 +1,153 @@
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def set_many(self, values: dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Stores the value only if the key is absent; returns whether it was stored."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class LocalMemoryCache(CacheBackend):
+    """Per-process LRU with TTL. Values are pickled so callers never share a mutable instance."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if not (entry := self._entries.get(key)):
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(payload)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        return {key: value for key in keys if (value := self.get(key)) is not None}
+
+    def set(self, key: str, value: Any) -> None:
+        payload = pickle.dumps(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def set_many(self, values: dict[str, Any]) -> None:
+        for key, value in values.items():
+            self.set(key, value)
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        payload = pickle.dumps(value)
+        with self._lock:
+            if (entry := self._entries.get(key)) and entry[0] > time.monotonic():
+                return False
+            self._entries[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return True
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DjangoCache(CacheBackend):
+    """Delegates to a Django cache alias (locmem, Redis...) so entries are shared across workers."""
+
+    def __init__(self, alias: str = "default", ttl: float = 60, key_prefix: str = ""):
+        self._alias = alias
+        self._ttl = ttl
+        self._key_prefix = key_prefix
+
+    @property
+    def _cache(self):
+        return caches[self._alias]
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(self._key(key))
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = {self._key(key): key for key in keys}
+        return {keys[key]: value for key, value in self._cache.get_many(list(keys)).items()}
+
+    def set(self, key: str, value: Any) -> None:
+        self._cache.set(self._key(key), value, self._ttl)
+
+    def set_many(self, values: dict[str, Any]) -> None:
+        self._cache.set_many({self._key(key): value for key, value in values.items()}, self._ttl)
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        return self._cache.add(self._key(key), value, self._ttl if ttl is None else ttl)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        self._cache.delete_many([self._key(key) for key in keys])
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+def is_shared_cache(alias: str) -> bool:
+    """Whether every worker process sees the same entries (Redis, memcached, database, file)."""
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def build_cache_backend(backend: str, ttl: float, max_size: int = 1024, alias: str = "default", key_prefix: str = "") -> Optional[CacheBackend]:
+    if backend == "none":
+        return None
+    if backend == "locmem":
+        return LocalMemoryCache(max_size=max_size, ttl=ttl)
+    if backend == "django":
+        return DjangoCache(alias=alias, ttl=ttl, key_prefix=key_prefix)
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,29 @@
+import threading
+
+
+class CacheStats:
+    def __init__(self):
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def record_hits(self, count: int = 1):
+        with self._lock:
+            self._hits += count
+
+    def record_misses(self, count: int = 1):
+        with self._lock:
+            self._misses += count
+
+    def reset(self):
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,17 @@
+from .routing import (
+    PrimaryReplicaRouter,
+    REPLICA_DB_ALIAS,
+    read_from_primary,
+    read_only,
+    read_only_method,
+    replica_pinning_middleware,
+)
+
+__all__ = [
+    "PrimaryReplicaRouter",
+    "REPLICA_DB_ALIAS",
+    "read_from_primary",
+    "read_only",
+    "read_only_method",
+    "replica_pinning_middleware",
+]
@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = "replica"
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+_primary_only: ContextVar[bool] = ContextVar("primary_only", default=False)
+
+
+@contextmanager
+def read_only():
+    """Marks the reads issued inside the block as safe to serve from the replica."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+@contextmanager
+def read_from_primary():
+    """Sends every read inside the block to the primary, read-only methods included.
+
+    Cache fills use it: a lagging replica would put the pre-write row back in the cache.
+    """
+    token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+def read_only_method(method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with read_only():
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    """Sends reads marked read-only to the replica; everything else stays on the primary.
+
+    Reads go to the primary when inside transaction.atomic() or after a write in the same
+    request (read-your-writes), see `replica_pinning_middleware`.
+    """
+
+    def db_for_read(self, model, **hints):
+        if (
+            not _read_only.get()
+            or _pinned_to_primary.get()
+            or _primary_only.get()
+            or REPLICA_DB_ALIAS not in connections.settings
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _pinned_to_primary.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+def replica_pinning_middleware(get_response):
+    """Scopes read-your-writes pinning to a single request."""
+
+    def middleware(request):
+        token = _pinned_to_primary.set(False)
+        try:
+            return get_response(request)
+        finally:
+            _pinned_to_primary.reset(token)
+
+    return middleware
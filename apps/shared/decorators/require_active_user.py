@@ -1,19 +1,25 @@
-from apps.users.models import UserModel
+from functools import wraps
 from http import HTTPStatus
+
 from ninja.errors import HttpError
 
+from apps.users.activity import user_activity
+
+
 def require_active_user(view_func):
+    @wraps(view_func)
     def wrapper(request, *args, **kwargs):
         try:
-            user_id = request.user["id"]
-            user = UserModel.objects.get(id=user_id)
+            is_active = user_activity.is_active(request.auth["user_id"])
         except Exception:
             raise HttpError(HTTPStatus.UNAUTHORIZED, "User does not exist")
-        
-        if not user.is_active:
+
+        if is_active is None:
+            raise HttpError(HTTPStatus.UNAUTHORIZED, "User does not exist")
+
+        if not is_active:
             raise HttpError(HTTPStatus.UNAUTHORIZED, "User is inactive")
-        
+
         return view_func(request, *args, **kwargs)
-    
+
     return wrapper
-        
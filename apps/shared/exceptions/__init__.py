@@ -1,3 +1,3 @@
-from .exceptions import UnauthorizedError, NotFoundError, ConflictError, UnprocessableEntityError, OutOfStockError
+from .exceptions import UnauthorizedError, NotFoundError, ConflictError, UnprocessableEntityError, OutOfStockError, ServiceUnavailableError
 
-__all__ = [UnauthorizedError, NotFoundError, ConflictError, UnprocessableEntityError, OutOfStockError]
\ No newline at end of file
+__all__ = [UnauthorizedError, NotFoundError, ConflictError, UnprocessableEntityError, OutOfStockError, ServiceUnavailableError]
\ No newline at end of file
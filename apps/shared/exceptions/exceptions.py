@@ -16,3 +16,6 @@ class UnprocessableEntityError(DomainError):
 
 class OutOfStockError(DomainError):
     pass
+
+class ServiceUnavailableError(DomainError):
+    pass
@@ -0,0 +1,16 @@
+from .page import Page, PageRequest
+from .cursor import encode_cursor, decode_cursor
+from .queryset import paginate_queryset
+from .sequence import paginate_sequence
+from .schema import PageSchema, PageQuerySchema
+
+__all__ = [
+    "Page",
+    "PageRequest",
+    "encode_cursor",
+    "decode_cursor",
+    "paginate_queryset",
+    "paginate_sequence",
+    "PageSchema",
+    "PageQuerySchema",
+]
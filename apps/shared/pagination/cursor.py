@@ -0,0 +1,20 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+
+from apps.shared.exceptions import UnprocessableEntityError
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(id)]).encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(urlsafe_b64decode(cursor + padding))
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, TypeError) as exc:
+        raise UnprocessableEntityError("Invalid pagination cursor") from exc
@@ -0,0 +1,40 @@
+from typing import Callable, Generic, Optional, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class PageRequest:
+    def __init__(self, cursor: Optional[str] = None, limit: Optional[int] = None):
+        self._cursor = cursor or None
+        self._limit = min(
+            limit or settings.PAGINATION_DEFAULT_PAGE_SIZE,
+            settings.PAGINATION_MAX_PAGE_SIZE,
+        )
+
+    @property
+    def cursor(self) -> Optional[str]:
+        return self._cursor
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+
+class Page(Generic[T]):
+    def __init__(self, items: list[T], next_cursor: Optional[str] = None):
+        self._items = items
+        self._next_cursor = next_cursor
+
+    @property
+    def items(self) -> list[T]:
+        return self._items
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        return self._next_cursor
+
+    def map(self, func: Callable[[T], R]) -> "Page[R]":
+        return Page([func(item) for item in self._items], self._next_cursor)
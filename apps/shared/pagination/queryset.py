@@ -0,0 +1,30 @@
+from typing import Optional, Union
+
+from django.db.models import Model, Q, QuerySet
+
+from apps.shared.pagination.cursor import decode_cursor, encode_cursor
+from apps.shared.pagination.page import PageRequest
+
+
+def paginate_queryset(
+    queryset: QuerySet, page_request: Optional[PageRequest] = None
+) -> tuple[list[Union[Model, dict]], Optional[str]]:
+    """Keyset pagination over (created_at, id): only the rows of the requested page are fetched.
+
+    Also accepts `.values()` querysets, as long as they select created_at and id.
+    """
+    page_request = page_request or PageRequest()
+    queryset = queryset.order_by("created_at", "id")
+
+    if page_request.cursor:
+        created_at, last_id = decode_cursor(page_request.cursor)
+        queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=last_id))
+
+    rows = list(queryset[: page_request.limit + 1])
+    if len(rows) <= page_request.limit:
+        return rows, None
+
+    rows = rows[: page_request.limit]
+    if isinstance(last := rows[-1], dict):
+        return rows, encode_cursor(last["created_at"], last["id"])
+    return rows, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,16 @@
+from typing import Generic, Optional, TypeVar
+
+from django.conf import settings
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class PageSchema(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+class PageQuerySchema(BaseModel):
+    cursor: Optional[str] = None
+    limit: int = Field(settings.PAGINATION_DEFAULT_PAGE_SIZE, ge=1, le=settings.PAGINATION_MAX_PAGE_SIZE)
@@ -0,0 +1,22 @@
+from typing import Optional, Sequence, TypeVar
+
+from apps.shared.pagination.cursor import decode_cursor, encode_cursor
+from apps.shared.pagination.page import PageRequest
+
+T = TypeVar("T")
+
+
+def paginate_sequence(items: Sequence[T], page_request: Optional[PageRequest] = None) -> tuple[list[T], Optional[str]]:
+    """Same keyset contract as paginate_queryset, for entities already held in memory."""
+    page_request = page_request or PageRequest()
+    items = sorted(items, key=lambda item: (item.created_at, item.id))
+
+    if page_request.cursor:
+        last_key = decode_cursor(page_request.cursor)
+        items = [item for item in items if (item.created_at, item.id) > last_key]
+
+    if len(items) <= page_request.limit:
+        return items, None
+
+    items = items[: page_request.limit]
+    return items, encode_cursor(items[-1].created_at, items[-1].id)
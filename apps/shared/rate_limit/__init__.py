@@ -0,0 +1,6 @@
+from .limiter import RateLimitStats, SlidingWindowRateLimiter
+
+__all__ = [
+    "RateLimitStats",
+    "SlidingWindowRateLimiter",
+]
@@ -0,0 +1,74 @@
+import hashlib
+import threading
+import time
+
+from django.core.cache import caches
+
+
+class RateLimitStats:
+    def __init__(self):
+        self._allowed = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def allowed(self) -> int:
+        return self._allowed
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    def record(self, allowed: bool):
+        with self._lock:
+            if allowed:
+                self._allowed += 1
+            else:
+                self._rejected += 1
+
+    def as_dict(self) -> dict:
+        return {"allowed": self._allowed, "rejected": self._rejected}
+
+    def reset(self):
+        with self._lock:
+            self._allowed = 0
+            self._rejected = 0
+
+
+class SlidingWindowRateLimiter:
+    """Allows `limit` hits per identifier in any `window` seconds, counted in a Django cache.
+
+    Uses the sliding-window counter approximation: the previous fixed window's count is weighted
+    by the fraction of it that still overlaps the sliding window. Each hit is a cache add + incr,
+    which are atomic on Redis and locmem.
+    """
+
+    def __init__(self, scope: str, limit: int, window: int, cache_alias: str = "default"):
+        self.scope = scope
+        self.limit = limit
+        self.window = window
+        self.cache_alias = cache_alias
+        self.stats = RateLimitStats()
+
+    def _key(self, identifier: str, window_index: int) -> str:
+        # Hashed so e-mails and IPs don't end up in cache keys.
+        digest = hashlib.sha256(identifier.encode()).hexdigest()[:32]
+        return f"rate-limit:{self.scope}:{digest}:{window_index}"
+
+    def hit(self, identifier: str) -> bool:
+        """Counts an attempt for `identifier` and returns whether it is within the limit."""
+        cache = caches[self.cache_alias]
+        window_index, elapsed = divmod(time.time(), self.window)
+        current_key = self._key(identifier, int(window_index))
+
+        cache.add(current_key, 0, timeout=self.window * 2)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:  # expired between add and incr
+            cache.set(current_key, 1, timeout=self.window * 2)
+            current = 1
+        previous = cache.get(self._key(identifier, int(window_index) - 1), 0)
+
+        allowed = previous * (1 - elapsed / self.window) + current <= self.limit
+        self.stats.record(allowed)
+        return allowed
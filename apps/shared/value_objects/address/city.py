@@ -2,6 +2,8 @@ from apps.shared.value_objects.base import StringVO
 import re
 
 class City(StringVO):
+    __slots__ = ()
+
     def _validate(self):
         if not isinstance(self.value, str):
             raise ValueError("Nome da cidade deve ser uma string")
@@ -1,5 +1,7 @@
 from apps.shared.value_objects.base import StringVO
 class Complement(StringVO):
+    __slots__ = ()
+
     def _validate(self):
         if not len(self.value.strip()) > 0:
             raise ValueError("Complement can not be empty.")
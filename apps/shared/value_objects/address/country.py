@@ -2,6 +2,8 @@ import re
 from apps.shared.value_objects.base import StringVO
 
 class Country(StringVO):
+    __slots__ = ()
+
     def __init__(self, value: str):
         self._clean(value, error_msg="O código de país deve ser uma string")
         super().__init__(value)
@@ -2,6 +2,8 @@ from apps.shared.value_objects.base import StringVO
 
 
 class District(StringVO):
+    __slots__ = ()
+
     def _validate(self):
         if not isinstance(self.value, str):
             raise ValueError("District must be a string")
@@ -2,6 +2,8 @@ from apps.shared.value_objects.base import StringVO
 import re
 
 class PostalCode(StringVO):
+    __slots__ = ()
+
     def __init__(self, value: str):
         value = value.strip()
         super().__init__(value)
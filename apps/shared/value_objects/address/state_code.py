@@ -2,6 +2,8 @@ from apps.shared.value_objects.base import StringVO
 import re
 
 class StateCode(StringVO):
+    __slots__ = ()
+
     def _validate(self):
         if not isinstance(self.value, str):
             raise ValueError("Estado deve ser uma string")
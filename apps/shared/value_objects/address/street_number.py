@@ -1,6 +1,8 @@
 from apps.shared.value_objects.base import StringVO
 
 class StreetNumber(StringVO):    
+    __slots__ = ()
+
     def _validate(self):
         if not isinstance(self.value, str):
             raise ValueError("Street number must be a string")
@@ -9,10 +9,20 @@ from typing import Any, Union
 
 
 class StringVO(ABC):
+    # Subclasses declare `__slots__ = ()` so instances stay without a __dict__.
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
         self.value = value
         self._validate()
 
+    @classmethod
+    def from_persistence(cls, value: str):
+        """Builds the VO from a value that was validated before it was stored, skipping _validate."""
+        obj = cls.__new__(cls)
+        obj.value = value
+        return obj
+
     @abstractmethod
     def _validate(self):
         pass
@@ -34,10 +44,18 @@ class StringVO(ABC):
 
 
 class NumericVO(ABC):
+    __slots__ = ("value",)
+
     def __init__(self, value: Union[str, int, float, Decimal]):
         self.value = Decimal(str(value))
         self._validate()
 
+    @classmethod
+    def from_persistence(cls, value: Union[int, Decimal]):
+        obj = cls.__new__(cls)
+        obj.value = value if isinstance(value, Decimal) else Decimal(value)
+        return obj
+
     @abstractmethod
     def _validate(self):
         pass
@@ -4,6 +4,8 @@ import re
 EMAIL_REGEX = r"^[\w\.-]+@[\w\.-]+\.\w+$"
 
 class Email(StringVO):
+    __slots__ = ()
+
     def __init__(self, value: str):
         value = value.strip().lower()
         super().__init__(value)
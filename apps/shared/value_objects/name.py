@@ -1,6 +1,8 @@
 from apps.shared.value_objects.base import StringVO
 
 class Name(StringVO):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value.strip())
 
@@ -1,10 +1,89 @@
-from django.contrib.auth.hashers import make_password, check_password
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.contrib.auth.hashers import make_password, check_password, get_hasher, identify_hasher
+
+from apps.shared.exceptions import ServiceUnavailableError
+
+T = TypeVar("T")
+
+
+# Hashers whose cost comes from settings; they keep Django's algorithm names, so hashes made
+# with another cost are still verified and `must_update` flags them for a rehash.
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class BCryptSHA256PasswordHasher(hashers.BCryptSHA256PasswordHasher):
+    @property
+    def rounds(self):
+        return settings.PASSWORD_BCRYPT_ROUNDS
+
+
+class PasswordHashingPolicy:
+    """Hashes with the preferred hasher in settings.PASSWORD_HASHERS on a bounded thread pool.
+
+    At most `max_workers` hashes run at once. Callers wait up to `wait_timeout` seconds for a
+    slot and then get a ServiceUnavailableError, so a login burst can't hold every worker.
+    """
+
+    def __init__(self, max_workers: int, wait_timeout: float):
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hashing")
+
+    def hash(self, raw_password: str) -> str:
+        return self._run(make_password, raw_password)
+
+    def verify(self, raw_password: str, hashed_password: str) -> bool:
+        return self._run(check_password, raw_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        try:
+            hasher = identify_hasher(hashed_password)
+        except ValueError:
+            return False
+        preferred = get_hasher("default")
+        return hasher.algorithm != preferred.algorithm or preferred.must_update(hashed_password)
+
+    def _run(self, func: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            raise ServiceUnavailableError("Too many password checks in progress. Try again later")
+        try:
+            return self._executor.submit(func, *args).result()
+        finally:
+            self._slots.release()
+
+
+password_hashing = PasswordHashingPolicy(settings.PASSWORD_HASHING_WORKERS, settings.PASSWORD_HASHING_WAIT_TIMEOUT)
+
 
 class Password:
+    __slots__ = ("_hashed_password",)
+
     def __init__(self, raw_password: str):
         self._validate(raw_password)
-        self._hashed_password = make_password(raw_password)
+        self._hashed_password = password_hashing.hash(raw_password)
 
     def _validate(self, raw_password: str) -> None:
         validators = [
@@ -20,7 +99,11 @@ class Password:
                 raise ValueError(error_message)
 
     def verify(self, raw_password):
-        return check_password(raw_password, self._hashed_password)
+        return password_hashing.verify(raw_password, self._hashed_password)
+
+    @property
+    def needs_rehash(self) -> bool:
+        return password_hashing.needs_rehash(self._hashed_password)
     
     @classmethod
     def from_hash(cls, hashed_password: str):
@@ -2,6 +2,8 @@ from apps.shared.value_objects.base import NumericVO
 from decimal import Decimal
 
 class Price(NumericVO):
+    __slots__ = ()
+
     def _validate(self):
         if self.value < 0:
             raise ValueError("Negative price is not allowed")
@@ -1,6 +1,8 @@
 from apps.shared.value_objects.base import NumericVO
 
 class Stock(NumericVO):
+    __slots__ = ()
+
     def _validate(self):
         if not self.is_integer():
             raise ValueError("The stock value must be an integer number")
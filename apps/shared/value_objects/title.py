@@ -1,5 +1,7 @@
 from apps.shared.value_objects.base import StringVO
 class Title(StringVO):
+    __slots__ = ()
+
     def _validate(self):
         if not isinstance(self.value, str):
             raise ValueError("The text title must be a string")
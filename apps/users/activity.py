@@ -0,0 +1,65 @@
+from typing import Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.shared.cache import CacheBackend, build_cache_backend, is_shared_cache
+from apps.users.models import UserModel
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+class UserActivityCache:
+    """Caches each user's `is_active` flag for `require_active_user`.
+
+    `UserService` invalidates the entry whenever a user is (de)activated or deleted.
+    """
+
+    def __init__(self, cache: Optional[CacheBackend]):
+        self.cache = cache
+
+    def _key(self, user_id) -> str:
+        return f"user-activity:{user_id}"
+
+    def is_active(self, user_id: UUID) -> Optional[bool]:
+        """Returns the user's flag, or None when the user does not exist."""
+        if self.cache is not None and (is_active := self.cache.get(self._key(user_id))) is not None:
+            return is_active
+
+        is_active = UserModel.objects.filter(id=user_id).values_list("is_active", flat=True).first()
+        if self.cache is not None and is_active is not None:
+            self.cache.set(self._key(user_id), is_active)
+        return is_active
+
+    def invalidate(self, user_id: UUID):
+        if self.cache is None:
+            return
+        keys = [self._key(user_id)]
+        self.cache.delete_many(keys)
+        # Inside a transaction a concurrent request may re-cache the old flag before we commit.
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: self.cache.delete_many(keys))
+
+
+def build_user_activity_cache() -> UserActivityCache:
+    backend = settings.USER_ACTIVITY_CACHE_BACKEND
+    # Invalidation would only reach the worker that (de)activated the user; the others would keep
+    # accepting them until the TTL, so the flag is read from the database instead.
+    if backend == "django" and not is_shared_cache(settings.USER_ACTIVITY_CACHE_ALIAS):
+        logger.warning(
+            f"User activity cache disabled: cache alias '{settings.USER_ACTIVITY_CACHE_ALIAS}' is not shared across workers"
+        )
+        return UserActivityCache(None)
+    return UserActivityCache(
+        build_cache_backend(
+            backend,
+            ttl=settings.USER_ACTIVITY_CACHE_TTL,
+            max_size=settings.USER_ACTIVITY_CACHE_MAX_SIZE,
+            alias=settings.USER_ACTIVITY_CACHE_ALIAS,
+        )
+    )
+
+
+user_activity = build_user_activity_cache()
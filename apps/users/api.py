@@ -3,6 +3,7 @@ from http import HTTPStatus
 from uuid import UUID
 
 from apps.shared.decorators.require_active_user import require_active_user
+from apps.shared.pagination import PageQuerySchema, PageRequest, PageSchema
 from apps.users.repository import UserRepository
 from apps.users.schema import (
     UserActivationSchema,
@@ -11,9 +12,10 @@ from apps.users.schema import (
     UserSchema,
     UserUpdateSchema,
 )
-from apps.users.serializers import user_to_schema
+from apps.users.serializers import user_row_to_response, user_to_schema
 from apps.users.service import UserService
-from ninja import Router
+from django.conf import settings
+from ninja import Query, Router
 from utils.error_schema import ErrorSchema
 from utils.logger import configure_logger
 
@@ -41,10 +43,14 @@ def create_user(request, payload: UserCreateSchema):
     return HTTPStatus.CREATED, user_to_schema(user)
 
 
-@users_router.get("", response={HTTPStatus.OK: list[UserSchema]})
-def list_users(request):
-    users = service.list_users()
-    return [user_to_schema(user) for user in users]
+@users_router.get("", response={HTTPStatus.OK: PageSchema[UserSchema]})
+def list_users(request, page: PageQuerySchema = Query(...)):
+    if settings.READ_PROJECTIONS_ENABLED:
+        rows = service.list_users_projection(PageRequest(page.cursor, page.limit))
+        return {"items": [user_row_to_response(row) for row in rows.items], "next_cursor": rows.next_cursor}
+
+    users = service.list_users(PageRequest(page.cursor, page.limit))
+    return PageSchema[UserSchema](items=[user_to_schema(user) for user in users.items], next_cursor=users.next_cursor)
 
 
 @users_router.get("/{user_id}", response={HTTPStatus.OK: UserSchema})
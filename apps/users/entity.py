@@ -8,6 +8,17 @@ from apps.shared.value_objects.password import Password
 
 
 class User:
+    __slots__ = (
+        "_id",
+        "_name",
+        "_email",
+        "_password",
+        "_username",
+        "_is_active",
+        "_created_at",
+        "_updated_at",
+    )
+
     def __init__(
         self,
         name: Name,
@@ -12,4 +12,7 @@ class UserModel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        db_table = "users"
\ No newline at end of file
+        db_table = "users"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="users_created_idx"),
+        ]
\ No newline at end of file
@@ -1,10 +1,18 @@
 from uuid import UUID
+from django.db import transaction
+from apps.products.cached_repository import invalidate_products_of_owner
+from apps.products.facets import apply_facet_changes, facet_keys_for
+from apps.products.models import ProductModel
 from apps.users.repository_interface import UserRepositoryInterface
 from apps.users.models import UserModel
 from apps.users.entity import User
 from apps.shared.value_objects import Name, Email, Password
+from apps.shared.pagination import Page, PageRequest, paginate_queryset
+from apps.shared.database import read_only_method
 
 
+USER_PROJECTION = ("id", "email", "name", "username", "is_active", "created_at", "updated_at")
+
 class UserRepository(UserRepositoryInterface):
     def save(self, user: User) -> User:
         created_user_data = UserModel.objects.create(
@@ -18,8 +26,8 @@ class UserRepository(UserRepositoryInterface):
 
         return User(
             id=created_user_data.id,
-            name=Name(created_user_data.name),
-            email=Email(created_user_data.email),
+            name=Name.from_persistence(created_user_data.name),
+            email=Email.from_persistence(created_user_data.email),
             password=Password.from_hash(created_user_data.password),
             username=created_user_data.username,
             is_active=created_user_data.is_active,
@@ -40,8 +48,8 @@ class UserRepository(UserRepositoryInterface):
         user_model.save()
         return User(
             id=user_model.id,
-            name=Name(user_model.name),
-            email=Email(user_model.email),
+            name=Name.from_persistence(user_model.name),
+            email=Email.from_persistence(user_model.email),
             password=Password.from_hash(user_model.password),
             username=user_model.username,
             is_active=user_model.is_active,
@@ -49,14 +57,15 @@ class UserRepository(UserRepositoryInterface):
             updated_at=user_model.updated_at
         )
     
+    @read_only_method
     def get_user_by_id(self, user_id: UUID) -> User:
         user_data = UserModel.objects.filter(id=user_id).first()
         if not user_data:
             return None
         return User(
             id=user_data.id,
-            name=Name(user_data.name),
-            email=Email(user_data.email),
+            name=Name.from_persistence(user_data.name),
+            email=Email.from_persistence(user_data.email),
             password=Password.from_hash(user_data.password),
             username=user_data.username,
             is_active=user_data.is_active,
@@ -64,13 +73,14 @@ class UserRepository(UserRepositoryInterface):
             updated_at=user_data.updated_at
         )
     
-    def list_users(self) -> list[User]:
-        users_data = UserModel.objects.all()
+    @read_only_method
+    def list_users(self, page_request: PageRequest = None) -> Page[User]:
+        users_data, next_cursor = paginate_queryset(UserModel.objects.all(), page_request)
         users = [
             User(
             id=user_data.id,
-            name=Name(user_data.name),
-            email=Email(user_data.email),
+            name=Name.from_persistence(user_data.name),
+            email=Email.from_persistence(user_data.email),
             password=Password.from_hash(user_data.password),
             username=user_data.username,
             is_active=user_data.is_active,
@@ -79,10 +89,20 @@ class UserRepository(UserRepositoryInterface):
             )
             for user_data in users_data
         ]
-        return users
+        return Page(users, next_cursor)
+
+    @read_only_method
+    def list_users_projection(self, page_request: PageRequest = None) -> Page[dict]:
+        rows, next_cursor = paginate_queryset(UserModel.objects.values(*USER_PROJECTION), page_request)
+        return Page(rows, next_cursor)
     
     def delete_user(self, user_id: UUID) -> None:
-        UserModel.objects.get(id=user_id).delete()
+        # The user's products go with it (on_delete=CASCADE), so their facet counts are removed too.
+        with transaction.atomic():
+            removed_facet_keys = facet_keys_for(ProductModel.objects.filter(owner_id=user_id))
+            invalidate_products_of_owner(user_id)
+            UserModel.objects.get(id=user_id).delete()
+            apply_facet_changes(removed=removed_facet_keys)
         return
     
     def get_user_by_email(self, user_email: str) -> User:
@@ -90,8 +110,8 @@ class UserRepository(UserRepositoryInterface):
             user_data = UserModel.objects.get(email=user_email)
             return User(
                 id=user_data.id,
-                name=Name(user_data.name),
-                email=Email(user_data.email),
+                name=Name.from_persistence(user_data.name),
+                email=Email.from_persistence(user_data.email),
                 password=Password.from_hash(user_data.password),
                 username=user_data.username,
                 is_active=user_data.is_active,
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 from apps.users.entity import User
+from apps.shared.pagination import Page, PageRequest
 
 class UserRepositoryInterface(ABC):
     @abstractmethod
@@ -16,7 +17,11 @@ class UserRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_users(self) -> list[User]:
+    def list_users(self, page_request: PageRequest = None) -> Page[User]:
+        pass
+
+    @abstractmethod
+    def list_users_projection(self, page_request: PageRequest = None) -> Page[dict]:
         pass
 
     @abstractmethod
@@ -12,6 +12,9 @@ def user_to_schema(user: User) -> UserSchema:
         updated_at=user.updated_at,
     )
 
+def user_row_to_response(row: dict) -> dict:
+    return {**row, "username": row["username"] or ""}
+
 def user_to_nested_schema(user: User) -> UserNestedSchema:
     return UserNestedSchema(
         id=user.id,
@@ -6,6 +6,8 @@ from apps.users.repository_interface import UserRepositoryInterface
 from apps.users.schema import UserUpdateSchema, UserActivationSchema
 from apps.shared.exceptions import ConflictError, UnauthorizedError, NotFoundError
 from apps.users.entity import User
+from apps.shared.pagination import Page, PageRequest
+from apps.users.activity import user_activity
 
 from utils.logger import configure_logger
 import logging
@@ -39,8 +41,11 @@ class UserService:
             raise NotFoundError(f"Can't get user with id {user_id}. User not found")
         return user
 
-    def list_users(self) -> list[User]:
-        return self.repository.list_users()
+    def list_users(self, page_request: PageRequest = None) -> Page[User]:
+        return self.repository.list_users(page_request)
+
+    def list_users_projection(self, page_request: PageRequest = None) -> Page[dict]:
+        return self.repository.list_users_projection(page_request)
 
     def update_user(self, user_id: UUID, payload: UserUpdateSchema) -> User:
         user = self.repository.get_user_by_id(user_id=user_id)
@@ -88,6 +93,7 @@ class UserService:
             self.logger.info(f"User with id {user.id} successfully deactivated")
         
         saved_user = self.repository.update_user(user=user)
+        user_activity.invalidate(user.id)
         return saved_user
     
     def delete_user(self, user_id:UUID) -> None:
@@ -96,5 +102,6 @@ class UserService:
             self.logger.warning(f"Can't delete user with id {user_id}. User not found.")
             raise NotFoundError(f"Can't delete user with id {user_id}. User not found.")
         self.repository.delete_user(user_id=user.id)
+        user_activity.invalidate(user.id)
         self.logger.info(f"User {user.email.value} successfully deleted")
         return
\ No newline at end of file
@@ -1,8 +1,9 @@
 from ninja import NinjaAPI, Redoc
 from http import HTTPStatus
-from apps.shared.exceptions.exceptions import NotFoundError, ConflictError, UnauthorizedError, UnprocessableEntityError, OutOfStockError
+from apps.shared.exceptions.exceptions import NotFoundError, ConflictError, UnauthorizedError, UnprocessableEntityError, OutOfStockError, ServiceUnavailableError
 from utils.logger import configure_logger
 from utils.jwt import JWTAuth
+from core.renderers import build_renderer
 
 from apps.authentication.api import authentication_router
 from apps.users.api import users_router
@@ -18,6 +19,7 @@ api = NinjaAPI(
     title="API",
     version="1.0.0",
     description="This is a API to manage data",
+    renderer=build_renderer(),
     # auth=JWTAuth()
 )
 
@@ -87,3 +89,13 @@ def out_of_stock_handler(request, exc: OutOfStockError):
         status=HTTPStatus.CONFLICT,
     )
 
+
+@api.exception_handler(ServiceUnavailableError)
+def service_unavailable_handler(request, exc: ServiceUnavailableError):
+    response = api.create_response(
+        request,
+        {"message": str(exc)},
+        status=HTTPStatus.SERVICE_UNAVAILABLE,
+    )
+    response["Retry-After"] = "1"
+    return response
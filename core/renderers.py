@@ -0,0 +1,44 @@
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest
+from ninja.renderers import JSONRenderer
+from ninja.responses import NinjaJSONEncoder
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional dependency: fall back to the stdlib json encoder
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Renders responses with orjson when it is installed, otherwise with ninja's stdlib encoder.
+
+    UUIDs, enums and lists are encoded natively by orjson. Datetimes, Decimals and any other
+    type go through NinjaJSONEncoder, so the payload matches the stdlib renderer. Pydantic
+    models left in the data are dumped once with `model_dump(mode="json")`.
+    """
+
+    encoder = NinjaJSONEncoder()
+
+    def __init__(self, use_orjson: bool = True):
+        self.use_orjson = use_orjson and orjson is not None
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        if not self.use_orjson:
+            return super().render(request, data, response_status=response_status)
+        return orjson.dumps(
+            data,
+            default=self._default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json")
+        return self.encoder.default(value)
+
+
+def build_renderer() -> FastJSONRenderer:
+    return FastJSONRenderer(use_orjson=settings.JSON_RENDERER == "orjson")
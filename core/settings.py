@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
 import os
+from decimal import Decimal
 from pathlib import Path
 
 import dj_database_url
@@ -64,6 +65,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "apps.shared.database.replica_pinning_middleware",
 ]
 
 ROOT_URLCONF = "core.urls"
@@ -104,8 +106,29 @@ DATABASES["default"] = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", "app_pass"),
         "HOST": os.getenv("POSTGRES_HOST", "db"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        # Persistent connections: reuse each worker's connection for up to DB_CONN_MAX_AGE seconds
+        # (0 reconnects on every request) and ping it before reuse.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "true").lower() == "true",
+        # Set DB_POOLER_MODE=true behind PgBouncer (transaction pooling): server-side cursors
+        # can't survive across pooled transactions.
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv("DB_POOLER_MODE", "false").lower() == "true",
+        "OPTIONS": {
+            "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+        },
 }
 
+# Read replica: repository reads marked read-only go to DB_REPLICA_HOST when it is set
+if os.getenv("DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.getenv("DB_REPLICA_HOST"),
+        "PORT": os.getenv("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["apps.shared.database.PrimaryReplicaRouter"]
+
 
 
 # Password validation
@@ -127,6 +150,32 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing: the preferred algorithm hashes new passwords; the others only verify
+# existing hashes, which are upgraded on the next successful login.
+# "argon2" needs argon2-cffi and "bcrypt_sha256" needs bcrypt.
+PASSWORD_HASHING_ALGORITHM = os.getenv("PASSWORD_HASHING_ALGORITHM", "pbkdf2_sha256")
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "600000"))
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "102400"))
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "8"))
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+# Hashing runs on a bounded pool; callers wait at most PASSWORD_HASHING_WAIT_TIMEOUT seconds for a slot
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", "4"))
+PASSWORD_HASHING_WAIT_TIMEOUT = float(os.getenv("PASSWORD_HASHING_WAIT_TIMEOUT", "5"))
+
+_PASSWORD_HASHERS = {
+    "argon2": "apps.shared.value_objects.password.Argon2PasswordHasher",
+    "bcrypt_sha256": "apps.shared.value_objects.password.BCryptSHA256PasswordHasher",
+    "pbkdf2_sha256": "apps.shared.value_objects.password.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _PASSWORD_HASHERS[PASSWORD_HASHING_ALGORITHM],
+    *(path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHING_ALGORITHM),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
 
@@ -155,6 +204,92 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 APPEND_SLASH = False
 
+# Cursor pagination for list endpoints
+PAGINATION_DEFAULT_PAGE_SIZE = int(os.getenv("PAGINATION_DEFAULT_PAGE_SIZE", "50"))
+PAGINATION_MAX_PAGE_SIZE = int(os.getenv("PAGINATION_MAX_PAGE_SIZE", "200"))
+# Read-only list endpoints select only the response columns with .values() and skip entity hydration
+READ_PROJECTIONS_ENABLED = os.getenv("READ_PROJECTIONS_ENABLED", "true").lower() == "true"
+# "orjson" renders API responses with orjson when it is installed; "stdlib" forces the json module
+JSON_RENDERER = os.getenv("JSON_RENDERER", "orjson")
+# Upper bounds of the /products/facets price buckets; the last bucket is open-ended.
+# Changing them requires `python manage.py rebuild_product_facets`.
+PRODUCT_FACET_PRICE_BOUNDARIES = [
+    Decimal(boundary) for boundary in os.getenv("PRODUCT_FACET_PRICE_BOUNDARIES", "50 100 250 500 1000 2500").split()
+]
+
+# Cache
+# Set REDIS_URL to share cached entries across workers; otherwise each process keeps its own.
+REDIS_URL = os.getenv("REDIS_URL")
+
+CACHES = {
+    "default": (
+        {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}
+        if REDIS_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
+# Product read-through cache: "locmem" (per-process LRU), "django" (CACHES alias) or "none".
+# Defaults to "django" when REDIS_URL is set and "none" otherwise: a per-process cache would keep
+# serving a product changed by another worker until its TTL expires.
+PRODUCT_CACHE_BACKEND = os.getenv("PRODUCT_CACHE_BACKEND", "django" if REDIS_URL else "none")
+PRODUCT_CACHE_TTL = int(os.getenv("PRODUCT_CACHE_TTL", "60"))
+PRODUCT_CACHE_MAX_SIZE = int(os.getenv("PRODUCT_CACHE_MAX_SIZE", "2048"))
+PRODUCT_CACHE_ALIAS = os.getenv("PRODUCT_CACHE_ALIAS", "default")
+
+# Category catalogue: in-process snapshot, invalidated through a version stamp in CACHES.
+# Only used when the alias is shared across workers (e.g. REDIS_URL); otherwise categories are read from the database.
+CATEGORY_CATALOGUE_ENABLED = os.getenv("CATEGORY_CATALOGUE_ENABLED", "true").lower() == "true"
+CATEGORY_CATALOGUE_CACHE_ALIAS = os.getenv("CATEGORY_CATALOGUE_CACHE_ALIAS", "default")
+# Snapshots are rebuilt after this many seconds even without a write through the repository
+CATEGORY_CATALOGUE_TTL = float(os.getenv("CATEGORY_CATALOGUE_TTL", "300"))
+
+# Authentication fast path: verified JWT claims (per process) and users' is_active flag
+JWT_CLAIMS_CACHE_TTL = int(os.getenv("JWT_CLAIMS_CACHE_TTL", "300"))
+JWT_CLAIMS_CACHE_MAX_SIZE = int(os.getenv("JWT_CLAIMS_CACHE_MAX_SIZE", "10000"))
+# "django" shares the flag (and its invalidation) across workers; it is the default only when REDIS_URL is set,
+# since a per-process cache would keep accepting a user deactivated through another worker until the TTL.
+USER_ACTIVITY_CACHE_BACKEND = os.getenv("USER_ACTIVITY_CACHE_BACKEND", "django" if REDIS_URL else "none")
+USER_ACTIVITY_CACHE_TTL = int(os.getenv("USER_ACTIVITY_CACHE_TTL", "60"))
+USER_ACTIVITY_CACHE_MAX_SIZE = int(os.getenv("USER_ACTIVITY_CACHE_MAX_SIZE", "10000"))
+USER_ACTIVITY_CACHE_ALIAS = os.getenv("USER_ACTIVITY_CACHE_ALIAS", "default")
+
+# Cart store: "database" writes every cart mutation through; "cache" keeps working carts in CACHES
+# and writes them behind to the database every CART_BUFFER_FLUSH_INTERVAL seconds and at checkout
+CART_STORE = os.getenv("CART_STORE", "database")
+CART_BUFFER_CACHE_ALIAS = os.getenv("CART_BUFFER_CACHE_ALIAS", "default")
+CART_BUFFER_TTL = int(os.getenv("CART_BUFFER_TTL", str(7 * 24 * 60 * 60)))
+CART_BUFFER_FLUSH_INTERVAL = float(os.getenv("CART_BUFFER_FLUSH_INTERVAL", "5"))
+# Per-cart lock serialising concurrent mutations: expiry and how long a request waits for it (then 503)
+CART_BUFFER_LOCK_TTL = float(os.getenv("CART_BUFFER_LOCK_TTL", "10"))
+CART_BUFFER_LOCK_TIMEOUT = float(os.getenv("CART_BUFFER_LOCK_TIMEOUT", "5"))
+
+# Login rate limiting (sliding window per client IP and per e-mail, counted in CACHES)
+LOGIN_RATE_LIMIT_ENABLED = os.getenv("LOGIN_RATE_LIMIT_ENABLED", "true").lower() == "true"
+LOGIN_RATE_LIMIT_WINDOW = int(os.getenv("LOGIN_RATE_LIMIT_WINDOW", "60"))
+LOGIN_RATE_LIMIT_PER_IP = int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", "20"))
+LOGIN_RATE_LIMIT_PER_EMAIL = int(os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", "5"))
+LOGIN_RATE_LIMIT_CACHE_ALIAS = os.getenv("LOGIN_RATE_LIMIT_CACHE_ALIAS", "default")
+# Only enable behind a proxy that sets X-Forwarded-For; otherwise clients can spoof their IP
+RATE_LIMIT_TRUST_FORWARDED_FOR = os.getenv("RATE_LIMIT_TRUST_FORWARDED_FOR", "false").lower() == "true"
+
+# Postal code validation APIs
+POSTAL_CODE_BR_API_URL = os.getenv("POSTAL_CODE_BR_API_URL", "https://brasilapi.com.br/api/cep/v1")
+POSTAL_CODE_US_API_URL = os.getenv("POSTAL_CODE_US_API_URL", "https://api.zippopotam.us/us")
+POSTAL_CODE_HTTP_TIMEOUT = float(os.getenv("POSTAL_CODE_HTTP_TIMEOUT", "3"))
+POSTAL_CODE_HTTP_POOL_SIZE = int(os.getenv("POSTAL_CODE_HTTP_POOL_SIZE", "10"))
+POSTAL_CODE_CACHE_MAX_SIZE = int(os.getenv("POSTAL_CODE_CACHE_MAX_SIZE", "4096"))
+POSTAL_CODE_CACHE_TTL = int(os.getenv("POSTAL_CODE_CACHE_TTL", str(7 * 24 * 60 * 60)))
+POSTAL_CODE_CACHE_PERSISTENT = os.getenv("POSTAL_CODE_CACHE_PERSISTENT", "false").lower() == "true"
+POSTAL_CODE_BREAKER_FAILURE_THRESHOLD = int(os.getenv("POSTAL_CODE_BREAKER_FAILURE_THRESHOLD", "5"))
+POSTAL_CODE_BREAKER_RESET_TIMEOUT = float(os.getenv("POSTAL_CODE_BREAKER_RESET_TIMEOUT", "30"))
+# "sync" validates the postal code before saving an address; "deferred" saves it as pending
+# and validates on a background thread pool
+ADDRESS_VALIDATION_MODE = os.getenv("ADDRESS_VALIDATION_MODE", "sync")
+ADDRESS_VALIDATION_WORKERS = int(os.getenv("ADDRESS_VALIDATION_WORKERS", "4"))
+# Local dataset built by `manage.py ingest_postal_codes`; the HTTP APIs are only called on misses
+POSTAL_CODE_DATASET_PATH = os.getenv("POSTAL_CODE_DATASET_PATH", str(BASE_DIR / "data" / "postal_codes.sqlite3"))
+
 CORS_ORIGIN_ALLOW_ALL = False
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOWED_ORIGINS = [
@@ -163,7 +163,7 @@ class TestListAddressesByUser:
         response = timed_client.get(url)
         assert response.status_code == 200
 
-        body = response.json()
+        body = response.json()["items"]
         assert isinstance(body, list)
         assert len(body) == 1
         assert body[0]["street"] == persisted_address.street.value
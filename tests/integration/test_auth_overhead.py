@@ -0,0 +1,80 @@
+import pytest
+from apps.shared.cache import LocalMemoryCache
+from apps.shared.decorators.require_active_user import require_active_user
+from apps.users.activity import user_activity
+from apps.users.models import UserModel
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.test import RequestFactory
+from jose import ExpiredSignatureError
+from utils import jwt as jwt_module
+from utils.jwt import JWTAuth, decode_jwt_token, generate_jwt_token, token_claims_cache
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+@require_active_user
+def protected_view(request):
+    return request.auth["user_id"]
+
+
+def authenticated_call(token: str):
+    """What django-ninja runs before an authenticated, @require_active_user view."""
+    request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    request.auth = JWTAuth()(request)
+    return protected_view(request)
+
+
+@pytest.fixture
+def user(monkeypatch):
+    monkeypatch.setattr(user_activity, "cache", LocalMemoryCache(max_size=100, ttl=60))
+    user = UserService(UserRepository(), logger).create_user("Test", "auth@test.com", "Abc@1234", "authUser")
+    token_claims_cache.clear()
+    user_activity.invalidate(user.id)
+    yield user
+    token_claims_cache.clear()
+    user_activity.invalidate(user.id)
+
+
+@pytest.fixture
+def token(user):
+    return generate_jwt_token(UserModel.objects.get(id=user.id))
+
+
+@pytest.fixture
+def jose_decodes(monkeypatch):
+    calls = []
+    decode = jwt_module.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_module.jwt, "decode", counting_decode)
+    return calls
+
+
+@pytest.mark.django_db
+def test_authenticated_requests_should_decode_once_and_query_user_once(user, token, jose_decodes, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        for _ in range(3):
+            assert authenticated_call(token) == str(user.id)
+
+    assert len(jose_decodes) == 1
+
+
+@pytest.mark.django_db
+def test_invalid_token_should_not_authenticate(token):
+    request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token[:-2]}xx")
+
+    assert JWTAuth()(request) is None
+
+
+@pytest.mark.django_db
+def test_cached_claims_should_still_expire(token, monkeypatch):
+    claims = decode_jwt_token(token)
+    monkeypatch.setattr(jwt_module.time, "time", lambda: claims["exp"] + 1)
+
+    with pytest.raises(ExpiredSignatureError):
+        decode_jwt_token(token)
@@ -0,0 +1,106 @@
+import pytest
+from apps.authentication.rate_limit import login_email_limiter, login_ip_limiter
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.contrib.auth.hashers import PBKDF2SHA1PasswordHasher, make_password
+
+email = "login@test.com"
+password = "Abc@1234"
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limits():
+    cache.clear()
+    login_ip_limiter.stats.reset()
+    login_email_limiter.stats.reset()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def legacy_user():
+    # A hash made by an algorithm that is no longer the preferred one.
+    return get_user_model().objects.create(
+        username="loginUser",
+        email=email,
+        password=make_password(password, hasher=PBKDF2SHA1PasswordHasher()),
+    )
+
+
+@pytest.mark.django_db
+class TestLoginRoute:
+    def test_should_login_and_upgrade_legacy_password_hash(self, client, legacy_user):
+        response = client.post(
+            "/api/auth/login", {"email": email, "password": password}, content_type="application/json"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["access_token"]
+        legacy_user.refresh_from_db()
+        assert legacy_user.password.startswith("pbkdf2_sha256$600000$")
+        assert legacy_user.check_password(password)
+
+    def test_should_upgrade_hash_when_cost_changes(self, client, legacy_user, settings):
+        settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+        payload = {"email": email, "password": password}
+
+        client.post("/api/auth/login", payload, content_type="application/json")
+        legacy_user.refresh_from_db()
+        assert legacy_user.password.startswith("pbkdf2_sha256$1000$")
+
+        upgraded_hash = legacy_user.password
+        client.post("/api/auth/login", payload, content_type="application/json")
+        legacy_user.refresh_from_db()
+        assert legacy_user.password == upgraded_hash
+
+    def test_should_not_touch_hash_on_wrong_password(self, client, legacy_user):
+        legacy_hash = legacy_user.password
+
+        response = client.post(
+            "/api/auth/login", {"email": email, "password": "Wrong@123"}, content_type="application/json"
+        )
+
+        assert response.status_code == 401
+        legacy_user.refresh_from_db()
+        assert legacy_user.password == legacy_hash
+
+
+@pytest.mark.django_db
+class TestLoginRateLimit:
+    def test_should_reject_excess_attempts_for_an_email_before_any_query(
+        self, client, legacy_user, monkeypatch, django_assert_num_queries
+    ):
+        monkeypatch.setattr(login_email_limiter, "limit", 2)
+        payload = {"email": email, "password": "Wrong@123"}
+        for _ in range(2):
+            assert client.post("/api/auth/login", payload, content_type="application/json").status_code == 401
+
+        with django_assert_num_queries(0):
+            response = client.post("/api/auth/login", payload, content_type="application/json")
+
+        assert response.status_code == 429
+        assert client.get("/api/healthz/metrics").json()["login_rate_limit"] == {
+            "ip": {"allowed": 3, "rejected": 0},
+            "email": {"allowed": 2, "rejected": 1},
+        }
+
+    def test_should_reject_excess_attempts_from_an_ip_across_emails(self, client, monkeypatch):
+        monkeypatch.setattr(login_ip_limiter, "limit", 2)
+        statuses = [
+            client.post(
+                "/api/auth/login",
+                {"email": f"user{i}@test.com", "password": password},
+                content_type="application/json",
+                REMOTE_ADDR="10.0.0.1",
+            ).status_code
+            for i in range(3)
+        ]
+        other_ip = client.post(
+            "/api/auth/login",
+            {"email": "other@test.com", "password": password},
+            content_type="application/json",
+            REMOTE_ADDR="10.0.0.2",
+        )
+
+        assert statuses == [404, 404, 429]
+        assert other_ip.status_code == 404
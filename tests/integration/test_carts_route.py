@@ -39,7 +39,7 @@ def product(user, category):
 @pytest.mark.django_db
 class TestAddToCartRoute:
     def test_should_return_status_200_ok_and_add_new_item_to_cart(self, timed_client, user, category, product):
-        url = f"/api/carts/{user.id}/add"
+        url = f"/api/carts/{user.id}/add?expand=product"
 
         payload = {
             "product_id": str(product.id),
@@ -82,7 +82,7 @@ class TestAddToCartRoute:
 @pytest.mark.django_db
 class TestSubtractItemCartQuantityRoute:
     def test_should_return_status_200_ok_and_subtract_valid_quantity_from_item_cart(self, timed_client, user, product):
-        cart_item = CartItem(product, 3)
+        cart_item = CartItem.for_product(product, 3)
         cart = Cart(user.id, [cart_item])
         cart_repository.save(cart)
         
@@ -99,7 +99,8 @@ class TestSubtractItemCartQuantityRoute:
         body = response.json()
 
         item = body["items"][0]
-        assert item["product"]["id"] == str(product.id)
+        assert item["product_id"] == str(product.id)
+        assert item["product"] is None
         assert item["quantity"] > 0
         assert cart_item.quantity - payload["quantity"] == item["quantity"]
 
@@ -118,7 +119,7 @@ class TestSubtractItemCartQuantityRoute:
 @pytest.mark.django_db
 class TestRemoveCartItemRoute:
     def test_should_return_200_ok_and_remove_cart_item(self, timed_client, user, product):
-        cart_item = CartItem(product, 3)
+        cart_item = CartItem.for_product(product, 3)
         cart = Cart(user.id, [cart_item])
         cart_repository.save(cart)
         
@@ -132,7 +133,7 @@ class TestRemoveCartItemRoute:
         assert len(body["items"]) == 0
 
     def test_should_return_404_not_found_when_removing_not_found_cart(self, timed_client, user, product):
-        cart_item = CartItem(product, 3)
+        cart_item = CartItem.for_product(product, 3)
         cart = Cart(user.id, [cart_item])
         cart_repository.save(cart)
 
@@ -143,7 +144,7 @@ class TestRemoveCartItemRoute:
         assert "Cart not found" in response.json()["message"]
 
     def test_should_return_404_not_found_when_removing_not_found_product(self, timed_client, user, product):
-        cart_item = CartItem(product, 3)
+        cart_item = CartItem.for_product(product, 3)
         cart = Cart(user.id, [cart_item])
         cart_repository.save(cart)
 
@@ -156,8 +157,8 @@ class TestRemoveCartItemRoute:
 @pytest.mark.django_db
 class TestClearCartRoute:
     def test_should_return_status_200_ok_and_clear_cart(self, timed_client, user, product):
-        cart_item1 = CartItem(product, 3)
-        cart_item2 = CartItem(product, 1)
+        cart_item1 = CartItem.for_product(product, 3)
+        cart_item2 = CartItem.for_product(product, 1)
         cart = Cart(user.id, [cart_item1, cart_item2])
         cart_repository.save(cart)
 
@@ -167,3 +168,42 @@ class TestClearCartRoute:
 
         body = response.json()
         assert len(body["items"]) == 0
+
+
+@pytest.mark.django_db
+class TestGetCartRoute:
+    def test_should_return_compact_cart_lines_without_loading_products(self, timed_client, user, product, django_assert_num_queries):
+        cart_repository.save(Cart(user.id, [CartItem.for_product(product, 2)]))
+
+        with django_assert_num_queries(3):  # user, cart, cart items
+            response = timed_client.get(f"/api/carts/{user.id}")
+        assert response.status_code == 200
+
+        item = response.json()["items"][0]
+        assert item["product_id"] == str(product.id)
+        assert item["quantity"] == 2
+        assert item["price"] == str(product.price.value)
+        assert item["product"] is None
+
+    def test_should_expand_products_with_a_bulk_lookup(self, timed_client, user, category, product):
+        other_product = ProductService(ProductRepository(), logger).create_product('other', 'other description', '1.50', 5, user.id, [category.id])
+        cart_repository.save(Cart(user.id, [CartItem.for_product(product, 2), CartItem.for_product(other_product, 1)]))
+
+        compact = timed_client.get(f"/api/carts/{user.id}")
+        expanded = timed_client.get(f"/api/carts/{user.id}", {"expand": "product"})
+        assert expanded.status_code == 200
+
+        items = {item["product_id"]: item for item in expanded.json()["items"]}
+        assert items[str(product.id)]["product"]["title"] == str(product.title.value)
+        assert items[str(other_product.id)]["product"]["categories"][0]["id"] == str(category.id)
+        assert len(compact.content) < len(expanded.content)
+
+    def test_should_reject_unknown_expansions(self, timed_client, user, product):
+        cart_repository.save(Cart(user.id, [CartItem.for_product(product, 1)]))
+
+        response = timed_client.get(f"/api/carts/{user.id}", {"expand": "owner"})
+        assert response.status_code == 422
+
+    def test_should_return_404_for_user_without_cart(self, timed_client, user):
+        response = timed_client.get(f"/api/carts/{user.id}")
+        assert response.status_code == 404
@@ -49,7 +49,7 @@ class TestListCategories:
         response = timed_client.get(url)
         assert response.status_code == 200
 
-        body = response.json()
+        body = response.json()["items"]
 
         assert isinstance(body, list)
         assert_has_valid_id(body[0])
@@ -57,6 +57,30 @@ class TestListCategories:
         assert body[0]["description"] == test_category.description.value
         assert_has_valid_timestamps(body[0])
 
+    def test_should_follow_next_cursor_until_last_page(self, timed_client):
+        repository = CategoryRepository()
+        service = CategoryService(repository, configure_logger(__name__))
+        created_ids = [str(service.create_category(f"category {letter}", "description").id) for letter in "abcde"]
+
+        listed_ids = []
+        params = {"limit": 2}
+        while True:
+            response = timed_client.get("/api/categories", params)
+            assert response.status_code == 200
+            body = response.json()
+            assert len(body["items"]) <= 2
+            listed_ids += [category["id"] for category in body["items"]]
+            if not body["next_cursor"]:
+                break
+            params = {"limit": 2, "cursor": body["next_cursor"]}
+
+        assert listed_ids == created_ids
+
+    def test_should_return_422_for_invalid_cursor(self, timed_client):
+        response = timed_client.get("/api/categories", {"cursor": "invalid"})
+        assert response.status_code == 422
+        assert "Invalid pagination cursor" in response.json()["message"]
+
 
 @pytest.mark.django_db
 class TestGetCategoryById:
@@ -0,0 +1,46 @@
+import pytest
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+REQUESTS = 50
+
+
+def run_requests(client, url, conn_max_age, monkeypatch):
+    monkeypatch.setitem(connection.settings_dict, "CONN_MAX_AGE", conn_max_age)
+    connection.close()
+    opened = []
+
+    def on_connection_created(sender, **kwargs):
+        opened.append(sender)
+
+    client.get(url)
+    close_old_connections()
+    connection_created.connect(on_connection_created)
+    try:
+        for _ in range(REQUESTS):
+            assert client.get(url).status_code == 200
+            # The test client skips the request_finished cleanup a WSGI server runs after each response.
+            close_old_connections()
+    finally:
+        connection_created.disconnect(on_connection_created)
+    return len(opened)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_persistent_connections_should_be_reused_across_requests(client, monkeypatch):
+    user = UserService(UserRepository(), logger).create_user("Test", "conn@test.com", "Abc@1234", "connUser")
+    url = f"/api/users/{user.id}"
+
+    assert run_requests(client, url, 0, monkeypatch) == REQUESTS
+    assert run_requests(client, url, 60, monkeypatch) == 0
+
+
+def test_settings_should_enable_persistent_connections_by_default(settings):
+    database = settings.DATABASES["default"]
+    assert database["CONN_MAX_AGE"] > 0
+    assert database["CONN_HEALTH_CHECKS"] is True
+    assert database["DISABLE_SERVER_SIDE_CURSORS"] is False
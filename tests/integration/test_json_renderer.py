@@ -0,0 +1,105 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from core import renderers
+from core.renderers import FastJSONRenderer
+from apps.orders.enums import OrderStatus
+from apps.orders.schemas import OrderSchema
+from apps.users.schema import UserSchema
+from ninja.renderers import JSONRenderer
+
+ORDERS = 1000
+
+requires_orjson = pytest.mark.skipif(renderers.orjson is None, reason="orjson is not installed")
+
+
+def make_order(index: int) -> dict:
+    user_id = uuid.uuid4()
+    return {
+        "id": uuid.uuid4(),
+        "user": {"id": user_id, "email": f"user{index}@test.com", "name": "Test", "username": f"user{index}"},
+        "address": {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "street": "Rua Humberto de Campos",
+            "street_number": "10",
+            "complement": "",
+            "district": "Leblon",
+            "city": "Rio de Janeiro",
+            "state_code": "RJ",
+            "postal_code": "22430190",
+            "country": "BR",
+            "is_default": True,
+            "validation_status": "valid",
+        },
+        "items": [
+            {
+                "id": uuid.uuid4(),
+                "product": {
+                    "id": uuid.uuid4(),
+                    "title": f"Product {item}",
+                    "description": "Description",
+                    "price": "19.90",
+                    "stock": 10,
+                    "owner_id": user_id,
+                    "categories": [{"id": uuid.uuid4(), "name": "Category", "description": None}],
+                },
+                "quantity": 2,
+                "price": "39.80",
+            }
+            for item in range(3)
+        ],
+        "status": OrderStatus.PENDING,
+        "total_amount": "119.40",
+    }
+
+
+@pytest.fixture(scope="module")
+def orders_payload():
+    """What ninja hands to the renderer for a 1k order list: schemas dumped in python mode."""
+    return [OrderSchema.model_validate(make_order(index)).model_dump() for index in range(ORDERS)]
+
+
+@requires_orjson
+def test_fast_renderer_should_match_stdlib_renderer_output(orders_payload):
+    assert json.loads(FastJSONRenderer().render(None, orders_payload, response_status=200)) == json.loads(
+        JSONRenderer().render(None, orders_payload, response_status=200)
+    )
+
+
+@requires_orjson
+def test_fast_renderer_should_keep_stdlib_datetime_and_decimal_format():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    data = {"created_at": created_at, "amount": Decimal("10.50"), "status": OrderStatus.APPROVED}
+
+    assert json.loads(FastJSONRenderer().render(None, data, response_status=200)) == {
+        "created_at": "2026-01-02T03:04:05.678Z",
+        "amount": "10.50",
+        "status": "approved",
+    }
+
+
+@requires_orjson
+def test_fast_renderer_should_dump_pydantic_models_in_json_mode():
+    user = UserSchema(
+        id=uuid.uuid4(),
+        name="Test",
+        email="user@test.com",
+        username="user",
+        is_active=True,
+        created_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        updated_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+    )
+
+    rendered = json.loads(FastJSONRenderer().render(None, {"items": [user]}, response_status=200))
+
+    assert rendered == {"items": [user.model_dump(mode="json")]}
+
+
+def test_fast_renderer_should_fall_back_to_stdlib_json():
+    renderer = FastJSONRenderer(use_orjson=False)
+
+    assert renderer.render(None, {"id": 1}, response_status=200) == '{"id": 1}'
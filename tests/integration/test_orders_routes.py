@@ -221,7 +221,7 @@ class TestListOrdersByUserId:
         response = timed_client.get(url, data={"user_id": str(test_user["id"])})
 
         assert response.status_code == 200
-        body = response.json()
+        body = response.json()["items"]
 
         assert len(body) == 1
         assert_order_data_is_equal(body[0], creation_body, product_stock, item_quantity)
@@ -239,7 +239,7 @@ class TestListOrdersByUserId:
         response = timed_client.get(url, data={"user_id": str(test_user["id"])})
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
 
 
 @pytest.mark.django_db
@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+from apps.categories.repository import CategoryRepository
+from apps.categories.service import CategoryService
+from apps.products.facets import rebuild_product_facets
+from apps.products.models import ProductFacetCountModel
+from apps.products.repository import ProductRepository
+from apps.products.schema import ProductActivationSchema, ProductUpdateSchema
+from apps.products.service import ProductService
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.db import connection
+from utils.logger import configure_logger
+
+test_logger = configure_logger("product_test_facets")
+user_service = UserService(UserRepository(), test_logger)
+category_service = CategoryService(CategoryRepository(), test_logger)
+product_service = ProductService(ProductRepository(), test_logger)
+
+# Default PRODUCT_FACET_PRICE_BOUNDARIES: 50 100 250 500 1000 2500
+PRICE_RANGES = [
+    ("0.00", "50.00"),
+    ("50.00", "100.00"),
+    ("100.00", "250.00"),
+    ("250.00", "500.00"),
+    ("500.00", "1000.00"),
+    ("1000.00", "2500.00"),
+    ("2500.00", None),
+]
+
+
+@pytest.fixture
+def catalogue():
+    owner = user_service.create_user("Owner", "owner@test.com", "Abc@1234")
+    electronics = category_service.create_category("electronics", "Electronics")
+    bags = category_service.create_category("bags", "Bags and cases")
+    products = {
+        "notebook": product_service.create_product("Notebook", "test description", "3200.00", 1, owner.id, [electronics.id]),
+        "mouse": product_service.create_product("Mouse", "test description", "80.00", 1, owner.id, [electronics.id]),
+        "case": product_service.create_product("Notebook case", "test description", "80.00", 1, owner.id, [electronics.id, bags.id]),
+        "backpack": product_service.create_product("Backpack", "test description", "300.00", 1, owner.id, [bags.id]),
+    }
+    return owner, {"electronics": electronics, "bags": bags}, products
+
+
+def category_counts(facets: dict) -> dict:
+    return {category["name"]: category["count"] for category in facets["categories"]}
+
+
+def price_counts(facets: dict) -> dict:
+    return {str(price_range["min_price"]): price_range["count"] for price_range in facets["price_ranges"] if price_range["count"]}
+
+
+def stored_counts() -> set:
+    return set(
+        ProductFacetCountModel.objects.filter(product_count__gt=0).values_list(
+            "category_id", "price_bucket", "is_active", "product_count"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestProductFacets:
+    def test_should_count_products_per_category_and_price_range(self, catalogue, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            facets = product_service.get_product_facets(is_active=True)
+
+        assert facets["categories"][0]["name"] == "electronics"
+        assert category_counts(facets) == {"electronics": 3, "bags": 2}
+        # Products in several categories count once per price range.
+        assert price_counts(facets) == {"50": 2, "250": 1, "2500": 1}
+
+    def test_each_facet_should_apply_the_other_facets_filter(self, catalogue):
+        _, categories, _ = catalogue
+
+        facets = product_service.get_product_facets(categories["bags"].id, min_price=50, max_price=250, is_active=True)
+
+        assert category_counts(facets) == {"electronics": 2, "bags": 1}
+        assert price_counts(facets) == {"50": 1, "250": 1}
+
+    def test_repository_writes_should_keep_counts_in_sync_with_a_rebuild(self, catalogue):
+        owner, categories, products = catalogue
+
+        product_service.update_product(products["mouse"].id, ProductUpdateSchema(price="120.00", categories=[categories["bags"].id]))
+        product_service.product_activation(products["notebook"].id, ProductActivationSchema(status=False))
+        product_service.update_product(products["backpack"].id, ProductUpdateSchema(title="Travel backpack"))
+        product_service.delete_product(products["case"].id)
+        incremental = stored_counts()
+
+        rebuild_product_facets()
+
+        assert incremental == stored_counts()
+        assert category_counts(product_service.get_product_facets(is_active=True)) == {"bags": 2}
+        assert category_counts(product_service.get_product_facets(is_active=False)) == {"electronics": 1}
+
+        user_service.delete_user(owner.id)
+        assert stored_counts() == set()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_updates_of_one_product_should_not_drift_the_counts(catalogue):
+    _, _, products = catalogue
+    product_id = products["backpack"].id
+
+    def update_price(prices):
+        try:
+            for price in prices:
+                product_service.update_product(product_id, ProductUpdateSchema(price=price))
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=update_price, args=(prices,)) for prices in (["20.00", "700.00"] * 5, ["80.00", "3000.00"] * 5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    incremental = stored_counts()
+
+    rebuild_product_facets()
+
+    assert incremental == stored_counts()
+
+
+@pytest.mark.django_db
+class TestProductFacetsRoute:
+    def test_should_return_facets_of_active_products(self, client, catalogue):
+        response = client.get("/api/products/facets")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [(category["name"], category["count"]) for category in body["categories"]] == [("electronics", 3), ("bags", 2)]
+        assert [(price_range["min_price"], price_range["max_price"]) for price_range in body["price_ranges"]] == PRICE_RANGES
+        assert [price_range["count"] for price_range in body["price_ranges"]] == [0, 2, 0, 1, 0, 0, 1]
+
+    @pytest.mark.parametrize(
+        "params", [{"min_price": "60"}, {"max_price": "75.5"}, {"min_price": "250", "max_price": "100"}]
+    )
+    def test_should_return_422_for_prices_off_the_bucket_boundaries(self, client, params):
+        assert client.get("/api/products/facets", params).status_code == 422
@@ -0,0 +1,60 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from apps.categories.models import CategoryModel
+from apps.categories.serializers import category_model_to_entity
+from apps.products.models import ProductModel
+from apps.products.product_entity import Product
+from apps.products.serializers import product_model_to_entity
+from apps.shared.value_objects import Description, Price, Stock, Title
+from apps.users.models import UserModel
+
+PRODUCTS = 100
+
+
+def validated_model_to_entity(product_model: ProductModel) -> Product:
+    """The hydration path before from_persistence: every value object re-validates."""
+    return Product(
+        id=product_model.id,
+        title=Title(product_model.title),
+        description=Description(product_model.description),
+        price=Price(product_model.price),
+        stock=Stock(product_model.stock),
+        owner_id=product_model.owner_id,
+        categories=[category_model_to_entity(c) for c in product_model.categories.all()],
+        is_active=product_model.is_active,
+        created_at=product_model.created_at,
+        updated_at=product_model.updated_at,
+    )
+
+
+@pytest.mark.django_db
+def test_hydrating_products_from_persistence_should_skip_validation(django_assert_num_queries):
+    owner = UserModel.objects.create(name="Owner", email="owner@test.com", password="hash")
+    category = CategoryModel.objects.create(name="Books", description="All kinds of books")
+    ProductModel.objects.bulk_create(
+        ProductModel(
+            title=f"Product {i}", description="A product description", price=Decimal("9.90"), stock=i, owner=owner
+        )
+        for i in range(PRODUCTS)
+    )
+    ProductModel.categories.through.objects.bulk_create(
+        ProductModel.categories.through(productmodel_id=product_id, categorymodel_id=category.id)
+        for product_id in ProductModel.objects.values_list("id", flat=True)
+    )
+    product_models = list(ProductModel.objects.prefetch_related("categories"))
+
+    with django_assert_num_queries(0):
+        validated = [validated_model_to_entity(product_model) for product_model in product_models]
+        with patch.object(Title, "_validate") as validate_title, patch.object(Price, "_validate") as validate_price:
+            trusted = [product_model_to_entity(product_model) for product_model in product_models]
+
+    validate_title.assert_not_called()
+    validate_price.assert_not_called()
+    assert [(p.id, p.title, p.description, p.price, p.stock) for p in trusted] == [
+        (p.id, p.title, p.description, p.price, p.stock) for p in validated
+    ]
+    assert trusted[0].categories[0].name.value == "Books"
+    assert not hasattr(trusted[0], "__dict__")
+    assert not hasattr(trusted[0].title, "__dict__")
@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+import pytest
+from apps.categories.models import CategoryModel
+from apps.products.models import ProductModel
+from apps.products.repository import ProductRepository
+from apps.products.search import ProductSearchIndex
+from apps.users.models import UserModel
+from django.db import connection
+
+repository = ProductRepository()
+
+PRODUCTS = [
+    # title, description, price, is_active, categories
+    ("Notebook Gamer 16GB", "Notebook para jogos com placa de video", "7500.00", True, ["electronics"]),
+    ("Notebook Office", "Leve e silencioso", "3200.00", True, ["electronics"]),
+    ("Mochila executiva", "Cabe um notebook de 15 polegadas", "199.90", True, ["bags"]),
+    ("Caderno universitario", "Caderno de 10 materias", "35.00", True, ["stationery"]),
+    ("Notebook antigo", "Fora de linha", "900.00", False, ["electronics"]),
+]
+
+
+@pytest.fixture
+def catalogue():
+    owner = UserModel.objects.create(name="Owner", email="owner@test.com", password="hash", username="owner")
+    categories = {
+        name: CategoryModel.objects.create(name=name, description="")
+        for name in ("electronics", "bags", "stationery")
+    }
+    products = {}
+    for title, description, price, is_active, category_names in PRODUCTS:
+        product = ProductModel.objects.create(
+            title=title, description=description, price=Decimal(price), stock=1, owner=owner, is_active=is_active
+        )
+        product.categories.set([categories[name] for name in category_names])
+        products[title] = product
+    return products, categories
+
+
+def titles(rows) -> list[str]:
+    return [row["title"] for row in rows]
+
+
+@pytest.fixture(params=["database", "in-process"])
+def search_backend(request, monkeypatch):
+    """Runs each search test on the database's full-text search and on the in-process fallback index."""
+    if request.param == "database" and connection.vendor != "postgresql":
+        pytest.skip("full-text search columns exist on PostgreSQL only")
+    if request.param == "in-process":
+        monkeypatch.setattr(connection, "vendor", "sqlite")
+    return request.param
+
+
+@pytest.mark.django_db
+class TestProductSearch:
+    def test_should_rank_title_matches_above_description_matches(self, catalogue, search_backend):
+        rows = repository.search_products("notebook", limit=10, is_active=True)
+
+        assert set(titles(rows)) == {"Notebook Gamer 16GB", "Notebook Office", "Mochila executiva"}
+        assert titles(rows)[-1] == "Mochila executiva"
+
+    def test_should_match_every_term_as_a_prefix(self, catalogue, search_backend):
+        assert titles(repository.search_products("note gam", limit=10)) == ["Notebook Gamer 16GB"]
+        assert titles(repository.search_products("CADERN", limit=10)) == ["Caderno universitario"]
+        assert repository.search_products("notebook bicicleta", limit=10) == []
+
+    def test_should_filter_by_category_price_range_and_activity(self, catalogue, search_backend):
+        _, categories = catalogue
+
+        assert set(titles(repository.search_products("notebook", limit=10, category_id=categories["bags"].id))) == {
+            "Mochila executiva"
+        }
+        assert set(titles(repository.search_products("notebook", limit=10, min_price=Decimal("1000"), max_price=Decimal("5000")))) == {
+            "Notebook Office"
+        }
+        assert titles(repository.search_products("notebook", limit=10, is_active=False)) == ["Notebook antigo"]
+        assert len(repository.search_products("notebook", limit=10)) == 4
+
+    def test_should_limit_results_and_attach_categories(self, catalogue, search_backend):
+        rows = repository.search_products("notebook", limit=2, is_active=True)
+
+        assert len(rows) == 2
+        assert all(row["categories"][0]["name"] == "electronics" for row in rows)
+
+    def test_should_ignore_punctuation_only_queries(self, catalogue, search_backend):
+        assert repository.search_products("!!! '&|", limit=10) == []
+
+
+@pytest.mark.django_db
+class TestProductSearchRoute:
+    def test_should_search_active_products_by_default(self, client, catalogue):
+        response = client.get("/api/products/search", {"q": "notebook"})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert {item["title"] for item in items} == {"Notebook Gamer 16GB", "Notebook Office", "Mochila executiva"}
+        assert items[0]["price"] == "7500.00"
+        assert items[0]["categories"][0]["name"] == "electronics"
+
+    def test_should_return_422_for_inverted_price_range(self, client, catalogue):
+        response = client.get("/api/products/search", {"q": "notebook", "min_price": "10", "max_price": "1"})
+
+        assert response.status_code == 422
+
+    def test_should_require_a_query(self, client):
+        assert client.get("/api/products/search").status_code == 422
+        assert client.get("/api/products/search", {"q": ""}).status_code == 422
+
+
+@pytest.mark.django_db
+def test_in_process_index_should_rebuild_after_product_writes(catalogue):
+    products, _ = catalogue
+    index = ProductSearchIndex()
+    assert products["Caderno universitario"].id in index.search(["caderno"])
+
+    products["Caderno universitario"].title = "Agenda"
+    products["Caderno universitario"].description = "Agenda anual"
+    products["Caderno universitario"].save()
+    assert index.search(["caderno"]) == {}
+
+    ProductModel.objects.filter(id=products["Notebook Office"].id).delete()
+    assert products["Notebook Office"].id not in index.search(["notebook"])
@@ -145,7 +145,7 @@ class TestGetProductByCategory:
         response = timed_client.get("/api/products", {"category_id": product.categories[0].id})
         assert response.status_code == 200
 
-        body = response.json()
+        body = response.json()["items"]
 
         assert isinstance(body, list)
         assert len(body) == 1
@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+import pytest
+from apps.addresses.models import AddressModel
+from apps.categories.models import CategoryModel
+from apps.products.models import ProductModel
+from apps.users.models import UserModel
+
+ROWS = 60
+PAGE_SIZE = 25
+
+
+@pytest.fixture
+def catalogue_data():
+    users = UserModel.objects.bulk_create(
+        UserModel(
+            name=f"User {chr(97 + i % 26)}",
+            email=f"user{i}@test.com",
+            password="hash",
+            username=None if i % 2 else f"user{i}",
+            is_active=bool(i % 3),
+        )
+        for i in range(ROWS)
+    )
+    books, games = CategoryModel.objects.bulk_create(
+        [
+            CategoryModel(name="Books", description="All kinds of books"),
+            CategoryModel(name="Games", description=""),
+        ]
+    )
+    products = ProductModel.objects.bulk_create(
+        ProductModel(
+            title=f"Product {i}",
+            description="A product description",
+            price=Decimal("10.50") + i,
+            stock=i,
+            owner=users[0],
+            is_active=bool(i % 4),
+        )
+        for i in range(ROWS)
+    )
+    for i, product in enumerate(products):
+        product.categories.set([books, games] if i % 5 == 0 else [books])
+    AddressModel.objects.bulk_create(
+        AddressModel(
+            user=users[0],
+            street="Rua Humberto de Campos",
+            street_number=str(i),
+            complement="",
+            district="Leblon",
+            city="Rio de Janeiro",
+            state_code="RJ",
+            postal_code="22430190",
+            country="BR",
+            is_default=i == 0,
+            validation_status="pending" if i % 2 else "valid",
+        )
+        for i in range(ROWS)
+    )
+    return {"user": users[0], "category": books}
+
+
+def fetch_all_pages(client, url: str, params: dict) -> list[dict]:
+    pages, cursor = [], None
+    while True:
+        response = client.get(url, {**params, "limit": PAGE_SIZE, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages.append(response.json())
+        if not (cursor := pages[-1]["next_cursor"]):
+            return pages
+
+
+def list_endpoints(data) -> list[tuple[str, dict]]:
+    return [
+        ("/api/products", {"category_id": data["category"].id}),
+        ("/api/categories", {}),
+        ("/api/users", {}),
+        (f"/api/addresses/user/{data['user'].id}", {}),
+    ]
+
+
+@pytest.mark.django_db
+def test_projection_should_render_the_same_json_as_entities(client, catalogue_data, settings):
+    for url, params in list_endpoints(catalogue_data):
+        settings.READ_PROJECTIONS_ENABLED = False
+        from_entities = fetch_all_pages(client, url, params)
+        settings.READ_PROJECTIONS_ENABLED = True
+        from_projection = fetch_all_pages(client, url, params)
+
+        assert from_projection == from_entities, url
+        assert sum(len(page["items"]) for page in from_projection) > 0
+
+
+@pytest.mark.django_db
+def test_projection_should_select_only_the_response_columns(client, catalogue_data, settings, django_assert_max_num_queries):
+    settings.READ_PROJECTIONS_ENABLED = True
+
+    with django_assert_max_num_queries(2) as queries:
+        client.get("/api/products", {"category_id": catalogue_data["category"].id, "limit": PAGE_SIZE})
+
+    assert '"products"."owner_id"' in queries.captured_queries[0]["sql"]
+    assert '"products"."categories"' not in queries.captured_queries[0]["sql"]
+    assert all('"users"' not in query["sql"] for query in queries.captured_queries)
@@ -67,8 +67,9 @@ class TestListUsers:
 
         assert response.status_code == 200
         body = response.json()
+        assert body["next_cursor"] is None
 
-        created_user_data = body[0]
+        created_user_data = body["items"][0]
 
         assert created_user_data["id"] == str(user.id)
         assert created_user_data["name"] == user.name.value
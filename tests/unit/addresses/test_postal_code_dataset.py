@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+import pytest
+from apps.addresses.validations.dataset import PostalCodeDataset
+from apps.addresses.validations.strategy_api.factory import get_api_country_strategy
+from apps.addresses.validations.strategy_api.validator_br import BrazilValidationStrategy
+from apps.addresses.validations.strategy_api.validator_dataset import DatasetValidationStrategy
+from django.core.management import CommandError, call_command
+
+DATASET = """country,postal_code,state,city,district,street
+BR,22430-190,RJ,Rio de Janeiro,Leblon,Rua Humberto de Campos
+BR,69900000,AC,Rio Branco,,
+US,20500,DC,Washington,,
+"""
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    csv_path = tmp_path / "postal_codes.csv"
+    csv_path.write_text(DATASET)
+    index_path = tmp_path / "index" / "postal_codes.sqlite3"
+    call_command("ingest_postal_codes", str(csv_path), output=str(index_path))
+    return str(index_path)
+
+
+def validate(strategy, street, district, city, state_code, postal_code, country):
+    return strategy.validate(street, "10", "", district, city, state_code, postal_code, country)
+
+
+def test_should_ingest_dataset_into_indexed_file(dataset_path):
+    dataset = PostalCodeDataset(dataset_path)
+
+    assert dataset.lookup("BR", "22430190") == {
+        "state": "RJ",
+        "city": "Rio de Janeiro",
+        "district": "Leblon",
+        "street": "Rua Humberto de Campos",
+    }
+    assert dataset.lookup("br", "22430-190")["city"] == "Rio de Janeiro"
+    assert dataset.lookup("BR", "00000000") is None
+
+
+def test_should_reject_dataset_without_required_columns(tmp_path):
+    csv_path = tmp_path / "broken.csv"
+    csv_path.write_text("postal_code,city\n22430190,Rio\n")
+
+    with pytest.raises(CommandError):
+        call_command("ingest_postal_codes", str(csv_path), output=str(tmp_path / "index.sqlite3"))
+
+
+def test_should_validate_from_dataset_and_fall_back_on_misses(dataset_path):
+    fallback = MagicMock()
+    fallback.validate.return_value = True
+    strategy = DatasetValidationStrategy(PostalCodeDataset(dataset_path), fallback)
+
+    assert validate(strategy, "Rua Humberto de Campos", "Leblon", "rio de janeiro", "RJ", "22430190", "BR") is True
+    assert validate(strategy, "Rua Errada", "Leblon", "Rio de Janeiro", "RJ", "22430190", "BR") is False
+    assert validate(strategy, "Any street", "Any district", "Rio Branco", "AC", "69900000", "BR") is True
+    assert validate(strategy, "1600 Pennsylvania Avenue NW", "Northwest", "Washington", "DC", "20500", "US") is True
+    fallback.validate.assert_not_called()
+
+    assert validate(strategy, "Rua Nova", "Centro", "Niterói", "RJ", "24020000", "BR") is True
+    fallback.validate.assert_called_once()
+
+
+def test_factory_should_wrap_http_strategy_when_dataset_exists(settings, dataset_path, tmp_path):
+    settings.POSTAL_CODE_DATASET_PATH = dataset_path
+    strategy = get_api_country_strategy("BR")
+    assert isinstance(strategy, DatasetValidationStrategy)
+    assert isinstance(strategy.fallback, BrazilValidationStrategy)
+    assert get_api_country_strategy("AR") is None
+
+    settings.POSTAL_CODE_DATASET_PATH = str(tmp_path / "missing.sqlite3")
+    assert isinstance(get_api_country_strategy("BR"), BrazilValidationStrategy)
@@ -0,0 +1,131 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from apps.addresses.models import PostalCodeLookupModel
+from apps.addresses.validations.circuit_breaker import CircuitBreaker
+from apps.addresses.validations.lookup_cache import PostalCodeLookupCache
+from apps.addresses.validations.strategy_api import lookup as lookup_module
+from apps.addresses.validations.strategy_api.lookup import PostalCodeLookup, PostalCodeUnavailableError, build_session
+from apps.addresses.validations.strategy_api.validator_br import BrazilValidationStrategy
+from apps.addresses.validations.validators import validate_postal_code
+from apps.shared.cache import LocalMemoryCache
+
+BR_PAYLOAD = {
+    "cep": "22430190",
+    "state": "RJ",
+    "city": "Rio de Janeiro",
+    "neighborhood": "Leblon",
+    "street": "Rua Humberto de Campos",
+}
+
+
+class StubPostalCodeApi(BaseHTTPRequestHandler):
+    responses: dict[str, tuple[int, dict]] = {}
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        status, payload = self.responses.get(self.path, (404, {"message": "not found"}))
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(settings):
+    StubPostalCodeApi.responses = {"/cep/22430190": (200, BR_PAYLOAD), "/cep/50000000": (503, {})}
+    StubPostalCodeApi.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPostalCodeApi)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings.POSTAL_CODE_BR_API_URL = f"http://127.0.0.1:{server.server_port}/cep"
+    yield StubPostalCodeApi
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def br_lookup(monkeypatch):
+    lookup = PostalCodeLookup(
+        "BR",
+        build_session(2),
+        PostalCodeLookupCache(LocalMemoryCache(max_size=10, ttl=60), ttl=60),
+        CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        timeout=1,
+    )
+    monkeypatch.setitem(lookup_module.lookups, "BR", lookup)
+    return lookup
+
+
+def validate(postal_code, street="Rua Humberto de Campos"):
+    return validate_postal_code(street, "10", "", "Leblon", "Rio de Janeiro", "RJ", postal_code, "BR")
+
+
+def test_should_validate_address_against_cached_lookup(stub_api, br_lookup):
+    assert validate("22430190") is True
+    assert validate("22430190") is True
+    assert validate("22430190", street="Rua Errada") is False
+
+    assert stub_api.requests == ["/cep/22430190"]
+
+
+def test_should_cache_unknown_postal_codes(stub_api, br_lookup):
+    assert validate("11111111") is False
+    assert validate("11111111") is False
+
+    assert stub_api.requests == ["/cep/11111111"]
+
+
+def test_should_fail_open_and_stop_calling_api_when_circuit_opens(stub_api, br_lookup):
+    assert validate("50000000") is True
+    assert validate("50000000") is True
+    assert br_lookup.breaker.state == CircuitBreaker.OPEN
+
+    assert validate("22430190") is True
+    assert stub_api.requests == ["/cep/50000000", "/cep/50000000"]
+
+
+def test_should_fail_open_when_api_is_unreachable(settings, br_lookup):
+    settings.POSTAL_CODE_BR_API_URL = "http://127.0.0.1:9/cep"
+
+    assert validate("22430190") is True
+    assert br_lookup.cache.get("BR", "22430190") is None
+    with pytest.raises(PostalCodeUnavailableError):
+        BrazilValidationStrategy().validate("Rua Humberto de Campos", "10", "", "Leblon", "Rio de Janeiro", "RJ", "22430190", "BR")
+
+
+@pytest.mark.django_db
+def test_persistent_cache_should_survive_memory_eviction():
+    cache = PostalCodeLookupCache(LocalMemoryCache(max_size=10, ttl=60), ttl=60, persistent=True)
+    cache.set("BR", "22430190", BR_PAYLOAD)
+    cache.clear()
+
+    assert cache.get("BR", "22430190") == BR_PAYLOAD
+    assert PostalCodeLookupModel.objects.filter(country="BR", postal_code="22430190").count() == 1
+
+    expired_cache = PostalCodeLookupCache(LocalMemoryCache(max_size=10, ttl=60), ttl=0, persistent=True)
+    assert expired_cache.get("BR", "22430190") is None
+
+
+def test_circuit_breaker_should_half_open_after_reset_timeout(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("apps.addresses.validations.circuit_breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.allow_request() is False
+
+    now[0] += 10
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is False
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
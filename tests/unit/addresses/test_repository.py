@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 from apps.addresses.entity import Address
 from apps.shared.value_objects.address import Street, StreetNumber, Complement, District, City, StateCode, PostalCode, Country
 from apps.addresses.repository import AddressRepository
+from apps.shared.exceptions import ConflictError
 from utils.logger import configure_logger
 from apps.users.repository import UserRepository
 from apps.users.service import UserService
@@ -107,6 +108,26 @@ class TestAddressCreation:
 
         assert repository.has_default_address_for(test_user.id) is True
 
+    def test_repository_should_raise_conflict_error_for_second_default_address(self, test_user, get_saved_address):
+        address = Address(
+            user_id=test_user.id,
+            street=street,
+            street_number=street_number,
+            complement=complement,
+            district=district,
+            city=city,
+            state_code=state_code,
+            postal_code=postal_code,
+            country=country,
+            is_default=True
+        )
+
+        with pytest.raises(ConflictError) as exc:
+            repository.save(address)
+
+        assert "one default address per user" in str(exc)
+        assert len(repository.list_addresses_for(test_user.id).items) == 1
+
 @pytest.mark.django_db
 class TestGetAddressById:
     def test_should_return_address_by_id_successfully_for_valid_address_id(self, get_saved_address):
@@ -129,11 +150,22 @@ class TestGetAddressById:
         assert repository.get_address_by_id(uuid4()) is None
 
 
+@pytest.mark.django_db
+class TestGetAddressesByIds:
+    def test_should_return_only_existing_addresses_for_given_ids(self, get_saved_address):
+        saved_address = get_saved_address
+        addresses = repository.get_addresses_by_ids([saved_address.id, saved_address.id, uuid4()])
+
+        assert len(addresses) == 1
+        assert addresses[0].id == saved_address.id
+        assert addresses[0].user_id == saved_address.user_id
+
+
 @pytest.mark.django_db
 class TestListAddressesForUser:
     def test_should_get_user_addresses_for_valid_user_successfully(self, test_user, get_saved_address):
         address = get_saved_address
-        addresses = repository.list_addresses_for(test_user.id)
+        addresses = repository.list_addresses_for(test_user.id).items
         assert len(addresses) == 1
 
         saved_address = addresses[0]
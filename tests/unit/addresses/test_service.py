@@ -3,6 +3,7 @@ from uuid import UUID, uuid4
 
 import pytest
 from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
 from apps.addresses.service import AddressService
 from apps.shared.value_objects.address import Street, StreetNumber, Complement, District, City, StateCode, PostalCode, Country
 from apps.shared.exceptions import UnprocessableEntityError, ConflictError, NotFoundError
@@ -255,7 +256,7 @@ class TestAddressCreation:
         user_id = mock_user.id
         
         mock_user_service.get_user_by_id.return_value = mock_user
-        mock_repository.has_default_address_for.return_value = True
+        mock_repository.save.side_effect = ConflictError("There can only be one default address per user")
 
         with pytest.raises(ConflictError) as exc:
             service.create_address(
@@ -270,6 +271,7 @@ class TestAddressCreation:
                 country_str,
                 is_default
             )
+        mock_repository.save.side_effect = None
         assert "one default address per user" in str(exc)
         assert mock_logger.warning.called_once()
         assert "one default address per user" in mock_logger.warning.call_args[0][0]
@@ -316,6 +318,27 @@ class TestGetAddressById:
         mock_logger.warning.assert_called_once()
         assert "Address not found" in mock_logger.warning.call_args[0][0]
 
+class TestGetAddressesByIds:
+    def test_should_get_addresses_by_ids_successfully(self):
+        mock_address = MagicMock()
+        mock_repository.get_addresses_by_ids.return_value = [ mock_address ]
+
+        addresses = service.get_addresses_by_ids([ mock_address.id ])
+
+        mock_repository.get_addresses_by_ids.assert_called_once_with([ mock_address.id ])
+        assert addresses == [ mock_address ]
+
+    def test_should_raise_not_found_error_for_missing_address_ids(self):
+        mock_logger.reset_mock()
+        mock_repository.get_addresses_by_ids.return_value = []
+        random_id = uuid4()
+
+        with pytest.raises(NotFoundError) as exc:
+            service.get_addresses_by_ids([ random_id ])
+
+        assert str(random_id) in str(exc)
+        mock_logger.warning.assert_called_once()
+
 class TestListAddressesForUser:
     def test_should_list_addresses_successfully_for_valid_user_id(self, create_test_address):
         mock_repository.list_addresses_for.return_value = [ create_test_address ]
@@ -335,6 +358,25 @@ class TestListAddressesForUser:
 
         mock_user_service.get_user_by_id.side_effect = None
 
+class TestDeferredAddressValidation:
+    def test_should_save_pending_address_and_submit_it_without_calling_the_api(self, monkeypatch, create_test_address):
+        mock_validate_postal_code = MagicMock()
+        monkeypatch.setattr("apps.addresses.service.validate_postal_code", mock_validate_postal_code)
+        mock_worker = MagicMock()
+        deferred_service = AddressService(mock_repository, mock_logger, mock_user_service, mock_worker)
+        mock_repository.has_default_address_for.return_value = False
+        mock_repository.save.side_effect = lambda address: address
+
+        address = deferred_service.create_address(
+            mock_user.id, "Rua Humberto de Campos", "0", "0", "Leblon", "Rio de janeiro", "RJ", "22430199", "BR", False
+        )
+
+        mock_validate_postal_code.assert_not_called()
+        assert address.validation_status == AddressValidationStatus.PENDING
+        mock_worker.submit.assert_called_once_with(address)
+        mock_repository.save.side_effect = None
+        mock_logger.reset_mock()
+
 class TestDeleteAddress:
     def test_should_delete_address_successfully(self):
         mock_address = MagicMock()
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
+from apps.addresses.repository import AddressRepository
+from apps.addresses.validations.worker import AddressValidationWorker, build_validation_worker
+from apps.shared.value_objects import City, Complement, Country, District, PostalCode, StateCode, Street, StreetNumber
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.core.management import call_command
+from django.db import transaction
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+@pytest.fixture
+def pending_address():
+    user = UserService(UserRepository(), logger).create_user("test user", "worker@test.com", "Abc@1234", "workerUser")
+
+    def _pending_address(postal_code="22430190"):
+        return AddressRepository().save(
+            Address(
+                user.id,
+                Street("Rua Humberto de Campos"),
+                StreetNumber("0"),
+                Complement("0"),
+                District("Leblon"),
+                City("Rio de janeiro"),
+                StateCode("RJ"),
+                PostalCode(postal_code),
+                Country("BR"),
+                False,
+                validation_status=AddressValidationStatus.PENDING,
+            )
+        )
+
+    return _pending_address
+
+
+@pytest.fixture
+def stub_validation(monkeypatch):
+    monkeypatch.setattr(
+        "apps.addresses.validations.worker.validate_postal_code",
+        lambda *args, **kwargs: args[6] == "22430190",
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_should_validate_pending_addresses_after_commit(pending_address, stub_validation):
+    repository = AddressRepository()
+    worker = AddressValidationWorker(repository, logger, max_workers=2)
+
+    with transaction.atomic():
+        valid_address = pending_address()
+        invalid_address = pending_address("22430199")
+        worker.submit(valid_address)
+        worker.submit(invalid_address)
+    worker.wait()
+
+    assert repository.get_address_by_id(valid_address.id).validation_status == AddressValidationStatus.VALID
+    assert repository.get_address_by_id(invalid_address.id).validation_status == AddressValidationStatus.INVALID
+
+
+@pytest.mark.django_db
+def test_should_keep_address_pending_while_postal_code_api_is_unavailable(pending_address, monkeypatch, settings):
+    settings.POSTAL_CODE_DATASET_PATH = ""
+    unavailable_lookup = SimpleNamespace(fetch=lambda postal_code, url: None)
+    monkeypatch.setattr("apps.addresses.validations.strategy_api.validator_br.get_postal_code_lookup", lambda country: unavailable_lookup)
+    repository = AddressRepository()
+    address = pending_address()
+
+    assert AddressValidationWorker(repository, logger).validate(address) is None
+    assert repository.get_address_by_id(address.id).validation_status == AddressValidationStatus.PENDING
+
+    call_command("validate_pending_addresses")
+    assert repository.get_address_by_id(address.id).validation_status == AddressValidationStatus.PENDING
+
+
+@pytest.mark.django_db
+def test_should_keep_address_pending_when_validation_raises(pending_address, monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError("unexpected payload")
+
+    monkeypatch.setattr("apps.addresses.validations.worker.validate_postal_code", broken)
+    repository = AddressRepository()
+    address = pending_address()
+
+    assert AddressValidationWorker(repository, logger).validate(address) is None
+    assert repository.get_address_by_id(address.id).validation_status == AddressValidationStatus.PENDING
+
+
+@pytest.mark.django_db
+def test_command_should_validate_addresses_left_pending(pending_address, stub_validation):
+    repository = AddressRepository()
+    address = pending_address()
+
+    call_command("validate_pending_addresses")
+
+    assert repository.get_address_by_id(address.id).validation_status == AddressValidationStatus.VALID
+    assert repository.list_pending_validation() == []
+
+
+def test_worker_should_only_be_built_in_deferred_mode(settings):
+    settings.ADDRESS_VALIDATION_MODE = "sync"
+    assert build_validation_worker(AddressRepository(), logger) is None
+
+    settings.ADDRESS_VALIDATION_MODE = "deferred"
+    assert isinstance(build_validation_worker(AddressRepository(), logger), AddressValidationWorker)
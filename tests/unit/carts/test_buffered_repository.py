@@ -0,0 +1,202 @@
+import threading
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from apps.carts.buffered_repository import BufferedCartRepository
+from apps.carts.entity import Cart, CartItem
+from apps.carts.repository import CartRepository
+from apps.carts.service import CartService
+from apps.categories.repository import CategoryRepository
+from apps.categories.service import CategoryService
+from apps.products.repository import ProductRepository
+from apps.products.service import ProductService
+from apps.shared.exceptions import ServiceUnavailableError
+from apps.shared.cache import DjangoCache
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.core.cache import caches
+from django.db import connection
+from utils.logger import configure_logger
+
+test_logger = configure_logger("cart_test_buffered_repository")
+user_service = UserService(UserRepository(), test_logger)
+product_service = ProductService(ProductRepository(), test_logger)
+category_service = CategoryService(CategoryRepository(), test_logger)
+database = CartRepository()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches["default"].clear()
+    yield
+    caches["default"].clear()
+
+
+def build_buffer(repository=database, flush_interval: float = 0) -> BufferedCartRepository:
+    return BufferedCartRepository(repository, DjangoCache(ttl=60), test_logger, flush_interval)
+
+
+@pytest.fixture
+def buffer():
+    return build_buffer()
+
+
+@pytest.fixture
+def products():
+    user = user_service.create_user('test', 'test@test.com', 'Abc@1234')
+    category = category_service.create_category('test cat', 'test cat desc')
+    return [
+        product_service.create_product(f'test {index}', 'test description', '2.22', 10, user.id, [category.id])
+        for index in range(2)
+    ]
+
+
+@pytest.fixture
+def cart(products):
+    return Cart(products[0].owner_id, [CartItem.for_product(products[0], 1)])
+
+
+def stored_quantities(user_id) -> dict:
+    stored_cart = database.get_cart_by_user(user_id)
+    return {item.product_id: item.quantity for item in stored_cart.items} if stored_cart else None
+
+
+@pytest.mark.django_db
+class TestBufferedCartRepository:
+    def test_mutations_should_stay_in_the_cache_until_flushed(self, buffer, cart, products, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            buffer.save(cart)
+            cart.add_item(CartItem.for_product(products[1], 2))
+            buffer.update(cart)
+            buffered_cart = buffer.get_cart_by_user(cart.user_id)
+
+        assert {item.product_id: item.quantity for item in buffered_cart.items} == {products[0].id: 1, products[1].id: 2}
+        assert stored_quantities(cart.user_id) is None
+        assert buffer.pending == {cart.user_id}
+
+    def test_flush_should_write_buffered_carts_to_the_database(self, buffer, cart, products):
+        buffer.save(cart)
+        assert buffer.flush() == 1
+        assert stored_quantities(cart.user_id) == {products[0].id: 1}
+
+        cart.add_item(CartItem.for_product(products[1], 2))
+        buffer.update(cart)
+        assert buffer.flush(cart.user_id) == 1
+
+        assert stored_quantities(cart.user_id) == {products[0].id: 1, products[1].id: 2}
+        assert buffer.pending == set()
+        assert buffer.flush() == 0
+
+    def test_should_read_through_to_the_database_on_cache_miss(self, buffer, cart, products, django_assert_num_queries):
+        database.save(cart)
+
+        assert buffer.get_cart_by_user(cart.user_id).id == cart.id
+        with django_assert_num_queries(0):
+            assert buffer.get_cart_by_user(cart.user_id).id == cart.id
+        assert buffer.pending == set()
+
+    def test_a_restarted_worker_should_flush_carts_left_dirty_in_the_cache(self, cart, products):
+        crashed_worker = build_buffer()
+        crashed_worker.save(cart)
+
+        restarted_worker = build_buffer()
+        assert restarted_worker.pending == set()
+        assert restarted_worker.get_cart_by_user(cart.user_id).id == cart.id
+        assert restarted_worker.pending == {cart.user_id}
+
+        assert restarted_worker.flush() == 1
+        assert stored_quantities(cart.user_id) == {products[0].id: 1}
+
+    def test_unflushed_changes_should_be_lost_when_the_cache_loses_the_cart(self, buffer, cart, products):
+        buffer.save(cart)
+        buffer.flush()
+        cart.add_item(CartItem.for_product(products[1], 2))
+        buffer.update(cart)
+
+        caches["default"].clear()
+
+        assert buffer.flush() == 0
+        assert stored_quantities(cart.user_id) == {products[0].id: 1}
+
+    def test_failed_flush_should_keep_the_cart_buffered(self, cart):
+        repository = MagicMock()
+        repository.update.side_effect = [Exception("database is down"), cart]
+        buffer = build_buffer(repository)
+        buffer.save(cart)
+
+        assert buffer.flush() == 0
+        assert buffer.pending == {cart.user_id}
+
+        assert buffer.flush() == 1
+        assert repository.update.call_count == 2
+        assert buffer.pending == set()
+
+    def test_background_flusher_should_write_pending_carts(self, cart):
+        repository = MagicMock()
+        buffer = build_buffer(repository, flush_interval=0.01)
+        buffer.save(cart)
+
+        deadline = time.monotonic() + 2
+        while repository.update.call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        buffer.close()
+
+        assert repository.update.call_count == 1
+        assert buffer.pending == set()
+
+
+class SlowReadBuffer(BufferedCartRepository):
+    """Widens the window between reading and writing a cart, where unlocked mutations race."""
+
+    def get_cart_by_user(self, user_id):
+        cart = super().get_cart_by_user(user_id)
+        time.sleep(0.05)
+        return cart
+
+
+class SlowReadDatabase(CartRepository):
+    def get_cart_by_user(self, user_id):
+        cart = super().get_cart_by_user(user_id)
+        time.sleep(0.05)
+        return cart
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    "build_store", [lambda: SlowReadBuffer(database, DjangoCache(ttl=60), test_logger), SlowReadDatabase], ids=["cache", "database"]
+)
+def test_concurrent_mutations_of_one_cart_should_not_lose_lines(products, build_store):
+    buffer = build_store()
+    service = CartService(buffer, product_service, user_service, test_logger)
+    user_id = products[0].owner_id
+    service.create_cart(user_id)
+
+    def add_to_cart(product_id):
+        try:
+            service.add_to_cart(user_id, product_id, 1)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=add_to_cart, args=(product.id,)) for product in products * 2]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    cart = buffer.get_cart_by_user(user_id)
+    assert {item.product_id: item.quantity for item in cart.items} == {products[0].id: 2, products[1].id: 2}
+
+
+def test_lock_should_time_out_while_another_request_holds_it():
+    buffer = BufferedCartRepository(MagicMock(), DjangoCache(ttl=60), test_logger, lock_timeout=0.05)
+    user_id = uuid4()
+
+    with buffer.lock_cart(user_id):
+        with pytest.raises(ServiceUnavailableError):
+            with buffer.lock_cart(user_id):
+                pass
+
+    with buffer.lock_cart(user_id):
+        pass
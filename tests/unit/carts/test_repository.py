@@ -1,13 +1,14 @@
+from decimal import Decimal
 from uuid import uuid4
 from apps.carts.repository import CartRepository
 from apps.carts.entity import Cart, CartItem
+from apps.carts.models import CartItemModel
 from apps.products.service import ProductService
 from apps.products.repository import ProductRepository
 from apps.users.service import UserService
 from apps.users.repository import UserRepository
 from apps.categories.service import CategoryService
 from apps.categories.repository import CategoryRepository
-from apps.products.product_entity import Product
 from utils.logger import configure_logger
 import pytest
 
@@ -27,7 +28,7 @@ def test_cart():
     category = category_service.create_category('test cat', 'test cat desc')
     product = product_service.create_product('test', 'test description', '2.22', 1, user.id, [category.id])
     quantity = 1
-    cart_item = CartItem(product, quantity)
+    cart_item = CartItem.for_product(product, quantity)
     cart_id = uuid4()
     cart = Cart(user.id, [cart_item], cart_id)
     return cart
@@ -46,8 +47,8 @@ def assert_is_equal(saved_cart, cart):
     assert isinstance(saved_cart.items, list)
     assert len(saved_cart.items) == 1
     assert isinstance(saved_cart.items[0], CartItem)
-    assert isinstance(saved_cart.items[0].product, Product)
-    assert saved_cart.items[0].product.id == cart.items[0].product.id
+    assert saved_cart.items[0].product_id == cart.items[0].product_id
+    assert saved_cart.items[0].price == cart.items[0].price
     assert saved_cart.items[0].quantity == cart.items[0].quantity
 
 
@@ -65,7 +66,7 @@ class TestCartRepository:
         category = category_service.create_category('test cat', 'test2 cat desc')
         product = product_service.create_product('test2', 'test2 description', '2.22', 1, user.id, [category.id])
         quantity = 1
-        new_cart_item = CartItem(product, quantity)
+        new_cart_item = CartItem.for_product(product, quantity)
 
         assert len(saved_cart.items) == 1
         saved_cart.items.append(new_cart_item)
@@ -74,9 +75,94 @@ class TestCartRepository:
         assert len(updated_cart.items) == 2
 
         added_item = updated_cart.items[1]
-        assert added_item.product.id == new_cart_item.product.id
+        assert added_item.product_id == new_cart_item.product_id
         assert added_item.quantity == new_cart_item.quantity
 
         saved_cart.items.clear()
         updated_cart = repository.update(saved_cart)
-        assert len(updated_cart.items) == 0
\ No newline at end of file
+        assert len(updated_cart.items) == 0
+
+CART_SIZE = 50
+
+
+@pytest.fixture
+def full_cart(test_cart):
+    user_id = test_cart.user_id
+    category = category_service.create_category('bulk cat', 'bulk cat desc')
+    for index in range(CART_SIZE - 1):
+        product = product_service.create_product(f'bulk {index}', 'bulk description', '1.00', 10, user_id, [category.id])
+        test_cart.items.append(CartItem.for_product(product, 1))
+    repository.save(test_cart)
+    return repository.get_cart_by_user(user_id)
+
+
+@pytest.fixture
+def extra_product(test_cart):
+    category = category_service.create_category('extra cat', 'extra cat desc')
+    return product_service.create_product('extra', 'extra description', '3.33', 5, test_cart.user_id, [category.id])
+
+
+def stored_quantities(cart: Cart) -> dict:
+    return dict(CartItemModel.objects.filter(cart_id=cart.id).values_list("product_id", "quantity"))
+
+
+@pytest.mark.django_db
+class TestCartRepositoryQueries:
+    """Cart writes apply only the delta, so their query count does not grow with the cart size."""
+
+    def test_get_cart_by_user_should_load_cart_and_items_in_two_queries(self, full_cart, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            cart = repository.get_cart_by_user(full_cart.user_id)
+
+        assert len(cart.items) == CART_SIZE
+        assert {item.price.value for item in cart.items} == {Decimal("2.22"), Decimal("1.00")}
+
+    def test_save_should_insert_cart_and_items_in_two_queries(self, test_cart, django_assert_num_queries):
+        with django_assert_num_queries(4):  # cart + items, inside a savepoint
+            repository.save(test_cart)
+
+        assert stored_quantities(test_cart) == {test_cart.items[0].product_id: 1}
+
+    def test_adding_an_item_should_upsert_only_the_new_line(self, full_cart, extra_product, django_assert_num_queries):
+        full_cart.add_item(CartItem.for_product(extra_product, 2))
+
+        with django_assert_num_queries(5):  # lock, read lines, upsert, inside a savepoint
+            updated_cart = repository.update(full_cart)
+
+        assert len(updated_cart.items) == CART_SIZE + 1
+        assert stored_quantities(full_cart)[extra_product.id] == 2
+
+    def test_increasing_a_quantity_should_upsert_only_the_changed_line(self, full_cart, django_assert_num_queries):
+        product_id = full_cart.items[10].product_id
+        item_id = full_cart.items[10].id
+        full_cart.add_item(CartItem(product_id, 4, full_cart.items[10].price))
+
+        with django_assert_num_queries(5):
+            updated_cart = repository.update(full_cart)
+
+        assert updated_cart.items[10].id == item_id
+        assert stored_quantities(full_cart)[product_id] == 5
+        assert CartItemModel.objects.get(cart_id=full_cart.id, product_id=product_id).id == item_id
+
+    def test_removing_an_item_should_delete_only_the_removed_line(self, full_cart, django_assert_num_queries):
+        product_id = full_cart.items[0].product_id
+        full_cart.remove_cart_item(product_id)
+
+        with django_assert_num_queries(5):  # lock, read lines, delete, inside a savepoint
+            repository.update(full_cart)
+
+        quantities = stored_quantities(full_cart)
+        assert product_id not in quantities
+        assert len(quantities) == CART_SIZE - 1
+
+    def test_clearing_the_cart_should_delete_every_line_in_one_query(self, full_cart, django_assert_num_queries):
+        full_cart.clear_cart()
+
+        with django_assert_num_queries(5):
+            repository.update(full_cart)
+
+        assert stored_quantities(full_cart) == {}
+
+    def test_update_without_changes_should_not_write(self, full_cart, django_assert_num_queries):
+        with django_assert_num_queries(4):  # lock and read lines, inside a savepoint
+            repository.update(full_cart)
@@ -56,7 +56,7 @@ class TestCartAddProduct:
 
         assert len(updated_cart.items) == 1
         assert isinstance(updated_cart.items[0], CartItem)
-        assert updated_cart.items[0].product.id == mock_product.id
+        assert updated_cart.items[0].product_id == mock_product.id
         assert updated_cart.items[0].quantity == quantity
         reset_mocks()
 
@@ -78,7 +78,7 @@ class TestCartAddProduct:
 
         assert len(updated_cart.items) == 1
         assert isinstance(updated_cart.items[0], CartItem)
-        assert updated_cart.items[0].product.id == mock_product.id
+        assert updated_cart.items[0].product_id == mock_product.id
         assert updated_cart.items[0].quantity == quantity
         reset_mocks()
 
@@ -95,7 +95,7 @@ class TestCartSubtractItemQuantity:
      def test_should_subtract_cart_item_quantity_successfully(self):
         quantity_to_subtract = 1
         quantity = 3
-        cart_item = CartItem(mock_product, quantity)
+        cart_item = CartItem.for_product(mock_product, quantity)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
 
@@ -110,7 +110,7 @@ class TestCartSubtractItemQuantity:
      def test_should_subtract_quantity_and_remove_cart_item_if_subtraction_result_is_zero(self):
         quantity_to_subtract = 1
         quantity = 1
-        cart_item = CartItem(mock_product, quantity)
+        cart_item = CartItem.for_product(mock_product, quantity)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
 
@@ -124,7 +124,7 @@ class TestCartSubtractItemQuantity:
 
      def test_should_raise_conflict_error_for_quantity_greater_than_cart_item_quantity(self):
         quantity_to_subtract = 4
-        cart_item = CartItem(mock_product, 3)
+        cart_item = CartItem.for_product(mock_product, 3)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
 
@@ -134,7 +134,7 @@ class TestCartSubtractItemQuantity:
 
      def test_should_raise_not_found_error_for_non_existent_product(self):
         quantity_to_subtract = 1
-        cart_item = CartItem(mock_product, 3)
+        cart_item = CartItem.for_product(mock_product, 3)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
 
@@ -151,7 +151,7 @@ class TestCartSubtractItemQuantity:
 class TestRemoveCartItem:
     def test_should_remove_cart_item_even_if_ramining_quantity_is_greater_than_zero(self):
         quantity = 3
-        cart_item = CartItem(mock_product, quantity)
+        cart_item = CartItem.for_product(mock_product, quantity)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
         updated_cart = service.remove_cart_item(mock_user.id, mock_product.id)
@@ -167,7 +167,7 @@ class TestRemoveCartItem:
 
     def test_should_raise_not_found_error_for_not_found_product(self):
         quantity = 3
-        cart_item = CartItem(mock_product, quantity)
+        cart_item = CartItem.for_product(mock_product, quantity)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
         with pytest.raises(NotFoundError) as exc:
@@ -177,7 +177,7 @@ class TestRemoveCartItem:
 class TestClearCart:
     def test_should_clear_cart_items_successfully(self):
         quantity = 3
-        cart_item = CartItem(mock_product, quantity)
+        cart_item = CartItem.for_product(mock_product, quantity)
         cart_with_item = Cart(mock_user.id, [cart_item])
         mock_repository.get_cart_by_user.return_value = cart_with_item
         updated_cart = service.clear_cart(mock_user.id)
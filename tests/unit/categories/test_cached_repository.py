@@ -0,0 +1,109 @@
+from uuid import uuid4
+
+import pytest
+from apps.categories.cached_repository import CachedCategoryRepository, CategoryCatalogue, build_category_repository
+from apps.categories.entity import Category
+from apps.categories.repository import CategoryRepository
+from apps.categories.service import CategoryService
+from apps.categories.schema import CategoryUpdateSchema
+from apps.products.repository import ProductRepository
+from apps.products.service import ProductService
+from apps.shared.value_objects import Description, Name
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+@pytest.fixture
+def repository():
+    cache.delete(CategoryCatalogue.VERSION_KEY)
+    inner_repository = CategoryRepository()
+    return CachedCategoryRepository(inner_repository, CategoryCatalogue(inner_repository.list_all_categories))
+
+
+@pytest.fixture
+def saved_categories(repository):
+    return [
+        repository.save(Category(Name(f"category {chr(97 + index)}"), Description("description")))
+        for index in range(10)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCachedCategoryRepository:
+    def test_should_serve_reads_from_snapshot_after_first_load(self, repository, saved_categories):
+        repository.list_categories()
+
+        with CaptureQueriesContext(connection) as queries:
+            page = repository.list_categories()
+            category = repository.get_category_by_id(saved_categories[0].id)
+            categories = repository.get_categories_by_ids([saved.id for saved in saved_categories])
+
+        assert len(queries) == 0
+        assert [listed.id for listed in page.items] == [saved.id for saved in saved_categories]
+        assert category.id == saved_categories[0].id
+        assert len(categories) == 10
+        assert repository.get_category_by_id(uuid4()) is None
+
+    def test_should_rebuild_snapshot_after_writes(self, repository, saved_categories):
+        service = CategoryService(repository, logger)
+        version = (repository.list_categories(), repository.catalogue.version)[1]
+
+        service.update_category(saved_categories[0].id, CategoryUpdateSchema(name="renamed"))
+        assert repository.get_category_by_id(saved_categories[0].id).name.value == "renamed"
+
+        repository.delete_category(saved_categories[1].id)
+        assert repository.get_category_by_id(saved_categories[1].id) is None
+        assert repository.catalogue.version != version
+
+    def test_should_not_leak_mutations_into_snapshot(self, repository, saved_categories):
+        category = repository.get_category_by_id(saved_categories[0].id)
+        category.rename("mutated")
+
+        assert repository.get_category_by_id(saved_categories[0].id).name.value == "category a"
+
+    def test_should_read_from_database_inside_atomic_block(self, repository, saved_categories):
+        repository.list_categories()
+
+        with transaction.atomic():
+            CategoryRepository().delete_category(saved_categories[0].id)
+            assert repository.get_category_by_id(saved_categories[0].id) is None
+
+    def test_product_creation_with_ten_categories_should_not_query_categories(self, repository, saved_categories):
+        user = UserService(UserRepository(), logger).create_user("test user", "catalogue@test.com", "Abc@1234", "catalogueUser")
+        product_service = ProductService(ProductRepository(), logger, CategoryService(repository, logger))
+        repository.list_categories()
+
+        with CaptureQueriesContext(connection) as queries:
+            product = product_service.create_product(
+                "title", "description", "1.99", 5, user.id, [saved.id for saved in saved_categories]
+            )
+
+        assert {category.id for category in product.categories} == {saved.id for saved in saved_categories}
+        # Only the product's own category join is read back after the insert; no lookup by id.
+        assert not any('FROM "categories" WHERE' in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_snapshot_should_be_rebuilt_after_its_ttl(saved_categories):
+    inner_repository = CategoryRepository()
+    catalogue = CategoryCatalogue(inner_repository.list_all_categories, ttl=0)
+    catalogue.snapshot()
+
+    # Written outside the repository, so the version stamp is not bumped.
+    inner_repository.delete_category(saved_categories[0].id)
+
+    assert saved_categories[0].id not in catalogue.snapshot()
+
+
+def test_catalogue_should_be_disabled_without_a_shared_cache(tmp_path):
+    assert isinstance(build_category_repository(), CategoryRepository)
+
+    shared_cache = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}
+    with override_settings(CACHES={"default": shared_cache}):
+        assert isinstance(build_category_repository(), CachedCategoryRepository)
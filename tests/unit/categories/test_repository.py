@@ -39,7 +39,7 @@ class TestCategoryRepository:
     def test_should_retrive_categories_list(self, category_and_saved_category):
         category, saved_category = category_and_saved_category
 
-        categories = repository.list_categories()
+        categories = repository.list_categories().items
         assert categories[0] is not None
 
         retrieved_category = categories[0]
@@ -52,6 +52,15 @@ class TestCategoryRepository:
         assert_is_equal(retrieved_category, saved_category)
         assert_is_equal(retrieved_category, category)
 
+    def test_should_get_categories_by_ids_in_a_single_query(self, category_and_saved_category, django_assert_num_queries):
+        category, saved_category = category_and_saved_category
+        other_category = repository.save(Category(Name("other"), Description("other description")))
+
+        with django_assert_num_queries(1):
+            categories = repository.get_categories_by_ids([saved_category.id, other_category.id, uuid4()])
+
+        assert {retrieved.id for retrieved in categories} == {saved_category.id, other_category.id}
+
     def test_should_update_category_successfully(self, category_and_saved_category):
         category, saved_category = category_and_saved_category
         saved_category.rename("new name")
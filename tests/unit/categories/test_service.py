@@ -78,6 +78,27 @@ class TestGetCategoryById:
             service.get_category_by_id("invalid id")
         assert "Category not found" in str(exc)
 
+class TestGetCategoriesByIds:
+    def test_should_return_categories_in_requested_order(self, category, service_and_repository):
+        service, mock_repository, mock_logger = service_and_repository
+        other_category = Category(Name("Other"), Description("Other description"), uuid4(), datetime.now(), datetime.now())
+        mock_repository.get_categories_by_ids.return_value = [category, other_category]
+
+        categories = service.get_categories_by_ids([other_category.id, category.id])
+
+        mock_repository.get_categories_by_ids.assert_called_once_with([other_category.id, category.id])
+        assert [retrieved.id for retrieved in categories] == [other_category.id, category.id]
+
+    def test_should_fail_when_any_category_is_missing(self, category, service_and_repository):
+        service, mock_repository, mock_logger = service_and_repository
+        mock_repository.get_categories_by_ids.return_value = [category]
+        missing_id = uuid4()
+
+        with pytest.raises(NotFoundError) as exc:
+            service.get_categories_by_ids([category.id, missing_id])
+        assert str(missing_id) in str(exc)
+        mock_logger.warning.assert_called_once()
+
 class TestUpdateCategory:
     def test_should_update_category_successfully(self, category, service_and_repository):
         service, mock_repository, mock_logger = service_and_repository
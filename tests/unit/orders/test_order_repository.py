@@ -15,6 +15,9 @@ from utils.logger import configure_logger
 from apps.addresses.service import AddressService
 from apps.addresses.repository import AddressRepository
 from apps.orders.enums import OrderStatus
+from apps.shared.value_objects import Price
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import pytest
 
 
@@ -42,10 +45,7 @@ def create_test_order(reserved_quantity_1, reserved_quantity_2):
     cart_service.add_to_cart(user.id, product1.id, reserved_quantity_1)
     cart = cart_service.add_to_cart(user.id, product2.id, reserved_quantity_2)
 
-    for item in cart.items:
-        print(f"DEBUG: product_id={item.product.id}, price={item.product.price}, type={type(item.product.price)}")
-
-    order_items = [ OrderItem(item.product.id, item.quantity, item.product.price) for item in cart.items ]
+    order_items = [ OrderItem(item.product_id, item.quantity, item.price) for item in cart.items ]
 
     return Order(user.id, address.id, order_items, OrderStatus.PENDING)
 
@@ -96,7 +96,7 @@ class TestOrderRepository:
 
         saved_order = repository.save(order)
 
-        orders = repository.list_orders_by_user_id(saved_order.user_id)
+        orders = repository.list_orders_by_user_id(saved_order.user_id).items
 
         listed_order = orders[0]
 
@@ -178,3 +178,29 @@ class TestOrderRepository:
 
 
 
+def build_order_with_lines(lines_count):
+    items = [ OrderItem(uuid4(), 1, Price("9.90")) for _ in range(lines_count) ]
+    return Order(uuid4(), uuid4(), items, OrderStatus.PENDING)
+
+
+@pytest.mark.django_db
+class TestOrderRepositoryRoundTrips:
+    @pytest.mark.parametrize("lines_count", [1, 10, 100])
+    def test_save_and_update_should_not_scale_round_trips_with_order_lines(self, lines_count):
+        order = build_order_with_lines(lines_count)
+
+        with CaptureQueriesContext(connection) as save_queries:
+            saved_order = repository.save(order)
+
+        saved_order._items[0]._quantity = 3
+        saved_order._items.pop()
+        saved_order._items.append(OrderItem(uuid4(), 2, Price("1.00")))
+
+        with CaptureQueriesContext(connection) as update_queries:
+            repository.update_order(saved_order)
+
+        retrieved_order = repository.get_order_by_id(saved_order.id)
+        assert len(retrieved_order.items) == lines_count
+        assert { item.id: item.quantity for item in retrieved_order.items } == { item.id: item.quantity for item in saved_order.items }
+        assert len(save_queries) <= 2
+        assert len(update_queries) <= 5
@@ -8,7 +8,23 @@ from apps.orders.entity import Order, OrderItem
 from apps.orders.enums import OrderStatus
 from apps.orders.schemas import OrderSchema
 from apps.shared.value_objects import Price, Stock
-from apps.shared.exceptions import OutOfStockError
+from apps.shared.exceptions import OutOfStockError, UnprocessableEntityError
+from apps.shared.pagination import Page
+from apps.shared.value_objects import City, Complement, Country, District, PostalCode, StateCode, Street, StreetNumber
+from apps.orders.repository import OrderRepository
+from apps.addresses.entity import Address
+from apps.addresses.enums import AddressValidationStatus
+from apps.addresses.repository import AddressRepository
+from apps.addresses.service import AddressService
+from apps.categories.repository import CategoryRepository
+from apps.categories.service import CategoryService
+from apps.products.repository import ProductRepository
+from apps.products.service import ProductService
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from utils.logger import configure_logger
 
 
 @pytest.fixture
@@ -46,7 +62,7 @@ def create_mock_user():
     user.updated_at = datetime.now()
     return user
 
-def create_mock_address(id=None, user_id=None):
+def create_mock_address(id=None, user_id=None, validation_status=AddressValidationStatus.VALID):
     address = MagicMock()
     address.id = id or uuid4()
     address.user_id = user_id or uuid4()
@@ -59,11 +75,14 @@ def create_mock_address(id=None, user_id=None):
     address.postal_code.value = "12345678"
     address.country.value = "BR"
     address.is_default = True
+    address.validation_status = validation_status
     return address
 
 def create_mock_cart_item(product=None, quantity=1):
     cart_item = MagicMock()
-    cart_item.product = product or create_mock_product()
+    product = product or create_mock_product()
+    cart_item.product_id = product.id
+    cart_item.price = product.price
     cart_item.quantity = quantity
     return cart_item
 
@@ -128,7 +147,7 @@ class TestOrderCreation:
         )
 
         order_service.repository.save.return_value = order
-        order_service.product_service.get_product_by_id.side_effect = [product1, product2]
+        order_service.product_service.get_products_by_ids.return_value = [product1, product2]
 
         result = order_service.create_order(user_id, address_id)
 
@@ -138,6 +157,20 @@ class TestOrderCreation:
         assert result.user.id == user.id
         assert result.address.id == address.id
         assert result.total_amount == str(sum(item.price.value * item.quantity for item in order._items))
+        order_service.product_service.reserve_stock_many.assert_called_once_with({product1.id: 2, product2.id: 1})
+        order_service.cart_service.flush_cart.assert_called_once_with(user_id)
+
+    def test_should_fail_create_order_with_address_marked_invalid(self, order_service):
+        order_service.cart_service.get_cart_by_user.return_value = create_mock_cart()
+        order_service.address_service.get_address_by_id.return_value = create_mock_address(
+            validation_status=AddressValidationStatus.INVALID
+        )
+
+        with pytest.raises(UnprocessableEntityError):
+            order_service.create_order(uuid4(), uuid4())
+
+        order_service.product_service.reserve_stock_many.assert_not_called()
+        order_service.repository.save.assert_not_called()
 
 
     def test_should_fail_create_order_with_out_of_stock_product(self, order_service):
@@ -150,7 +183,8 @@ class TestOrderCreation:
         product.stock = Stock(1)  # Estoque insuficiente
 
         cart_item = MagicMock()
-        cart_item.product = product
+        cart_item.product_id = product.id
+        cart_item.price = product.price
         cart_item.quantity = 5
 
         cart = MagicMock()
@@ -165,7 +199,7 @@ class TestOrderCreation:
         user.id = user_id
         order_service.user_service.get_user_by_id.return_value = user
 
-        order_service.product_service.reserve_stock.side_effect = OutOfStockError("Out of stock product")
+        order_service.product_service.reserve_stock_many.side_effect = OutOfStockError("Out of stock product")
 
         with pytest.raises(OutOfStockError):
             order_service.create_order(user_id, address_id)
@@ -193,14 +227,14 @@ class TestGetOrderById:
         order_service.repository.get_order_by_id.return_value =order
         order_service.user_service.get_user_by_id.return_value = mock_user
         order_service.address_service.get_address_by_id.return_value = mock_address
-        order_service.product_service.get_product_by_id.return_value = mock_product
+        order_service.product_service.get_products_by_ids.return_value = [mock_product]
 
         order_dto = order_service.get_order_by_id(order.id)
 
         order_service.repository.get_order_by_id.assert_called_once_with(order.id)
         order_service.user_service.get_user_by_id.assert_called_once_with(order.user_id)
         order_service.address_service.get_address_by_id.assert_called_once_with(order.address_id)
-        order_service.product_service.get_product_by_id.assert_called_once_with(mock_order_item.product_id)
+        order_service.product_service.get_products_by_ids.assert_called_once_with([mock_order_item.product_id])
         assert_order_is_equal(order_dto, order, mock_order_item)
         assert order.status == OrderStatus.PENDING
 
@@ -226,19 +260,20 @@ class TestUserOrderListing:
         mock_order.items = [ mock_order_item ]
         mock_order.status = OrderStatus.PENDING
 
-        order_service.repository.list_orders_by_user_id.return_value = [ mock_order ]
+        order_service.repository.list_orders_by_user_id.return_value = Page([ mock_order ])
         order_service.user_service.get_user_by_id.return_value = mock_user
-        order_service.address_service.get_address_by_id.return_value = mock_address
-        order_service.product_service.get_product_by_id.return_value = mock_product
+        order_service.address_service.get_addresses_by_ids.return_value = [ mock_address ]
+        order_service.product_service.get_products_by_ids.return_value = [mock_product]
 
         orders = order_service.list_orders_by_user_id(mock_user.id)
         order_service.user_service.get_user_by_id(mock_user.id)
-        order_service.repository.list_orders_by_user_id.assert_called_once_with(mock_user.id)
-        order_service.address_service.get_address_by_id.assert_called_once_with(mock_address.id)
-        order_service.product_service.get_product_by_id.assert_called_once_with(mock_order_item.product_id)
-        assert isinstance(orders, list)
-        assert len(orders) == 1
-        order = orders[0]
+        order_service.repository.list_orders_by_user_id.assert_called_once_with(mock_user.id, None)
+        order_service.address_service.get_addresses_by_ids.assert_called_once_with([mock_address.id])
+        order_service.address_service.get_address_by_id.assert_not_called()
+        order_service.product_service.get_products_by_ids.assert_called_once_with([mock_order_item.product_id])
+        assert isinstance(orders, Page)
+        assert len(orders.items) == 1
+        order = orders.items[0]
         assert_order_is_equal(order, mock_order, mock_order_item)
         assert order.status == OrderStatus.PENDING
 
@@ -265,7 +300,7 @@ class TestOrderStatusChange:
         order_service.repository.get_order_by_id.return_value = order
         order_service.user_service.get_user_by_id.return_value = mock_user
         order_service.address_service.get_address_by_id.return_value = mock_address
-        order_service.product_service.get_product_by_id.return_value = mock_product
+        order_service.product_service.get_products_by_ids.return_value = [mock_product]
         
         order_approved = order_service.set_status(order.id, OrderStatus.APPROVED)
         assert_order_is_equal(order_approved, order, mock_order_item)
@@ -312,11 +347,11 @@ class TestRemoveItemFromOrder:
         order_service.repository.update_order.return_value = order
 
 
-        # Mock do get_user_by_id, get_address_by_id e get_product_by_id
+        # Mock do get_user_by_id, get_address_by_id e get_products_by_ids
         order_service.user_service.get_user_by_id.return_value = mock_user
         order_service.address_service.get_address_by_id.return_value = mock_address
 
-        order_service.product_service.get_product_by_id.return_value = mock_product2
+        order_service.product_service.get_products_by_ids.return_value = [mock_product2]
 
         # Executar o método
         result_dto = order_service.remove_item_from_order(order.id, mock_order_item1.id)
@@ -374,11 +409,11 @@ class TestCancelOrder:
         order_service.repository.update_order.return_value = order
 
 
-        # Mock do get_user_by_id, get_address_by_id e get_product_by_id
+        # Mock do get_user_by_id, get_address_by_id e get_products_by_ids
         order_service.user_service.get_user_by_id.return_value = mock_user
         order_service.address_service.get_address_by_id.return_value = mock_address
 
-        order_service.product_service.get_product_by_id.side_effect = [mock_product1, mock_product2]
+        order_service.product_service.get_products_by_ids.return_value = [mock_product1, mock_product2]
 
         # Executar o método
         result_dto = order_service.cancel_order(order.id)
@@ -432,11 +467,11 @@ class TestChangeOrderItemQuantity:
         order_service.repository.update_order.return_value = order
 
 
-        # Mock do get_user_by_id, get_address_by_id e get_product_by_id
+        # Mock do get_user_by_id, get_address_by_id e get_products_by_ids
         order_service.user_service.get_user_by_id.return_value = mock_user
         order_service.address_service.get_address_by_id.return_value = mock_address
 
-        order_service.product_service.get_product_by_id.return_value = mock_product
+        order_service.product_service.get_products_by_ids.return_value = [mock_product]
 
         quantity_to_add = 3
         total_amount_before = order.total_amount
@@ -477,11 +512,11 @@ class TestChangeOrderItemQuantity:
         order_service.repository.update_order.return_value = order
 
 
-        # Mock do get_user_by_id, get_address_by_id e get_product_by_id
+        # Mock do get_user_by_id, get_address_by_id e get_products_by_ids
         order_service.user_service.get_user_by_id.return_value = mock_user
         order_service.address_service.get_address_by_id.return_value = mock_address
 
-        order_service.product_service.get_product_by_id.return_value = mock_product
+        order_service.product_service.get_products_by_ids.return_value = [mock_product]
 
         quantity_to_subtract = 3
         total_amount_before = order.total_amount
@@ -499,4 +534,76 @@ class TestChangeOrderItemQuantity:
         
 
 
-    
\ No newline at end of file
+    
+
+def create_persisted_orders(orders_count, items_per_order, email):
+    logger = configure_logger("order_test_service")
+    user_service = UserService(UserRepository(), logger)
+    product_service = ProductService(ProductRepository(), logger)
+    category_service = CategoryService(CategoryRepository(), logger)
+
+    user = user_service.create_user("test", email, "Abc@1234")
+    category = category_service.create_category("categ", "categ descript")
+    address = AddressRepository().save(
+        Address(
+            user.id,
+            Street("rua humberto de campos"),
+            StreetNumber("382"),
+            Complement("402"),
+            District("Leblon"),
+            City("Rio de janeiro"),
+            StateCode("RJ"),
+            PostalCode("22430190"),
+            Country("BR"),
+            True,
+        )
+    )
+
+    orders = []
+    for _ in range(orders_count):
+        items = []
+        for index in range(items_per_order):
+            product = product_service.create_product(f"prod {index}", "description", 5, 10, user.id, [category.id])
+            items.append(OrderItem(product.id, 1, product.price))
+        orders.append(OrderRepository().save(Order(user.id, address.id, items, OrderStatus.PENDING)))
+
+    return orders
+
+
+@pytest.mark.django_db
+class TestOrderRenderingQueryCount:
+    @pytest.fixture
+    def service(self):
+        logger = configure_logger("order_test_service")
+        user_service = UserService(UserRepository(), logger)
+        product_service = ProductService(ProductRepository(), logger)
+        address_service = AddressService(AddressRepository(), logger, user_service)
+        return OrderService(OrderRepository(), user_service, product_service, MagicMock(), address_service)
+
+    def test_should_render_order_in_constant_number_of_queries(self, service):
+        [small_order] = create_persisted_orders(1, 1, "small@testmail.com")
+        [large_order] = create_persisted_orders(1, 30, "large@testmail.com")
+
+        with CaptureQueriesContext(connection) as small_order_queries:
+            service.get_order_by_id(small_order.id)
+
+        with CaptureQueriesContext(connection) as large_order_queries:
+            rendered_order = service.get_order_by_id(large_order.id)
+
+        assert len(rendered_order.items) == 30
+        assert all(item.product.categories for item in rendered_order.items)
+        assert len(large_order_queries) == len(small_order_queries)
+
+    def test_should_list_user_orders_in_constant_number_of_queries(self, service):
+        [small_order] = create_persisted_orders(1, 1, "small@testmail.com")
+        large_orders = create_persisted_orders(8, 5, "large@testmail.com")
+
+        with CaptureQueriesContext(connection) as small_list_queries:
+            service.list_orders_by_user_id(small_order.user_id)
+
+        with CaptureQueriesContext(connection) as large_list_queries:
+            listed_orders = service.list_orders_by_user_id(large_orders[0].user_id).items
+
+        assert len(listed_orders) == 8
+        assert all(len(order.items) == 5 for order in listed_orders)
+        assert len(large_list_queries) == len(small_list_queries)
@@ -0,0 +1,129 @@
+import pytest
+from apps.categories.models import CategoryModel
+from apps.categories.repository import CategoryRepository
+from apps.categories.service import CategoryService
+from apps.products.cached_repository import CachedProductRepository
+from apps.products.product_entity import Product
+from apps.products.repository import ProductRepository
+from apps.shared.cache import DjangoCache, LocalMemoryCache
+from apps.shared.value_objects import Description, Price, Stock, Title
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+@pytest.fixture(params=["locmem", "django"])
+def cache(request):
+    if request.param == "locmem":
+        return LocalMemoryCache(max_size=100, ttl=60)
+    cache = DjangoCache(alias="default", ttl=60, key_prefix="test-products:")
+    cache.clear()
+    return cache
+
+
+@pytest.fixture
+def saved_product():
+    user = UserService(UserRepository(), logger).create_user(
+        "test user", "cached@test.com", "Abc@1234", "cachedUser"
+    )
+    category = CategoryService(CategoryRepository(), logger).create_category("category", "description")
+    product = Product(Title("Title test"), Description("some description"), Price("1.99"), Stock(5), user.id, [category])
+    return ProductRepository().save(product)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCachedProductRepository:
+    def test_should_serve_repeated_reads_from_cache(self, cache, saved_product):
+        repository = CachedProductRepository(ProductRepository(), cache)
+
+        repository.get_product_by_id(saved_product.id)
+        with CaptureQueriesContext(connection) as queries:
+            product = repository.get_product_by_id(saved_product.id)
+
+        assert len(queries) == 0
+        assert product.id == saved_product.id
+        assert product.categories[0].id == saved_product.categories[0].id
+        assert (repository.stats.hits, repository.stats.misses) == (1, 1)
+
+    def test_should_load_only_missing_products_in_bulk(self, cache, saved_product):
+        repository = CachedProductRepository(ProductRepository(), cache)
+        repository.get_products_by_ids([saved_product.id])
+
+        with CaptureQueriesContext(connection) as queries:
+            products = repository.get_products_by_ids([saved_product.id])
+
+        assert len(queries) == 0
+        assert [product.id for product in products] == [saved_product.id]
+
+    def test_should_invalidate_on_update_and_delete(self, cache, saved_product):
+        repository = CachedProductRepository(ProductRepository(), cache)
+        product = repository.get_product_by_id(saved_product.id)
+
+        product.change_title("changed title")
+        repository.update_product(product)
+        assert repository.get_product_by_id(saved_product.id).title.value == "changed title"
+
+        repository.delete_product(product)
+        assert repository.get_product_by_id(saved_product.id) is None
+
+    def test_should_invalidate_reserved_stock(self, cache, saved_product):
+        repository = CachedProductRepository(ProductRepository(), cache)
+        repository.get_product_by_id(saved_product.id)
+
+        repository.reserve_stock_many({saved_product.id: 2})
+
+        assert repository.get_product_by_id(saved_product.id).stock.value == 3
+
+    def test_should_bypass_cache_inside_atomic_block(self, cache, saved_product):
+        repository = CachedProductRepository(ProductRepository(), cache)
+        stale_product = repository.get_product_by_id(saved_product.id)
+
+        with transaction.atomic():
+            repository.reserve_stock_many({saved_product.id: 2})
+            # Another worker repopulates the key with the committed (pre-reservation) row.
+            cache.set(repository._key(saved_product.id), stale_product)
+            assert repository.get_product_by_id(saved_product.id).stock.value == 3
+
+        assert repository.get_product_by_id(saved_product.id).stock.value == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_category_changes_and_owner_deletion_should_evict_cached_products(saved_product, monkeypatch):
+    cache = LocalMemoryCache(max_size=100, ttl=60)
+    monkeypatch.setattr("apps.products.cached_repository.product_cache", cache)
+    repository = CachedProductRepository(ProductRepository(), cache)
+    category = saved_product.categories[0]
+
+    repository.get_product_by_id(saved_product.id)
+    category.rename("renamed")
+    CategoryRepository().update_category(category)
+    assert repository.get_product_by_id(saved_product.id).categories[0].name.value == "renamed"
+
+    CategoryRepository().delete_category(category.id)
+    assert repository.get_product_by_id(saved_product.id).categories == []
+
+    UserRepository().delete_user(saved_product.owner_id)
+    assert repository.get_product_by_id(saved_product.id) is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deleting_a_category_should_evict_its_products_once_it_is_gone(saved_product, monkeypatch):
+    cache = LocalMemoryCache(max_size=100, ttl=60)
+    monkeypatch.setattr("apps.products.cached_repository.product_cache", cache)
+    category_id = saved_product.categories[0].id
+    evictions = []
+    delete_many = cache.delete_many
+
+    def recording_delete_many(keys):
+        evictions.append((keys, CategoryModel.objects.filter(id=category_id).exists()))
+        delete_many(keys)
+
+    monkeypatch.setattr(cache, "delete_many", recording_delete_many)
+    CategoryRepository().delete_category(category_id)
+
+    # A reader racing the delete can only re-cache the product before this last eviction.
+    assert evictions[-1] == ([CachedProductRepository._key(saved_product.id)], False)
@@ -13,6 +13,7 @@ from apps.categories.repository import CategoryRepository
 from utils.logger import configure_logger
 from apps.categories.entity import Category
 from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
 import threading
 from time import sleep
@@ -106,11 +107,24 @@ class TestProductRepository:
         assert isinstance(retrieved_product.created_at, datetime)
         assert isinstance(retrieved_product.updated_at, datetime)
 
+    def test_should_get_products_by_ids(self, create_product_and_repository, categories, test_user):
+        product, repository = create_product_and_repository
+        other_product = Product(Title("other title"), Description("other description"), Price("2.99"), Stock(3), test_user.id, categories)
+        repository.save(product)
+        repository.save(other_product)
+
+        retrieved_products = repository.get_products_by_ids([product.id, other_product.id, product.id])
+
+        assert isinstance(retrieved_products, list)
+        assert len(retrieved_products) == 2
+        assert {p.id for p in retrieved_products} == {product.id, other_product.id}
+        assert all(p.categories[0].id == categories[0].id for p in retrieved_products)
+
     def test_should_list_products_by_category(self, create_product_and_repository):
         product, repository = create_product_and_repository
         saved_product = repository.save(product)
 
-        products = repository.list_products_by_category(category_id=saved_product.categories[0].id)
+        products = repository.list_products_by_category(category_id=saved_product.categories[0].id).items
 
         assert isinstance(products, list)
         assert len(products) == 1
@@ -163,6 +177,28 @@ class TestProductRepository:
         assert updated_product.is_active is True
         assert updated_product.updated_at > product.updated_at
 
+    def test_should_persist_only_changed_fields_on_update(self, create_product_and_repository):
+        test_product, repository = create_product_and_repository
+        product = repository.save(test_product)
+
+        product.reserve_stock(2)
+        with CaptureQueriesContext(connection) as queries:
+            updated_product = repository.update_product(product)
+
+        writes = [query["sql"] for query in queries if not query["sql"].startswith("SELECT")]
+        assert len(writes) == 1
+        assert writes[0].startswith("UPDATE")
+        assert '"stock"' in writes[0] and '"updated_at"' in writes[0]
+        assert '"title"' not in writes[0]
+        assert updated_product.stock.value == 3
+        assert updated_product.categories[0].id == product.categories[0].id
+        assert product.changed_fields == frozenset()
+
+        with CaptureQueriesContext(connection) as queries:
+            repository.update_product(product)
+
+        assert all(query["sql"].startswith("SELECT") for query in queries)
+
     def test_should_delete_product_successfully(self, create_product_and_repository):
         product, repository = create_product_and_repository
         repository.delete_product(product)
@@ -205,3 +241,46 @@ class TestProductRepository:
         assert result["t2_after"] == 2
 
         
+
+    def test_should_reserve_stock_many_and_report_failed_products(self, create_product_and_repository, categories, test_user):
+        product, repository = create_product_and_repository
+        scarce_product = Product(Title("scarce"), Description("scarce product"), Price("2.99"), Stock(1), test_user.id, categories)
+        repository.save(product)
+        repository.save(scarce_product)
+
+        with CaptureQueriesContext(connection) as queries:
+            failed_ids = repository.reserve_stock_many({product.id: 2, scarce_product.id: 3})
+
+        assert failed_ids == [scarce_product.id]
+        assert len(queries) == 2
+        assert not any("categories" in query["sql"] for query in queries)
+        assert repository.get_product_by_id(product.id).stock.value == 3
+        assert repository.get_product_by_id(scarce_product.id).stock.value == 1
+        assert repository.get_product_by_id(product.id).categories[0].id == categories[0].id
+
+    @pytest.mark.django_db(transaction=True)
+    def test_reserve_stock_many_concurrently_should_never_oversell(self, create_product_and_repository):
+        product, repository = create_product_and_repository
+        saved_product = repository.save(product)
+        threads_count = 25
+
+        results = []
+        barrier = threading.Barrier(threads_count)
+
+        def reserve_one():
+            try:
+                barrier.wait()
+                with transaction.atomic():
+                    results.append(not repository.reserve_stock_many({saved_product.id: 1}))
+            finally:
+                connection.close()
+
+        threads = [ threading.Thread(target=reserve_one) for _ in range(threads_count) ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == saved_product.stock.value
+        assert results.count(False) == threads_count - saved_product.stock.value
+        assert repository.get_product_by_id(saved_product.id).stock.value == 0
@@ -79,7 +79,7 @@ class TestProductCreation:
         mock_repository, service = mock_repository_and_service
 
         mock_user_service.get_user_by_id.return_value = mock_user
-        mock_category_service.get_category_by_id.return_value = test_category
+        mock_category_service.get_categories_by_ids.return_value = [test_category]
         mock_repository.save.return_value = test_product
 
         product = service.create_product(
@@ -148,6 +148,29 @@ class TestGetProductById:
         assert "not found" in mock_logger.warning.call_args[0][0]
 
 
+class TestGetProductsByIds:
+    def test_should_get_products_by_ids_successfully(self, test_product, mock_repository_and_service):
+        mock_repository, service = mock_repository_and_service
+
+        mock_repository.get_products_by_ids.return_value = [test_product]
+
+        products = service.get_products_by_ids([test_product.id])
+
+        mock_repository.get_products_by_ids.assert_called_once_with([test_product.id])
+        assert products == [test_product]
+
+    def test_should_raise_not_found_error_for_missing_product_ids(self, test_product, mock_repository_and_service):
+        mock_repository, service = mock_repository_and_service
+        missing_id = uuid4()
+
+        mock_repository.get_products_by_ids.return_value = [test_product]
+
+        with pytest.raises(NotFoundError) as exc:
+            service.get_products_by_ids([test_product.id, missing_id])
+
+        assert str(missing_id) in str(exc)
+
+
 class TestListProductsByCategory:
     def test_should_list_products_by_category_successfully(
         self, product_args, test_product, mock_repository_and_service
@@ -320,6 +343,42 @@ class TestProductStockReservation:
         assert "Product not found" in str(exc)
         assert "Product not found" in mock_logger.warning.call_args[0][0]
 
+@pytest.mark.django_db # usado por causa do atomic apenas
+class TestProductStockManyReservation:
+    def test_should_reserve_stock_of_many_products_successfully(self, mock_repository_and_service):
+        mock_repository, service = mock_repository_and_service
+        reservations = {uuid4(): 2, uuid4(): 1}
+        mock_repository.reserve_stock_many.return_value = []
+
+        service.reserve_stock_many(reservations)
+
+        mock_repository.reserve_stock_many.assert_called_once_with(reservations)
+        mock_repository.update_product.assert_not_called()
+
+    def test_should_raise_out_of_stock_error_listing_failed_products(self, mock_repository_and_service):
+        mock_repository, service = mock_repository_and_service
+        failed_id = uuid4()
+        mock_repository.reserve_stock_many.return_value = [failed_id]
+        mock_repository.get_products_by_ids.return_value = [MagicMock(id=failed_id)]
+
+        with pytest.raises(OutOfStockError) as exc:
+            service.reserve_stock_many({uuid4(): 1, failed_id: 5})
+
+        assert str(failed_id) in str(exc)
+
+    def test_should_raise_not_found_error_for_deleted_products(self, mock_repository_and_service):
+        mock_repository, service = mock_repository_and_service
+        scarce_id, deleted_id = uuid4(), uuid4()
+        mock_repository.reserve_stock_many.return_value = [scarce_id, deleted_id]
+        mock_repository.get_products_by_ids.return_value = [MagicMock(id=scarce_id)]
+
+        with pytest.raises(NotFoundError) as exc:
+            service.reserve_stock_many({scarce_id: 5, deleted_id: 1})
+
+        assert str(deleted_id) in str(exc)
+        assert str(scarce_id) not in str(exc)
+        mock_repository.get_products_by_ids.assert_called_once_with([scarce_id, deleted_id])
+
 class TestProductStockRelease:
     def test_should_release_stock_quantity_successfully(self, test_product, mock_repository_and_service):
         mock_repository, service = mock_repository_and_service
@@ -0,0 +1,53 @@
+import pytest
+from apps.shared.cache import DjangoCache, LocalMemoryCache, build_cache_backend
+
+
+def test_local_memory_cache_should_evict_least_recently_used_entry():
+    cache = LocalMemoryCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_local_memory_cache_should_expire_entries_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("apps.shared.cache.backends.time.monotonic", lambda: now[0])
+    cache = LocalMemoryCache(max_size=10, ttl=5)
+    cache.set("a", 1)
+
+    now[0] += 4
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+
+
+def test_local_memory_cache_should_return_copies_of_cached_values():
+    cache = LocalMemoryCache()
+    cache.set("a", ["value"])
+
+    cache.get("a").append("mutated")
+
+    assert cache.get("a") == ["value"]
+
+
+def test_django_cache_should_prefix_keys_and_support_bulk_operations():
+    cache = DjangoCache(alias="default", ttl=60, key_prefix="test:")
+    cache.set_many({"a": 1, "b": 2})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+    cache.delete_many(["a"])
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_build_cache_backend_should_reject_unknown_backend():
+    assert build_cache_backend("none", ttl=60) is None
+    with pytest.raises(ValueError):
+        build_cache_backend("memcached-please", ttl=60)
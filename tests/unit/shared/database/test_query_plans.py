@@ -0,0 +1,55 @@
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+
+from apps.addresses.models import AddressModel
+from apps.orders.models import OrderModel
+from apps.products.models import ProductModel
+from apps.users.models import UserModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="query plans are checked on PostgreSQL only"),
+]
+
+
+@pytest.fixture
+def without_seqscan():
+    # Test tables are tiny, so the planner would pick a sequential scan regardless of indexes.
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+
+def test_order_list_should_use_user_created_index(without_seqscan):
+    plan = OrderModel.objects.filter(user_id=uuid4()).order_by("created_at", "id")[:21].explain()
+
+    assert "orders_user_created_idx" in plan
+
+
+def test_address_list_should_use_user_created_index(without_seqscan):
+    plan = AddressModel.objects.filter(user__id=uuid4()).order_by("created_at", "id")[:21].explain()
+
+    assert "addresses_user_created_idx" in plan
+
+
+def test_pending_addresses_should_use_partial_index(without_seqscan):
+    plan = AddressModel.objects.filter(validation_status="pending").explain()
+
+    assert "addresses_pending_idx" in plan
+
+
+def test_user_list_should_use_created_index(without_seqscan):
+    plan = UserModel.objects.order_by("created_at", "id")[:21].explain()
+
+    assert "users_created_idx" in plan
+
+
+def test_product_search_should_use_search_vector_index(without_seqscan):
+    plan = ProductModel.objects.alias(
+        matches=RawSQL("products.search_vector @@ to_tsquery('simple', %s)", ("note:*",), output_field=BooleanField())
+    ).filter(matches=True).explain()
+
+    assert "products_search_vector_idx" in plan
@@ -0,0 +1,100 @@
+from copy import deepcopy
+from uuid import uuid4
+
+import pytest
+from apps.categories.repository import CategoryRepository
+from apps.products.cached_repository import CachedProductRepository
+from apps.products.repository import ProductRepository
+from apps.shared.cache import LocalMemoryCache
+from apps.shared.database import REPLICA_DB_ALIAS, read_from_primary, read_only, replica_pinning_middleware
+from apps.users.models import UserModel
+from apps.users.repository import UserRepository
+from apps.users.service import UserService
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.test.utils import CaptureQueriesContext
+from utils.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+
+@pytest.fixture
+def replica(transactional_db):
+    """A second alias pointing at the test database, standing in for a streaming replica."""
+    settings_dict = deepcopy(connections[DEFAULT_DB_ALIAS].settings_dict)
+    connections.settings[REPLICA_DB_ALIAS] = settings_dict
+    yield connections[REPLICA_DB_ALIAS]
+    connections[REPLICA_DB_ALIAS].close()
+    del connections[REPLICA_DB_ALIAS]
+    del connections.settings[REPLICA_DB_ALIAS]
+
+
+def in_request(func):
+    return replica_pinning_middleware(lambda request: func())(None)
+
+
+def test_reads_should_stay_on_primary_without_replica():
+    with read_only():
+        assert router.db_for_read(UserModel) == DEFAULT_DB_ALIAS
+
+
+def test_read_only_reads_should_go_to_replica(replica):
+    user = UserService(UserRepository(), logger).create_user("Test", "replica@test.com", "Abc@1234", "replicaUser")
+
+    def request():
+        with CaptureQueriesContext(replica) as replica_queries:
+            assert UserRepository().get_user_by_id(user.id).id == user.id
+            assert UserModel.objects.filter(id=user.id).exists()
+        return replica_queries
+
+    replica_queries = in_request(request)
+
+    assert len(replica_queries) == 1
+
+
+def test_reads_after_a_write_should_stick_to_primary_for_the_rest_of_the_request(replica):
+    repository = UserRepository()
+    user = UserService(repository, logger).create_user("Test", "sticky@test.com", "Abc@1234", "stickyUser")
+
+    def request():
+        UserModel.objects.filter(id=user.id).update(username="changedUser")
+        with CaptureQueriesContext(replica) as replica_queries:
+            assert repository.get_user_by_id(user.id).username == "changedUser"
+        return replica_queries
+
+    assert len(in_request(request)) == 0
+
+    def next_request():
+        with read_only():
+            return router.db_for_read(UserModel)
+
+    assert in_request(next_request) == REPLICA_DB_ALIAS
+
+
+def test_reads_inside_atomic_blocks_should_stay_on_primary(replica):
+    def request():
+        with transaction.atomic(), read_only():
+            return router.db_for_read(UserModel)
+
+    assert in_request(request) == DEFAULT_DB_ALIAS
+    assert router.allow_migrate(REPLICA_DB_ALIAS, "users") is False
+
+
+def test_read_from_primary_should_override_read_only_methods(replica):
+    def request():
+        with read_from_primary(), read_only():
+            return router.db_for_read(UserModel)
+
+    assert in_request(request) == DEFAULT_DB_ALIAS
+
+
+def test_cache_fills_should_read_from_primary(replica):
+    repository = CachedProductRepository(ProductRepository(), LocalMemoryCache())
+
+    def request():
+        with CaptureQueriesContext(replica) as replica_queries:
+            repository.get_product_by_id(uuid4())
+            repository.get_products_by_ids([uuid4()])
+            CategoryRepository().list_all_categories()
+        return replica_queries
+
+    assert len(in_request(request)) == 0
@@ -1,21 +1,83 @@
 from apps.shared.decorators.require_active_user import  require_active_user
+from apps.shared.cache import LocalMemoryCache
+from apps.users.activity import build_user_activity_cache, user_activity
+from apps.users.repository import UserRepository
+from apps.users.schema import UserActivationSchema
+from apps.users.service import UserService
 from types import SimpleNamespace
 from ninja.errors import HttpError
 from uuid import uuid4
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from django.conf import settings
+from django.test import override_settings
+import pytest
+
+
+@require_active_user
+def dummy_handler(request):
+    return "OK"
+
 
 class TestRequireActiveUser:
-    @patch("apps.shared.decorators.require_active_user.UserModel.objects.get")
-    def test_should_allow_active_user(self, mock_get):
+    @patch("apps.shared.decorators.require_active_user.user_activity.is_active")
+    def test_should_allow_active_user(self, mock_is_active):
         user_id = uuid4()
-        mock_get.return_value = SimpleNamespace(is_active=True)
+        mock_is_active.return_value = True
 
-        @require_active_user
-        def dummy_handler(request):
-            return "OK"
-
-        request = SimpleNamespace(user={"id": str(user_id), "is_active": True})
+        request = SimpleNamespace(auth={"user_id": str(user_id), "email": "email@test.com"})
 
         response = dummy_handler(request=request)
 
         assert response == "OK"
+        mock_is_active.assert_called_once_with(str(user_id))
+
+    @patch("apps.shared.decorators.require_active_user.user_activity.is_active")
+    def test_should_reject_inactive_user(self, mock_is_active):
+        mock_is_active.return_value = False
+
+        with pytest.raises(HttpError) as exc:
+            dummy_handler(request=SimpleNamespace(auth={"user_id": str(uuid4())}))
+        assert "User is inactive" in str(exc)
+
+    @patch("apps.shared.decorators.require_active_user.user_activity.is_active")
+    def test_should_reject_unknown_user(self, mock_is_active):
+        mock_is_active.return_value = None
+
+        with pytest.raises(HttpError) as exc:
+            dummy_handler(request=SimpleNamespace(auth={"user_id": str(uuid4())}))
+        assert "User does not exist" in str(exc)
+
+
+@pytest.mark.django_db
+class TestUserActivityCache:
+    def test_should_cache_activity_until_user_is_deactivated(self, django_assert_num_queries, monkeypatch):
+        monkeypatch.setattr(user_activity, "cache", LocalMemoryCache(max_size=100, ttl=60))
+        service = UserService(UserRepository(), MagicMock())
+        user = service.create_user("Test", "activity@test.com", "Abc@1234", "activityUser")
+        request = SimpleNamespace(auth={"user_id": str(user.id)})
+
+        with django_assert_num_queries(1):
+            assert dummy_handler(request) == "OK"
+            assert dummy_handler(request) == "OK"
+
+        service.user_activation(user.id, UserActivationSchema(status=False))
+
+        with pytest.raises(HttpError) as exc:
+            dummy_handler(request)
+        assert "User is inactive" in str(exc)
+
+        service.delete_user(user.id)
+
+        with pytest.raises(HttpError) as exc:
+            dummy_handler(request)
+        assert "User does not exist" in str(exc)
+
+
+class TestBuildUserActivityCache:
+    @pytest.mark.skipif(bool(settings.REDIS_URL), reason="REDIS_URL enables the shared cache")
+    def test_should_be_off_by_default_without_a_shared_cache(self):
+        assert build_user_activity_cache().cache is None
+
+    @override_settings(USER_ACTIVITY_CACHE_BACKEND="django")
+    def test_should_not_use_a_per_process_django_cache(self):
+        assert build_user_activity_cache().cache is None
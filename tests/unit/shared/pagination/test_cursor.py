@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from apps.shared.exceptions import UnprocessableEntityError
+from apps.shared.pagination import PageRequest, decode_cursor, encode_cursor, paginate_sequence
+
+
+def test_should_decode_encoded_cursor():
+    created_at = datetime(2025, 8, 19, 23, 50, 1, 123456, tzinfo=timezone.utc)
+    id = uuid4()
+
+    cursor = encode_cursor(created_at, id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(datetime.now(), uuid4())[:-4]])
+def test_should_raise_unprocessable_entity_error_for_invalid_cursor(cursor):
+    with pytest.raises(UnprocessableEntityError):
+        decode_cursor(cursor)
+
+
+def test_page_request_should_cap_limit_to_max_page_size(settings):
+    settings.PAGINATION_DEFAULT_PAGE_SIZE = 10
+    settings.PAGINATION_MAX_PAGE_SIZE = 20
+
+    assert PageRequest().limit == 10
+    assert PageRequest(limit=500).limit == 20
+
+
+def test_paginate_sequence_should_follow_cursor_like_paginate_queryset():
+    class Item:
+        def __init__(self, created_at, id):
+            self.created_at = created_at
+            self.id = id
+
+    items = [Item(datetime(2025, 1, day, tzinfo=timezone.utc), uuid4()) for day in range(5, 0, -1)]
+
+    first_page, cursor = paginate_sequence(items, PageRequest(limit=3))
+    second_page, last_cursor = paginate_sequence(items, PageRequest(cursor, limit=3))
+
+    assert [item.created_at.day for item in first_page] == [1, 2, 3]
+    assert [item.created_at.day for item in second_page] == [4, 5]
+    assert last_cursor is None
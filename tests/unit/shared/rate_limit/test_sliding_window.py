@@ -0,0 +1,37 @@
+import pytest
+from apps.shared.rate_limit import SlidingWindowRateLimiter
+from django.core.cache import cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [999_960.0]  # start of a 60s window
+    monkeypatch.setattr("apps.shared.rate_limit.limiter.time.time", lambda: now[0])
+    cache.clear()
+    yield now
+    cache.clear()
+
+
+def test_should_reject_hits_over_the_limit_within_the_window(clock):
+    limiter = SlidingWindowRateLimiter("test", limit=3, window=60)
+
+    assert [limiter.hit("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("5.6.7.8") is True
+    assert limiter.stats.as_dict() == {"allowed": 4, "rejected": 1}
+
+
+def test_previous_window_should_weigh_by_its_remaining_overlap(clock):
+    limiter = SlidingWindowRateLimiter("test", limit=3, window=60)
+    for _ in range(3):
+        limiter.hit("1.2.3.4")
+
+    # 15s into the next window, 3 * 0.75 of the previous hits still count.
+    clock[0] += 75
+    assert limiter.hit("1.2.3.4") is False
+
+    # 45s in, only 3 * 0.25 still count.
+    clock[0] += 30
+    assert limiter.hit("1.2.3.4") is True
+
+    clock[0] += 120
+    assert all(limiter.hit("1.2.3.4") for _ in range(3))
@@ -1,5 +1,8 @@
+import threading
+
 import pytest
-from apps.shared.value_objects.password import Password
+from apps.shared.exceptions import ServiceUnavailableError
+from apps.shared.value_objects.password import Password, PasswordHashingPolicy
 
 class TestPassword:
     def test_should_create_password_with_valid_format(self):
@@ -51,3 +54,36 @@ class TestPassword:
         password_from_hash = Password.from_hash(hash)
 
         assert password_from_hash.verify(valid_raw_password) is True
+
+    def test_should_hash_with_configured_cost_and_flag_other_costs_for_rehash(self, settings):
+        settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+        password = Password("Abc@1234")
+
+        assert password.hash.startswith("pbkdf2_sha256$1000$")
+        assert password.needs_rehash is False
+
+        settings.PASSWORD_PBKDF2_ITERATIONS = 2000
+        assert password.needs_rehash is True
+        assert password.verify("Abc@1234")
+
+
+class TestPasswordHashingPolicy:
+    def test_should_reject_callers_when_every_slot_is_busy(self):
+        policy = PasswordHashingPolicy(max_workers=1, wait_timeout=0.05)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_hash():
+            started.set()
+            release.wait()
+
+        worker = threading.Thread(target=policy._run, args=(slow_hash,))
+        worker.start()
+        started.wait()
+        try:
+            with pytest.raises(ServiceUnavailableError):
+                policy.hash("Abc@1234")
+        finally:
+            release.set()
+            worker.join()
+
+        assert policy.verify("Abc@1234", policy.hash("Abc@1234"))
@@ -43,4 +43,10 @@ class TestPrice:
 
         result = price1 - price2
 
-        assert result == value1 - value2
\ No newline at end of file
+        assert result == value1 - value2
+    def test_should_build_price_from_persistence(self):
+        price = Price.from_persistence(Decimal("9.90"))
+
+        assert price == Price("9.90")
+        assert Price.from_persistence(10).value == Decimal("10")
+        assert not hasattr(price, "__dict__")
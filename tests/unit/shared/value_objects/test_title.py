@@ -24,3 +24,10 @@ class TestTitle:
 
         assert "must be a string" in str(exc.value)
 
+
+    def test_should_build_title_from_persistence_without_validating(self):
+        title = Title.from_persistence("A")
+
+        assert title == Title.from_persistence("A")
+        assert title.value == "A"
+        assert not hasattr(title, "__dict__")
@@ -4,6 +4,7 @@ import pytest
 from apps.shared.value_objects import Email, Name, Password
 from apps.users.repository import UserRepository
 from apps.users.entity import User
+from apps.shared.pagination import PageRequest
 
 
 @pytest.fixture
@@ -97,3 +98,18 @@ class TestUserRepository:
         updated_user = repository.update_user(saved_user)
         assert updated_user.is_active is True
         assert updated_user.updated_at > last_updated_at
+
+    def test_should_list_users_page_by_page(self, create_user_and_repository):
+        _, repository, raw_password, saved_user = create_user_and_repository
+        other_users = [
+            repository.save(User(name=Name(f"User {letter}"), email=Email(f"user{letter}@mail.com"), password=Password(raw_password)))
+            for letter in "ab"
+        ]
+
+        first_page = repository.list_users(PageRequest(limit=2))
+        assert [user.id for user in first_page.items] == [saved_user.id, other_users[0].id]
+        assert first_page.next_cursor is not None
+
+        last_page = repository.list_users(PageRequest(first_page.next_cursor, limit=2))
+        assert [user.id for user in last_page.items] == [other_users[1].id]
+        assert last_page.next_cursor is None
@@ -1,5 +1,8 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
+from typing import Optional
 
 from jose import ExpiredSignatureError, jwt
 from ninja.errors import HttpError
@@ -8,20 +11,26 @@ from ninja.security import HttpBearer
 from django.contrib.auth import get_user_model
 
 # from apps.users.models import CustomUser
+from apps.shared.cache import LocalMemoryCache
 from core import settings
 
 CustomUser = get_user_model()
 
+# Verified claims keyed by token hash, so a token is only checked by python-jose once per TTL.
+token_claims_cache = LocalMemoryCache(
+    max_size=settings.JWT_CLAIMS_CACHE_MAX_SIZE, ttl=settings.JWT_CLAIMS_CACHE_TTL
+)
+
+
 class JWTAuth(HttpBearer):
-    def authenticate(self, request, token: str) -> bool:
+    def authenticate(self, request, token: str) -> Optional[dict]:
+        """Returns the token claims, which django-ninja stores on `request.auth`."""
         try:
-            user = jwt.decode(token, settings.SECRET_KEY)
-            request.user = user
-            return True
+            return decode_jwt_token(token)
         except ExpiredSignatureError as exception:
             raise HttpError(HTTPStatus.UNAUTHORIZED, str(exception)) from exception
         except Exception:  # pylint: disable=broad-exception-caught
-            return False
+            return None
 
 
 def generate_jwt_token(user: CustomUser, expiration_time_in_minutes: int = 600) -> str:
@@ -41,8 +50,19 @@ def generate_jwt_token(user: CustomUser, expiration_time_in_minutes: int = 600)
     return token
 
 
-def decode_jwt_token(token: str):
+def decode_jwt_token(token: str) -> dict:
     secret_key = settings.SECRET_KEY
     if "Bearer" in token:
         token = token.split(" ")[1]
-    return jwt.decode(token, secret_key, algorithms=["HS256"])
+
+    key = hashlib.sha256(token.encode()).hexdigest()
+    if (claims := token_claims_cache.get(key)) is not None:
+        # A cached token can outlive its own expiry when the cache TTL is longer.
+        if claims.get("exp", float("inf")) <= time.time():
+            token_claims_cache.delete_many([key])
+            raise ExpiredSignatureError("Signature has expired.")
+        return claims
+
+    claims = jwt.decode(token, secret_key, algorithms=["HS256"])
+    token_claims_cache.set(key, claims)
+    return claims